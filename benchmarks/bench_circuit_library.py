@@ -0,0 +1,60 @@
+"""Benchmark library circuit generation from 10 to 500 qubits.
+
+Compares the direct OpenQASM 3.0 emitters with building the same circuit in
+Qiskit and serializing it with `qasm3.dumps` (GHZ and QFT only, which is what the
+generator tools used to do), and reports the time to stream each family to a
+file.
+
+Run from a development install (see README.md). Usage:
+    python benchmarks/bench_circuit_library.py [--sizes 10 50 100 200 500] [--qiskit-max 200]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from qiskit import qasm3
+
+from jupyter_ai_braket.amazon_braket_mcp_server.circuit_library import CIRCUIT_FAMILIES, generate_qasm, write_qasm
+from jupyter_ai_braket.tests.test_circuit_library import build_ghz_circuit, build_qft_circuit
+
+QISKIT_BUILDERS = {'ghz': build_ghz_circuit, 'qft': build_qft_circuit}
+FAMILY_PARAMS = {'grover': {'iterations': 1}, 'random_clifford': {'seed': 0}}
+
+
+def timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 50, 100, 200, 500])
+    parser.add_argument('--qiskit-max', type=int, default=200, help='Largest size to build with Qiskit')
+    args = parser.parse_args()
+
+    header = f"{'family':<17}{'qubits':>7}{'operations':>12}{'KiB':>9}{'emit (ms)':>11}{'file (ms)':>11}{'qiskit (ms)':>13}"
+    print(header)
+    print('-' * len(header))
+    with tempfile.TemporaryDirectory() as tmp:
+        for family in CIRCUIT_FAMILIES:
+            if family == 'bell':
+                continue
+            params = FAMILY_PARAMS.get(family, {})
+            for size in args.sizes:
+                (_, summary), emit_ms = timed(generate_qasm, family, size, **params)
+                _, file_ms = timed(write_qasm, os.path.join(tmp, f'{family}_{size}.qasm'), family, size, **params)
+                qiskit = '-'
+                if family in QISKIT_BUILDERS and size <= args.qiskit_max:
+                    _, qiskit_ms = timed(lambda: qasm3.dumps(QISKIT_BUILDERS[family](size)))
+                    qiskit = f"{qiskit_ms:.1f}"
+                print(
+                    f"{family:<17}{size:>7}{summary.num_operations:>12}{summary.size_bytes / 1024:>9.0f}"
+                    f"{emit_ms:>11.1f}{file_ms:>11.1f}{qiskit:>13}"
+                )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark the circuit optimization pipeline on the library circuit families.
+
+Reports gate count, two-qubit gate count and depth before and after
+optimization for every family of the circuit library, in two forms:
+
+- as generated: the OpenQASM 3.0 program the library tools return
+- native: the same circuit translated to a superconducting native basis
+  (rz, sx, x, cx) without transpiler optimization, which is what basis
+  translation hands to the pipeline when a circuit is mapped to a QPU
+
+Usage (from the repository root):
+    python benchmarks/bench_optimization.py [--sizes 5 10 20] [--families qft grover]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Runnable from a checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qiskit import qasm3, transpile  # noqa: E402
+
+from jupyter_ai_braket.amazon_braket_mcp_server.circuit_library import CIRCUIT_FAMILIES, generate_qasm  # noqa: E402
+from jupyter_ai_braket.amazon_braket_mcp_server.optimization import optimize_circuit  # noqa: E402
+
+NATIVE_BASIS = ['rz', 'sx', 'x', 'cx']
+FAMILY_PARAMS = {'grover': {'iterations': 1}, 'random_clifford': {'seed': 0}}
+
+
+def variants(family, size):
+    """Yield the benchmarked forms of one library circuit."""
+    program, _ = generate_qasm(family, size, **FAMILY_PARAMS.get(family, {}))
+    circuit = qasm3.loads(program)
+    yield family, circuit
+    yield f"{family}-native", transpile(circuit, basis_gates=NATIVE_BASIS, optimization_level=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[5, 10, 20])
+    parser.add_argument('--families', nargs='+', default=[f for f in CIRCUIT_FAMILIES if f != 'bell'])
+    args = parser.parse_args()
+
+    header = f"{'circuit':<24}{'qubits':>7}{'gates':>14}{'2q gates':>14}{'depth':>14}{'time (ms)':>11}"
+    print(header)
+    print('-' * len(header))
+    total_before = total_after = 0
+    for family in args.families:
+        for size in args.sizes:
+            for variant, circuit in variants(family, size):
+                started = time.perf_counter()
+                _, report = optimize_circuit(circuit)
+                elapsed = (time.perf_counter() - started) * 1000
+                before, after = report.before, report.after
+                total_before += before.gate_count
+                total_after += after.gate_count
+                print(
+                    f"{variant:<24}{size:>7}"
+                    f"{before.gate_count:>7}->{after.gate_count:<6}"
+                    f"{before.two_qubit_gate_count:>7}->{after.two_qubit_gate_count:<6}"
+                    f"{before.depth:>7}->{after.depth:<6}"
+                    f"{elapsed:>11.1f}"
+                )
+    print('-' * len(header))
+    print(f"total gates {total_before} -> {total_after} ({1 - total_after / max(total_before, 1):.0%} fewer)")
+
+
+if __name__ == '__main__':
+    main()
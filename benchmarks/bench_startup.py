@@ -0,0 +1,71 @@
+"""Benchmark MCP server cold start.
+
+Starts the server over stdio as the persona does and reports the time until it
+answers `initialize` and `list_tools`, and the time of a first tool call that
+needs Qiskit (`create_bell_pair_circuit`), with and without the background
+warm-up. The first call is made after an idle pause, like a user typing their
+first question after the persona has loaded its tools. Also reports the bare import time of the server module.
+
+Run from a development install (see README.md). Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--idle 3]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+SERVER_MODULE = 'jupyter_ai_braket.amazon_braket_mcp_server.server'
+
+
+def import_seconds():
+    code = f'import time; t = time.perf_counter(); import {SERVER_MODULE}; print(time.perf_counter() - t)'
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+async def cold_start(warm_up, idle):
+    env = {**os.environ, 'BRAKET_MCP_WARMUP': '1' if warm_up else '0'}
+    params = StdioServerParameters(command=sys.executable, args=['-m', SERVER_MODULE], env=env)
+    started = time.perf_counter()
+    with open(os.devnull, 'w') as devnull:
+        async with stdio_client(params, errlog=devnull) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                initialized = time.perf_counter()
+                await session.list_tools()
+                listed = time.perf_counter()
+                await asyncio.sleep(idle)
+                first_call = time.perf_counter()
+                await session.call_tool('create_bell_pair_circuit', {'diagram_mode': 'summary'})
+                called = time.perf_counter()
+    return initialized - started, listed - started, called - first_call
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--idle', type=float, default=3, help='Seconds between list_tools and the first tool call')
+    args = parser.parse_args()
+
+    imports = [import_seconds() for _ in range(args.runs)]
+    print(f"import {SERVER_MODULE}: {statistics.median(imports) * 1000:.0f} ms (median of {args.runs})")
+    print()
+
+    header = f"{'warm-up':<10}{'initialize (ms)':>17}{'list_tools (ms)':>17}{'first tool (ms)':>17}"
+    print(header)
+    print('-' * len(header))
+    for warm_up in (False, True):
+        runs = [asyncio.run(cold_start(warm_up, args.idle)) for _ in range(args.runs)]
+        initialize, list_tools, first_tool = (statistics.median(column) * 1000 for column in zip(*runs))
+        print(f"{'on' if warm_up else 'off':<10}{initialize:>17.0f}{list_tools:>17.0f}{first_tool:>17.0f}")
+
+
+if __name__ == '__main__':
+    main()
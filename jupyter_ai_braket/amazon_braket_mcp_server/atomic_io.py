@@ -0,0 +1,91 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Atomic file writes.
+
+Files written here are replaced in one rename, so concurrent readers and other
+server processes see either the old or the new contents, never a partial write.
+Replaced files keep their permissions, and new files get the permissions a
+plain `open` would give them under the process umask.
+"""
+
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Optional
+
+
+def _read_umask() -> int:
+    # os.umask can only be read by setting it; this runs once, at import
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _read_umask()
+
+
+def _target_mode(path: Path) -> int:
+    """Permissions for a file written to `path`."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+@contextmanager
+def atomic_open(path: Path, mode: str = 'w', encoding: Optional[str] = None) -> Iterator[IO]:
+    """Open a temporary file that replaces `path` when the block exits without error.
+
+    Args:
+        path: Destination file
+        mode: 'w' for text or 'wb' for binary
+        encoding: Text encoding (text mode only)
+
+    Yields:
+        IO: The temporary file to write to
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+        # mkstemp creates files readable by the owner only
+        os.chmod(tmp_path, _target_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write a text file so that readers see either the old or the new contents.
+
+    Args:
+        path: Destination file
+        text: File contents
+    """
+    atomic_write_bytes(path, text.encode('utf-8'))
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write a file so that readers see either the old or the new contents.
+
+    Args:
+        path: Destination file
+        data: File contents
+    """
+    with atomic_open(path, 'wb') as f:
+        f.write(data)
@@ -0,0 +1,133 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+
+"""Parallel validation of many OpenQASM 3.0 programs.
+
+Parsing with `qasm3.loads` is CPU bound and holds the GIL, so batches are spread
+over a process pool. Workers read files themselves, so only paths and compact
+results cross process boundaries. The pool is created on first use and kept for
+later batches, because each worker pays the Qiskit import once.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from .models import QasmValidationResult
+
+
+# Batches up to this size are parsed in the calling process
+IN_PROCESS_MAX_PROGRAMS = 4
+
+# Errors are cut to this length to keep results compact (in characters)
+MAX_ERROR_CHARS = 300
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _short_error(error: Exception) -> str:
+    message = f"{type(error).__name__}: {error}".strip()
+    return message if len(message) <= MAX_ERROR_CHARS else message[:MAX_ERROR_CHARS - 3] + '...'
+
+
+def _validate(item: Tuple[str, Optional[str], Optional[str]]) -> QasmValidationResult:
+    """Parse one program, given as (name, program text, file path)."""
+    from qiskit import qasm3
+
+    name, program, path = item
+    try:
+        if program is None:
+            with open(path, encoding='utf-8') as f:
+                program = f.read()
+        circuit = qasm3.loads(program)
+        return QasmValidationResult(
+            name=name,
+            valid=True,
+            num_qubits=circuit.num_qubits,
+            num_operations=len(circuit.data),
+        )
+    except Exception as e:
+        return QasmValidationResult(name=name, valid=False, error=_short_error(e))
+
+
+def _get_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Get the shared process pool, recreating it if a different size is requested."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != max_workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            # Spawn rather than fork: the server process runs threads and an event loop
+            _pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+            _pool_workers = max_workers
+        return _pool
+
+
+def _run(items: List[Tuple[str, Optional[str], Optional[str]]], max_workers: Optional[int]) -> List[QasmValidationResult]:
+    if len(items) <= IN_PROCESS_MAX_PROGRAMS:
+        return [_validate(item) for item in items]
+
+    workers = min(max_workers or os.cpu_count() or 1, len(items))
+    chunksize = max(1, len(items) // (workers * 4))
+    return list(_get_pool(workers).map(_validate, items, chunksize=chunksize))
+
+
+def validate_qasm_programs(programs: Sequence[str], max_workers: Optional[int] = None) -> List[QasmValidationResult]:
+    """Validate OpenQASM 3.0 programs in parallel.
+
+    Args:
+        programs: Program texts
+        max_workers: Maximum number of worker processes (defaults to the CPU count)
+
+    Returns:
+        List[QasmValidationResult]: One result per program, in input order, named
+        by position (e.g. 'program[3]')
+    """
+    items = [(f'program[{index}]', program, None) for index, program in enumerate(programs)]
+    return _run(items, max_workers)
+
+
+def validate_qasm_files(
+    pattern: str,
+    root: str,
+    max_workers: Optional[int] = None,
+) -> List[QasmValidationResult]:
+    """Validate the OpenQASM 3.0 files matching a glob pattern under a directory.
+
+    Args:
+        pattern: Glob pattern relative to `root`, e.g. '**/*.qasm'
+        root: Directory the pattern is resolved against
+        max_workers: Maximum number of worker processes (defaults to the CPU count)
+
+    Returns:
+        List[QasmValidationResult]: One result per file, sorted by path, named by
+        path relative to `root`
+
+    Raises:
+        ValueError: If the pattern is absolute or leaves `root`
+    """
+    if os.path.isabs(pattern) or '..' in Path(pattern).parts:
+        raise ValueError(f"Pattern must be relative to the workspace and stay inside it, got '{pattern}'")
+
+    root_path = Path(root).resolve()
+    # Symlinks may point outside the root; skip those
+    paths = sorted(
+        path for path in root_path.glob(pattern)
+        if path.is_file() and root_path in path.resolve().parents
+    )
+    items = [(str(path.relative_to(root_path)), None, str(path)) for path in paths]
+    return _run(items, max_workers)
@@ -17,25 +17,28 @@ and retrieving results.
 
 The module implements classes for managing Braket connections and executing quantum tasks
 using both Qiskit and Amazon Braket SDK.
+
+The Braket SDK and the Qiskit Braket provider take seconds to import, so they are
+loaded on first use rather than with this module.
 """
 
 import io
 import json
 import base64
 import os
+import threading
+import time
+import uuid
 import boto3
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union, Any, Tuple
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
-from braket.aws import AwsDevice, AwsQuantumTask
-from braket.circuits import Circuit as BraketCircuit
-from braket.tasks import QuantumTask
-from braket.devices import LocalSimulator
+from botocore.config import Config
 
 from qiskit import QuantumCircuit as QiskitCircuit
-from qiskit.visualization import circuit_drawer
-from qiskit_braket_provider import BraketProvider
 
 from loguru import logger
 
@@ -46,14 +49,43 @@ from .models import (
     TaskStatus,
     DeviceInfo,
     DeviceType,
+    DeviceRanking,
+    OptimizationConfig,
+    OptimizationReport,
+    ShotChunk,
+    TaskProgress,
 )
 from .exceptions import (
     CircuitCreationError,
     TaskExecutionError,
     TaskResultError,
     DeviceError,
+    ThrottlingError,
 )
+from .deduplication import SubmissionDeduplicator
+from .device_selection import historical_turnaround, rank_device, sort_rankings, to_braket_gate_names
+from .hashing import braket_circuit_hash, circuit_hash
+from .optimization import optimize_circuit
+from .rate_limiting import Priority, RateLimiter, get_shared_rate_limiter
+from .shot_splitting import TaskResultMerger, plan_shot_chunks
+from .tracing import get_tracer, traced
+from .transpilation import TranspilationCache, transpile_for_device
 from .visualization import VisualizationUtils
+from .visualization.plot_renderer import get_plot_renderer
+
+if TYPE_CHECKING:
+    from braket.aws import AwsDevice, AwsSession
+    from braket.circuits import Circuit as BraketCircuit
+    from qiskit_braket_provider import BraketProvider
+
+# How long cached device capabilities and queue information stay fresh (seconds)
+DEVICE_CAPABILITIES_TTL_SECONDS = 3600
+QUEUE_INFO_TTL_SECONDS = 30
+
+# Historical turnaround is the median of our recent completed tasks on a device
+TURNAROUND_TTL_SECONDS = 600
+TURNAROUND_SAMPLE_SIZE = 20
+TURNAROUND_LOOKBACK_DAYS = 30
 
 
 class BraketService:
@@ -76,12 +108,29 @@ class BraketService:
         'eu-north-1'
     }
 
-    def __init__(self, region_name: Optional[str] = None, workspace_dir: Optional[str] = None):
+    def __init__(
+        self,
+        region_name: Optional[str] = None,
+        workspace_dir: Optional[str] = None,
+        optimization_config: Optional[OptimizationConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        dedup_window_seconds: Optional[float] = None,
+        boto_session: Optional[boto3.Session] = None,
+    ):
         """Initialize a connection to Amazon Braket service.
 
         Args:
             region_name: AWS region name. If not provided, uses the default region from AWS configuration.
             workspace_dir: Directory to save visualization files. If None, uses temp directory.
+            optimization_config: Optimization passes to run on circuits before submission.
+                If None, circuits are submitted without optimization.
+            rate_limiter: Limiter for Braket API calls. Defaults to the limiter shared
+                by all services in the process.
+            dedup_window_seconds: Reuse the task of an identical submission (same
+                circuit, device and shots) made within this many seconds. If None,
+                every submission creates a new task.
+            boto_session: Session holding the AWS credentials to use. If None, the
+                default credential chain is used.
             
         Raises:
             ValueError: If the specified region doesn't support Amazon Braket
@@ -100,21 +149,48 @@ class BraketService:
         # Get the actual region being used
         if region_name is None:
             # Try to get region from boto3 session
-            session = boto3.Session()
+            session = boto_session or boto3.Session()
             region_name = session.region_name
             
         self.region_name = region_name
+        self.optimization_config = optimization_config
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
         
         # Validate region support
         if region_name and region_name not in self.SUPPORTED_REGIONS:
             logger.warning(f'Region {region_name} may not support Amazon Braket. Supported regions: {sorted(self.SUPPORTED_REGIONS)}')
             
-        try:
-            self.braket_client = boto3.client('braket', region_name=region_name)
-            self.provider = BraketProvider()
+        # Cached GetDevice responses and task turnaround, keyed by device ARN
+        self._device_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._turnaround_cache: Dict[str, Tuple[float, Optional[float]]] = {}
+        self._device_cache_lock = threading.Lock()
+
+        # Braket SDK objects, created on first use
+        self._boto_session = boto_session
+        self._aws_session: Optional['AwsSession'] = None
+        self._provider: Optional['BraketProvider'] = None
+        self._sdk_lock = threading.Lock()
             
+        try:
+            # botocore retries transient errors, including a few quick throttling
+            # retries; the rate limiter backs off further if those run out
+            self.braket_client = self.rate_limiter.instrument_client((boto_session or boto3).client(
+                'braket',
+                region_name=region_name,
+                config=Config(retries={'mode': 'standard'}),
+            ))
+            get_tracer().instrument_client(self.braket_client)
+
             # Initialize visualization utilities
             self.viz_utils = VisualizationUtils(workspace_dir)
+            
+            # Persistent caches live next to the visualizations
+            self.cache_dir = Path(self.viz_utils.workspace_dir) / '.braket_cache'
+            self.transpilation_cache = TranspilationCache(str(self.cache_dir / 'transpile'))
+            self.deduplicator = (
+                SubmissionDeduplicator(dedup_window_seconds, str(self.cache_dir / 'dedup'))
+                if dedup_window_seconds else None
+            )
             logger.debug(f'Initialized BraketService with region: {region_name}')
             
             # Test basic connectivity and permissions
@@ -124,6 +200,28 @@ class BraketService:
             logger.error(f'Failed to initialize BraketService: {str(e)}')
             raise
 
+    @property
+    def aws_session(self) -> 'AwsSession':
+        """Braket SDK session sharing this service's rate-limited client."""
+        if self._aws_session is None:
+            with self._sdk_lock:
+                if self._aws_session is None:
+                    from braket.aws import AwsSession
+
+                    self._aws_session = AwsSession(boto_session=self._boto_session, braket_client=self.braket_client)
+        return self._aws_session
+
+    @property
+    def provider(self) -> 'BraketProvider':
+        """Qiskit Braket provider used to convert circuits."""
+        if self._provider is None:
+            with self._sdk_lock:
+                if self._provider is None:
+                    from qiskit_braket_provider import BraketProvider
+
+                    self._provider = BraketProvider()
+        return self._provider
+
     def _validate_service_access(self) -> None:
         """Validate that we can access Amazon Braket service.
         
@@ -136,7 +234,7 @@ class BraketService:
         try:
             # Try to list devices as a basic connectivity test
             # This requires minimal permissions and validates both connectivity and auth
-            response = self.braket_client.search_devices(maxResults=1)
+            response = self.rate_limiter.call(self.braket_client.search_devices, maxResults=1)
             logger.debug("Successfully validated Amazon Braket service access")
         except Exception as e:
             error_msg = f"Failed to validate Amazon Braket service access: {str(e)}"
@@ -206,7 +304,7 @@ class BraketService:
             logger.exception(f"Error creating Qiskit circuit: {str(e)}")
             raise CircuitCreationError(f"Error creating Qiskit circuit: {str(e)}")
 
-    def convert_to_braket_circuit(self, qiskit_circuit: QiskitCircuit) -> BraketCircuit:
+    def convert_to_braket_circuit(self, qiskit_circuit: QiskitCircuit) -> 'BraketCircuit':
         """Convert a Qiskit circuit to a Braket circuit.
 
         Args:
@@ -218,6 +316,8 @@ class BraketService:
         Raises:
             CircuitCreationError: If there is an error converting the circuit
         """
+        from braket.circuits import Circuit as BraketCircuit
+
         try:
             # Use the Qiskit Braket provider to convert the circuit
             try:
@@ -259,13 +359,16 @@ class BraketService:
             logger.exception(f"Error converting to Braket circuit: {str(e)}")
             raise CircuitCreationError(f"Error converting to Braket circuit: {str(e)}")
 
+    @traced('braket.run_quantum_task')
     def run_quantum_task(
         self, 
-        circuit: Union[QiskitCircuit, BraketCircuit, QuantumCircuit],
+        circuit: Union[QiskitCircuit, 'BraketCircuit', QuantumCircuit],
         device_arn: str,
         shots: int = 1000,
         s3_bucket: Optional[str] = None,
         s3_prefix: Optional[str] = None,
+        transpile: Optional[bool] = None,
+        force_new: bool = False,
     ) -> str:
         """Run a quantum task on an Amazon Braket device.
 
@@ -275,41 +378,354 @@ class BraketService:
             shots: Number of shots to run
             s3_bucket: S3 bucket for storing results (optional)
             s3_prefix: S3 prefix for storing results (optional)
+            transpile: Whether to map the circuit to the device's native gates and
+                connectivity first. Defaults to True for QPUs. Braket circuits are
+                submitted as given.
+            force_new: Create a new task even if deduplication would reuse an
+                identical recent submission
 
         Returns:
-            str: Task ID of the created quantum task
+            str: Task ID of the created quantum task, or of the reused task if an
+            identical submission was made within the deduplication window
 
         Raises:
             TaskExecutionError: If there is an error executing the task
         """
+        from braket.aws import AwsDevice
+
         try:
-            # Convert circuit if needed
-            braket_circuit = None
+            fingerprint = self._circuit_fingerprint(circuit) if self.deduplicator else None
+            device = self.rate_limiter.call(AwsDevice, device_arn, aws_session=self.aws_session)
+            return self._submit_task(
+                device,
+                lambda: self._prepare_circuit(circuit, device_arn, transpile),
+                shots,
+                s3_bucket,
+                s3_prefix,
+                fingerprint,
+                force_new,
+            )
+        except ThrottlingError:
+            raise
+        except Exception as e:
+            logger.exception(f"Error running quantum task: {str(e)}")
+            raise TaskExecutionError(f"Error running quantum task: {str(e)}")
+
+    def _prepare_circuit(
+        self,
+        circuit: Union[QiskitCircuit, 'BraketCircuit', QuantumCircuit],
+        device_arn: str,
+        transpile: Optional[bool] = None,
+    ) -> 'BraketCircuit':
+        """Optimize a circuit, map it to a device and convert it for submission.
+
+        Args:
+            circuit: Quantum circuit (Qiskit, Braket, or circuit definition)
+            device_arn: ARN of the device the circuit will run on
+            transpile: Whether to map the circuit to the device's native gates and
+                connectivity. Defaults to True for QPUs. Braket circuits are used
+                as given.
+
+        Returns:
+            BraketCircuit: Circuit ready for submission
+        """
+        from braket.circuits import Circuit as BraketCircuit
+
+        # Reduce the gate count before mapping to the device
+        if self.optimization_config and not isinstance(circuit, BraketCircuit):
             if isinstance(circuit, QuantumCircuit):
-                qiskit_circuit = self.create_qiskit_circuit(circuit)
-                braket_circuit = self.convert_to_braket_circuit(qiskit_circuit)
-            elif isinstance(circuit, QiskitCircuit):
-                braket_circuit = self.convert_to_braket_circuit(circuit)
-            elif isinstance(circuit, BraketCircuit):
-                braket_circuit = circuit
-            else:
-                raise TaskExecutionError(f"Unsupported circuit type: {type(circuit)}")
-            
-            # Create the device
-            device = AwsDevice(device_arn)
-            
-            # Run the task
-            task = device.run(
-                braket_circuit,
+                circuit = self.create_qiskit_circuit(circuit)
+            circuit, report = self.optimize_circuit(circuit)
+            logger.info(
+                f"Optimized circuit from {report.before.gate_count} to {report.after.gate_count} gates "
+                f"(depth {report.before.depth} to {report.after.depth})"
+            )
+
+        # Map the circuit to the device, reusing cached routing when possible
+        if transpile is None:
+            transpile = self.get_device_info(device_arn).device_type == DeviceType.QPU
+        if transpile and not isinstance(circuit, BraketCircuit):
+            if isinstance(circuit, QuantumCircuit):
+                circuit = self.create_qiskit_circuit(circuit)
+            circuit, _ = self.transpile_for_device(circuit, device_arn)
+
+        return self._to_braket_circuit(circuit)
+
+    def _submit_task(
+        self,
+        device: 'AwsDevice',
+        prepare: Callable[[], 'BraketCircuit'],
+        shots: int,
+        s3_bucket: Optional[str] = None,
+        s3_prefix: Optional[str] = None,
+        fingerprint: Optional[str] = None,
+        force_new: bool = False,
+    ) -> str:
+        """Submit a circuit, reusing the task of an identical recent or in-flight submission.
+
+        Only the `device.run` call is rate-limited.
+
+        Args:
+            device: Device to run on
+            prepare: Returns the circuit to submit. Not called if a task is reused.
+            shots: Number of shots to run
+            s3_bucket: S3 bucket for storing results (optional)
+            s3_prefix: S3 prefix for storing results (optional)
+            fingerprint: Fingerprint of the circuit as given by the caller. If
+                None, the submission is not deduplicated.
+            force_new: Create a new task even if an identical one could be reused
+
+        Returns:
+            str: Task ID of the created or reused quantum task
+        """
+        dedup_key = None
+        if self.deduplicator and fingerprint:
+            submission_key = self.deduplicator.submission_key(fingerprint, device.arn, shots)
+            existing_task_id = self._reserve_submission(submission_key, force_new)
+            if existing_task_id:
+                return existing_task_id
+            dedup_key = submission_key
+
+        try:
+            task = self.rate_limiter.call(
+                device.run,
+                prepare(),
                 shots=shots,
                 s3_destination_folder=(s3_bucket, s3_prefix) if s3_bucket and s3_prefix else None,
             )
-            
+            if dedup_key:
+                self.deduplicator.record_submission(dedup_key, task.id, device.arn, shots)
+                dedup_key = None
             return task.id
+        finally:
+            # Let waiting identical submissions go ahead if this one failed
+            if dedup_key:
+                self.deduplicator.release(dedup_key)
+
+    def _reserve_submission(self, dedup_key: str, force_new: bool = False) -> Optional[str]:
+        """Reuse the task of an identical submission, or reserve the key to submit one.
+
+        Args:
+            dedup_key: Content address of the submission
+            force_new: Reserve the key even if a reusable task exists
+
+        Returns:
+            Optional[str]: ID of the reused task, or None if the caller must submit
+            and then record or release the key
+        """
+        while True:
+            existing_task_id = self.deduplicator.reserve(dedup_key, reuse=not force_new)
+            if existing_task_id is None:
+                return None
+            # Only the status is needed, so do not download the results
+            if self.get_task_progress(existing_task_id).status in (TaskStatus.FAILED, TaskStatus.CANCELLED):
+                self.deduplicator.forget(dedup_key)
+                continue
+            self.deduplicator.record_hit(dedup_key)
+            return existing_task_id
+
+    def _circuit_fingerprint(self, circuit: Union[QiskitCircuit, 'BraketCircuit', QuantumCircuit]) -> str:
+        """Hash a circuit as submitted, before optimization and transpilation.
+
+        Args:
+            circuit: Quantum circuit (Qiskit, Braket, or circuit definition)
+
+        Returns:
+            str: Hex SHA-256 digest of the circuit's OpenQASM 3.0 serialization
+        """
+        from braket.circuits import Circuit as BraketCircuit
+
+        if isinstance(circuit, BraketCircuit):
+            return 'braket:' + braket_circuit_hash(circuit)
+        if isinstance(circuit, QuantumCircuit):
+            circuit = self.create_qiskit_circuit(circuit)
+        return 'qiskit:' + circuit_hash(circuit)
+
+    def _to_braket_circuit(self, circuit: Union[QiskitCircuit, 'BraketCircuit', QuantumCircuit]) -> 'BraketCircuit':
+        """Convert any supported circuit representation to a Braket circuit.
+
+        Args:
+            circuit: Quantum circuit (Qiskit, Braket, or circuit definition)
+
+        Returns:
+            BraketCircuit: Circuit ready for submission
+
+        Raises:
+            TaskExecutionError: If the circuit type is not supported
+        """
+        from braket.circuits import Circuit as BraketCircuit
+
+        if isinstance(circuit, QuantumCircuit):
+            qiskit_circuit = self.create_qiskit_circuit(circuit)
+            return self.convert_to_braket_circuit(qiskit_circuit)
+        elif isinstance(circuit, QiskitCircuit):
+            return self.convert_to_braket_circuit(circuit)
+        elif isinstance(circuit, BraketCircuit):
+            return circuit
+        else:
+            raise TaskExecutionError(f"Unsupported circuit type: {type(circuit)}")
+
+    @traced('braket.optimize_circuit')
+    def optimize_circuit(
+        self,
+        circuit: QiskitCircuit,
+        config: Optional[OptimizationConfig] = None,
+    ) -> Tuple[QiskitCircuit, OptimizationReport]:
+        """Reduce the gate count and depth of a circuit.
+
+        Args:
+            circuit: Qiskit quantum circuit
+            config: Passes to run. Defaults to the service's optimization config,
+                or all passes if the service has none.
+
+        Returns:
+            Tuple[QiskitCircuit, OptimizationReport]: The optimized circuit and a
+            report of gate counts and depth before and after
+
+        Raises:
+            CircuitCreationError: If the circuit cannot be optimized
+        """
+        try:
+            return optimize_circuit(circuit, config or self.optimization_config)
         except Exception as e:
-            logger.exception(f"Error running quantum task: {str(e)}")
-            raise TaskExecutionError(f"Error running quantum task: {str(e)}")
+            logger.exception(f"Error optimizing circuit: {str(e)}")
+            raise CircuitCreationError(f"Error optimizing circuit: {str(e)}")
+
+    @traced('braket.transpile_for_device')
+    def transpile_for_device(self, circuit: QiskitCircuit, device_arn: str) -> Tuple[QiskitCircuit, bool]:
+        """Transpile a circuit to a device's native gates and connectivity.
+
+        Results are cached by (circuit hash, device ARN, capabilities version) in
+        memory and under the workspace's `.braket_cache/transpile` directory.
+
+        Args:
+            circuit: Qiskit quantum circuit
+            device_arn: ARN of the target device
+
+        Returns:
+            Tuple[QiskitCircuit, bool]: The transpiled circuit, and whether it came
+            from the cache
+
+        Raises:
+            CircuitCreationError: If the circuit cannot be transpiled for the device
+        """
+        try:
+            document = self._get_device_document(device_arn)
+            return transpile_for_device(circuit, document, self.transpilation_cache)
+        except Exception as e:
+            logger.exception(f"Error transpiling circuit: {str(e)}")
+            raise CircuitCreationError(f"Error transpiling circuit for {device_arn}: {str(e)}")
+
+    @traced('braket.run_split_shot_task')
+    def run_split_shot_task(
+        self,
+        circuit: Union[QiskitCircuit, 'BraketCircuit', QuantumCircuit],
+        device_arns: Union[str, List[str]],
+        shots: int,
+        s3_bucket: Optional[str] = None,
+        s3_prefix: Optional[str] = None,
+        max_concurrency: int = 4,
+        transpile: Optional[bool] = None,
+        force_new: bool = False,
+    ) -> TaskResult:
+        """Run a large shot budget as concurrent chunks and merge the results.
+
+        The shot budget is split into chunks no larger than each device's
+        ``max_shots``. Chunks are distributed round-robin over the given devices,
+        which should be equivalent (same circuit semantics and qubit layout).
+        Counts and measurements are merged as each chunk finishes. The circuit
+        is optimized, transpiled and deduplicated as in `run_quantum_task`.
+
+        Args:
+            circuit: Quantum circuit to run (Qiskit, Braket, or circuit definition)
+            device_arns: ARN or list of ARNs of equivalent devices to run on
+            shots: Total number of shots to run
+            s3_bucket: S3 bucket for storing results (optional)
+            s3_prefix: S3 prefix for storing results (optional)
+            max_concurrency: Maximum number of chunks in flight at once
+            transpile: Whether to map the circuit to each device's native gates and
+                connectivity first. Defaults to True for QPUs.
+            force_new: Create new tasks even if deduplication would reuse the
+                chunks of an identical recent split submission
+
+        Returns:
+            TaskResult: Merged result of all chunks. The status is FAILED if any
+            chunk failed; counts from successful chunks are still included.
+
+        Raises:
+            TaskExecutionError: If the execution cannot be planned or submitted
+        """
+        from braket.aws import AwsDevice, AwsQuantumTask
 
+        if isinstance(device_arns, str):
+            device_arns = [device_arns]
+
+        try:
+            fingerprint = self._circuit_fingerprint(circuit) if self.deduplicator else None
+            max_shots_by_device = {
+                device_arn: self.get_device_info(device_arn).max_shots
+                for device_arn in dict.fromkeys(device_arns)
+            }
+            chunks = plan_shot_chunks(shots, max_shots_by_device)
+            devices = {
+                device_arn: self.rate_limiter.call(AwsDevice, device_arn, aws_session=self.aws_session)
+                for device_arn in max_shots_by_device
+            }
+            # Prepared once per device, as run_quantum_task would for each chunk
+            braket_circuits = {
+                device_arn: self._prepare_circuit(circuit, device_arn, transpile)
+                for device_arn in max_shots_by_device
+            }
+            logger.info(f"Splitting {shots} shots into {len(chunks)} chunks across {len(devices)} device(s)")
+        except ThrottlingError:
+            raise
+        except Exception as e:
+            logger.exception(f"Error planning split shot task: {str(e)}")
+            raise TaskExecutionError(f"Error planning split shot task: {str(e)}")
+
+        def run_chunk(chunk: ShotChunk) -> TaskResult:
+            # Chunk submission yields to interactive requests
+            with self.rate_limiter.lane(Priority.BULK):
+                task_id = self._submit_task(
+                    devices[chunk.device_arn],
+                    lambda: braket_circuits[chunk.device_arn],
+                    chunk.shots,
+                    s3_bucket,
+                    s3_prefix,
+                    # Chunks of one split must not reuse each other's tasks
+                    f"{fingerprint}|chunk {chunk.index}/{len(chunks)}" if fingerprint else None,
+                    force_new,
+                )
+            logger.info(f"Submitted chunk {chunk.index} ({chunk.shots} shots) as task {task_id}")
+            # Waiting for the task is not rate-limited, so it holds no capacity while the task runs
+            result = AwsQuantumTask(task_id, aws_session=self.aws_session).result()
+            if result is None:
+                return TaskResult(task_id=task_id, status=TaskStatus.FAILED, device=chunk.device_arn, shots=0)
+            return TaskResult(
+                task_id=task_id,
+                status=TaskStatus.COMPLETED,
+                measurements=result.measurements.tolist() if hasattr(result, 'measurements') else None,
+                counts=dict(result.measurement_counts) if hasattr(result, 'measurement_counts') else None,
+                device=chunk.device_arn,
+                shots=chunk.shots,
+            )
+
+        merger = TaskResultMerger(f"split-{uuid.uuid4().hex}", chunks)
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            futures = {executor.submit(run_chunk, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    merger.add(chunk, future.result())
+                except Exception as e:
+                    logger.error(f"Chunk {chunk.index} on {chunk.device_arn} failed: {str(e)}")
+                    merger.add_failure(chunk, str(e))
+                logger.debug(f"Merged {merger.completed_chunks}/{len(chunks)} chunks")
+
+        return merger.result(execution_time=time.monotonic() - started)
+
+    @traced('braket.get_task_result')
     def get_task_result(self, task_id: str) -> TaskResult:
         """Get the result of a quantum task.
 
@@ -322,12 +738,20 @@ class BraketService:
         Raises:
             TaskResultError: If there is an error retrieving the task result
         """
+        from braket.aws import AwsQuantumTask
+
         try:
+            # Completed results of deduplicated tasks never change
+            if self.deduplicator:
+                cached_result = self.deduplicator.get_cached_result(task_id)
+                if cached_result:
+                    return cached_result
+            
             # Retrieve the task
-            task = AwsQuantumTask(task_id)
+            task = AwsQuantumTask(task_id, aws_session=self.aws_session)
             
             # Get the task metadata
-            metadata = task.metadata()
+            metadata = self.rate_limiter.call(task.metadata)
             
             # Determine the task status
             status_map = {
@@ -346,7 +770,9 @@ class BraketService:
             execution_time = None
             
             if status == TaskStatus.COMPLETED:
-                result = task.result()
+                # Downloads the results from S3
+                with get_tracer().span('braket.download_result', task_id=task_id):
+                    result = self.rate_limiter.call(task.result)
                 measurements = result.measurements.tolist() if hasattr(result, 'measurements') else None
                 counts = result.measurement_counts if hasattr(result, 'measurement_counts') else None
                 execution_time = metadata.get('endedAt', 0) - metadata.get('startedAt', 0) if metadata.get('startedAt') and metadata.get('endedAt') else None
@@ -363,11 +789,17 @@ class BraketService:
                 metadata=metadata,
             )
             
+            if self.deduplicator and status == TaskStatus.COMPLETED:
+                self.deduplicator.cache_result(task_result)
+            
             return task_result
+        except ThrottlingError:
+            raise
         except Exception as e:
             logger.exception(f"Error getting task result: {str(e)}")
             raise TaskResultError(f"Error getting task result: {str(e)}")
 
+    @traced('braket.list_devices')
     def list_devices(self) -> List[DeviceInfo]:
         """List available quantum devices.
 
@@ -379,7 +811,7 @@ class BraketService:
         """
         try:
             # Get the list of devices
-            response = self.braket_client.search_devices(filters=[])
+            response = self.rate_limiter.call(self.braket_client.search_devices, filters=[])
             
             # Convert to DeviceInfo objects
             devices = []
@@ -408,10 +840,87 @@ class BraketService:
                 devices.append(device_info)
             
             return devices
+        except ThrottlingError:
+            raise
         except Exception as e:
             logger.exception(f"Error listing devices: {str(e)}")
             raise DeviceError(f"Error listing devices: {str(e)}")
 
+    def _get_device_document(self, device_arn: str, max_age: float = DEVICE_CAPABILITIES_TTL_SECONDS) -> Dict[str, Any]:
+        """Get the `GetDevice` response for a device, using a cached copy if fresh.
+
+        Device capabilities rarely change, so callers that only need capabilities
+        can accept a long `max_age`. Callers that need the queue depth should
+        pass a short one.
+
+        Args:
+            device_arn: ARN of the device
+            max_age: Maximum age of a cached response (in seconds)
+
+        Returns:
+            Dict[str, Any]: The response, with `deviceCapabilities` parsed from JSON
+        """
+        with self._device_cache_lock:
+            cached = self._device_cache.get(device_arn)
+        if cached and time.monotonic() - cached[0] <= max_age:
+            return cached[1]
+
+        response = dict(self.rate_limiter.call(self.braket_client.get_device, deviceArn=device_arn))
+        capabilities = response.get('deviceCapabilities') or {}
+        if isinstance(capabilities, str):
+            capabilities = json.loads(capabilities)
+        response['deviceCapabilities'] = capabilities
+
+        with self._device_cache_lock:
+            self._device_cache[device_arn] = (time.monotonic(), response)
+        return response
+
+    @staticmethod
+    def _device_info_from_document(response: Dict[str, Any]) -> DeviceInfo:
+        """Build a DeviceInfo from a `GetDevice` response.
+
+        Args:
+            response: The response, with `deviceCapabilities` parsed from JSON
+
+        Returns:
+            DeviceInfo: Information about the device
+        """
+        # Determine the device type
+        device_type = DeviceType.QPU if response.get('deviceType') == 'QPU' else DeviceType.SIMULATOR
+        
+        # Get the supported gates. Gate-based devices list them under the
+        # OpenQASM action rather than the paradigm.
+        capabilities = response.get('deviceCapabilities', {})
+        paradigm = capabilities.get('paradigm', {})
+        supported_gates = list(paradigm.get('supportedGates', []))
+        if not supported_gates:
+            openqasm_action = capabilities.get('action', {}).get('braket.ir.openqasm.program', {})
+            supported_gates = list(openqasm_action.get('supportedOperations', []))
+        
+        # Connectivity is a graph for QPUs; keep it as JSON text
+        connectivity = paradigm.get('connectivity', '')
+        if not isinstance(connectivity, str):
+            connectivity = json.dumps(connectivity)
+        
+        # The shots range is reported as [min, max]
+        shots_range = capabilities.get('service', {}).get('shotsRange', [0, 0])
+        max_shots = shots_range[1] if isinstance(shots_range, (list, tuple)) else shots_range.get('max', 0)
+        
+        # Create the device info
+        return DeviceInfo(
+            device_arn=response.get('deviceArn', ''),
+            device_name=response.get('deviceName', ''),
+            device_type=device_type,
+            provider_name=response.get('providerName', ''),
+            status=response.get('deviceStatus', ''),
+            qubits=paradigm.get('qubitCount', 0),
+            connectivity=connectivity,
+            paradigm=paradigm.get('name', ''),
+            max_shots=max_shots,
+            supported_gates=supported_gates,
+        )
+
+    @traced('braket.get_device_info')
     def get_device_info(self, device_arn: str) -> DeviceInfo:
         """Get information about a specific quantum device.
 
@@ -426,36 +935,135 @@ class BraketService:
         """
         try:
             # Get the device information
-            response = self.braket_client.get_device(deviceArn=device_arn)
-            
-            # Determine the device type
-            device_type = DeviceType.QPU if response.get('deviceType') == 'QPU' else DeviceType.SIMULATOR
-            
-            # Get the supported gates
-            supported_gates = []
-            paradigm = response.get('deviceCapabilities', {}).get('paradigm', {})
-            if paradigm:
-                supported_gates = list(paradigm.get('supportedGates', []))
-            
-            # Create the device info
-            device_info = DeviceInfo(
-                device_arn=response.get('deviceArn', ''),
-                device_name=response.get('deviceName', ''),
-                device_type=device_type,
-                provider_name=response.get('providerName', ''),
-                status=response.get('deviceStatus', ''),
-                qubits=response.get('deviceCapabilities', {}).get('paradigm', {}).get('qubitCount', 0),
-                connectivity=response.get('deviceCapabilities', {}).get('paradigm', {}).get('connectivity', ''),
-                paradigm=response.get('deviceCapabilities', {}).get('paradigm', {}).get('name', ''),
-                max_shots=response.get('deviceCapabilities', {}).get('service', {}).get('shotsRange', {}).get('max', 0),
-                supported_gates=supported_gates,
-            )
-            
-            return device_info
+            response = self._get_device_document(device_arn)
+            return self._device_info_from_document(response)
+        except ThrottlingError:
+            raise
         except Exception as e:
             logger.exception(f"Error getting device info: {str(e)}")
             raise DeviceError(f"Error getting device info: {str(e)}")
 
+    def _get_historical_turnaround(self, device_arn: str) -> Optional[float]:
+        """Get the median turnaround of our recently completed tasks on a device.
+
+        Args:
+            device_arn: ARN of the device
+
+        Returns:
+            Optional[float]: Median turnaround in seconds, or None without history
+        """
+        with self._device_cache_lock:
+            cached = self._turnaround_cache.get(device_arn)
+        if cached and time.monotonic() - cached[0] <= TURNAROUND_TTL_SECONDS:
+            return cached[1]
+
+        try:
+            tasks = self.search_quantum_tasks(
+                device_arn=device_arn,
+                state='COMPLETED',
+                max_results=TURNAROUND_SAMPLE_SIZE,
+                created_after=datetime.now() - timedelta(days=TURNAROUND_LOOKBACK_DAYS),
+            )
+            turnaround = historical_turnaround(tasks)
+        except Exception as e:
+            logger.warning(f"Could not load task history for {device_arn}: {str(e)}")
+            turnaround = None
+
+        with self._device_cache_lock:
+            self._turnaround_cache[device_arn] = (time.monotonic(), turnaround)
+        return turnaround
+
+    @traced('braket.rank_devices')
+    def rank_devices(
+        self,
+        num_qubits: int,
+        required_gates: Optional[List[str]] = None,
+        include_simulators: bool = True,
+    ) -> List[DeviceRanking]:
+        """Rank devices by estimated turnaround for a circuit.
+
+        Devices that fit the circuit's qubit count and gate set are ranked
+        first, fastest estimate first. Capabilities come from the device cache;
+        queue depth is refreshed if older than QUEUE_INFO_TTL_SECONDS.
+
+        Args:
+            num_qubits: Number of qubits the circuit uses
+            required_gates: Gate names the circuit uses (Qiskit or Braket names)
+            include_simulators: Whether to rank managed simulators as well as QPUs
+
+        Returns:
+            List[DeviceRanking]: Rankings of all gate-based devices
+
+        Raises:
+            DeviceError: If there is an error retrieving the devices
+        """
+        try:
+            gates = to_braket_gate_names(required_gates or [])
+            candidates = [
+                device.device_arn
+                for device in self.list_devices()
+                if include_simulators or device.device_type == DeviceType.QPU
+            ]
+
+            def rank(device_arn: str) -> Optional[DeviceRanking]:
+                document = self._get_device_document(device_arn, max_age=QUEUE_INFO_TTL_SECONDS)
+                device = self._device_info_from_document(document)
+                if not device.supported_gates:
+                    # Not a gate-based device (e.g. analog Hamiltonian simulation)
+                    return None
+                turnaround = self._get_historical_turnaround(device_arn)
+                return rank_device(device, document, num_qubits, gates, turnaround)
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                rankings = [ranking for ranking in executor.map(rank, candidates) if ranking]
+
+            return sort_rankings(rankings)
+        except ThrottlingError:
+            raise
+        except Exception as e:
+            logger.exception(f"Error ranking devices: {str(e)}")
+            raise DeviceError(f"Error ranking devices: {str(e)}")
+
+    @traced('braket.get_task_progress')
+    def get_task_progress(self, task_id: str) -> TaskProgress:
+        """Get the status and queue position of a quantum task.
+
+        This is a single API call and does not download results.
+
+        Args:
+            task_id: ID of the quantum task
+
+        Returns:
+            TaskProgress: Status and queue position of the task
+
+        Raises:
+            TaskResultError: If there is an error retrieving the task
+        """
+        try:
+            response = self.rate_limiter.call(
+                self.braket_client.get_quantum_task,
+                quantumTaskArn=task_id,
+                additionalAttributeNames=['QueueInfo'],
+            )
+            queue_info = response.get('queueInfo') or {}
+            status = response.get('status')
+            if status == 'CANCELLING':
+                status = TaskStatus.CANCELLED.value
+
+            return TaskProgress(
+                task_id=task_id,
+                status=TaskStatus(status) if status in TaskStatus.__members__ else TaskStatus.FAILED,
+                queue_position=queue_info.get('position') if status == 'QUEUED' else None,
+                queue_priority=queue_info.get('queuePriority'),
+                message=queue_info.get('message') or response.get('failureReason'),
+            )
+        except ThrottlingError:
+            raise
+        except Exception as e:
+            logger.exception(f"Error getting task progress: {str(e)}")
+            raise TaskResultError(f"Error getting task progress: {str(e)}")
+
+    @traced('braket.cancel_quantum_task')
     def cancel_quantum_task(self, task_id: str) -> bool:
         """Cancel a quantum task.
 
@@ -470,12 +1078,15 @@ class BraketService:
         """
         try:
             # Cancel the task
-            self.braket_client.cancel_quantum_task(quantumTaskArn=task_id)
+            self.rate_limiter.call(self.braket_client.cancel_quantum_task, quantumTaskArn=task_id)
             return True
+        except ThrottlingError:
+            raise
         except Exception as e:
             logger.exception(f"Error cancelling quantum task: {str(e)}")
             raise TaskExecutionError(f"Error cancelling quantum task: {str(e)}")
 
+    @traced('braket.search_quantum_tasks')
     def search_quantum_tasks(
         self,
         device_arn: Optional[str] = None,
@@ -528,12 +1139,15 @@ class BraketService:
                 })
             
             # Search for tasks
-            response = self.braket_client.search_quantum_tasks(
+            response = self.rate_limiter.call(
+                self.braket_client.search_quantum_tasks,
                 filters=filters,
                 maxResults=max_results,
             )
             
             return response.get('quantumTasks', [])
+        except ThrottlingError:
+            raise
         except Exception as e:
             logger.exception(f"Error searching quantum tasks: {str(e)}")
             raise TaskExecutionError(f"Error searching quantum tasks: {str(e)}")
@@ -664,6 +1278,7 @@ class BraketService:
             logger.exception(f"Error creating QFT circuit: {str(e)}")
             raise CircuitCreationError(f"Error creating QFT circuit: {str(e)}")
 
+    @traced('braket.visualize_results')
     def visualize_results(self, result: TaskResult) -> str:
         """Visualize the results of a quantum task.
 
@@ -677,97 +1292,55 @@ class BraketService:
             TaskResultError: If there is an error visualizing the results
         """
         try:
-            # Check if matplotlib is available
-            try:
-                import matplotlib.pyplot as plt
-                import matplotlib
-                matplotlib.use('Agg')
-            except ImportError:
-                raise TaskResultError("matplotlib is required for results visualization. Please install it with: pip install matplotlib")
-            
             # Check if we have counts
             if not result.counts:
                 raise TaskResultError("No measurement counts available for visualization")
             
-            # Create the plot
-            fig, ax = plt.subplots(figsize=(10, 6))
-            
-            # Sort the counts by binary value
-            sorted_counts = dict(sorted(result.counts.items()))
-            
-            # Plot the counts
-            ax.bar(sorted_counts.keys(), sorted_counts.values())
-            
-            # Set the title and labels
-            ax.set_title(f"Measurement Results (Task ID: {result.task_id})")
-            ax.set_xlabel("Measurement Outcome")
-            ax.set_ylabel("Count")
-            
-            # Rotate the x-axis labels for better readability
-            plt.xticks(rotation=45)
-            
-            # Adjust the layout
-            plt.tight_layout()
-            
-            # Save the plot to a BytesIO object
-            img_data = io.BytesIO()
-            plt.savefig(img_data, format='png')
-            img_data.seek(0)
-            
-            # Convert to base64
-            base64_image = base64.b64encode(img_data.read()).decode('utf-8')
-            
-            # Close the plot to free memory
-            plt.close(fig)
-            
-            return base64_image
+            return base64.b64encode(self.render_results_png(result)).decode('utf-8')
+        except ImportError:
+            raise TaskResultError("matplotlib is required for results visualization. Please install it with: pip install matplotlib")
         except Exception as e:
             logger.exception(f"Error visualizing results: {str(e)}")
             raise TaskResultError(f"Error visualizing results: {str(e)}")
     
-    def create_circuit_visualization(self,
-                                     circuit: QuantumCircuit,
-                                     circuit_type: str = "custom") -> Dict[str, Any]:
-        """Create a visualization response for a quantum circuit.
-        
+    def render_results_png(self, result: TaskResult) -> bytes:
+        """Render a bar chart of the counts of a quantum task result.
+
         Args:
-            circuit: The quantum circuit to visualize
-            circuit_type: Type of circuit (e.g., "bell_pair", "ghz", "qft")
-            
+            result: Result of the quantum task, with counts
+
         Returns:
-            Response dictionary with descriptions, ASCII art, and file paths
+            bytes: PNG image of the results visualization
         """
-        try:
-            # Create the Qiskit circuit for visualization
-            qiskit_circuit = self.create_qiskit_circuit(circuit)
-            
-            # Generate base64 visualization
-            base64_viz = self.visualize_circuit(qiskit_circuit)
-            
-            # Create response
-            return self.viz_utils.create_circuit_response(
-                circuit, base64_viz, circuit_type
-            )
-            
-        except Exception as e:
-            logger.exception(f"Error creating circuit visualization: {str(e)}")
-            raise CircuitCreationError(f"Error creating circuit visualization: {str(e)}")
+        # Rendered in a worker process; repeated plots of the same counts come from its cache
+        return get_plot_renderer().render_counts(result.counts, f"Measurement Results (Task ID: {result.task_id})")
     
-    def create_results_visualization(self, result: TaskResult) -> Dict[str, Any]:
+    def create_results_visualization(
+        self,
+        result: TaskResult,
+        include_data: bool = False,
+        **histogram_options: Any,
+    ) -> Dict[str, Any]:
         """Create a visualization response for quantum results.
         
         Args:
             result: The quantum task result to visualize
+            include_data: Whether to include the base64 PNG; by default the
+                image is only returned by reference
+            **histogram_options: top_k, bin_by and qubits for the ASCII histogram
             
         Returns:
             Response dictionary with descriptions, ASCII art, and file paths
         """
         try:
-            # Generate base64 visualization
-            base64_viz = self.visualize_results(result)
+            if not result.counts:
+                raise TaskResultError("No measurement counts available for visualization")
+            
+            # Raw PNG bytes are written to the visualization store as they are
+            image = self.render_results_png(result)
             
             # Create response
-            return self.viz_utils.create_results_response(result, base64_viz)
+            return self.viz_utils.create_results_response(result, image, include_data, **histogram_options)
             
         except Exception as e:
             logger.exception(f"Error creating results visualization: {str(e)}")
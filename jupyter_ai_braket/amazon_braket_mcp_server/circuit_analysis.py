@@ -0,0 +1,127 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Dependency analysis of quantum circuits.
+
+A circuit is a DAG in which each gate depends on the last earlier gate on each
+of its qubits. The analysis walks the gate list once, keeping per-qubit
+frontiers of the layer, two-qubit layer and finish time reached so far, and
+the gate that finished last on each qubit. Depth, two-qubit depth, idle time
+and the critical path all follow in O(number of gates + qubits touched), so
+circuits with hundreds of thousands of gates are analysed in well under a
+second.
+
+Durations are typical of superconducting QPUs and are only meant for relative
+runtime estimates; pass measured durations for a specific device if known.
+"""
+
+from typing import Dict, List, Optional
+
+from .models import CircuitAnalysis, QuantumCircuit
+
+
+# Typical gate durations by number of qubits (in nanoseconds)
+DEFAULT_ARITY_DURATIONS_NS = {1: 50.0, 2: 300.0}
+
+# Gates whose duration does not follow from their number of qubits (in nanoseconds)
+DEFAULT_GATE_DURATIONS_NS = {
+    'measure': 1000.0,
+    'measure_all': 1000.0,
+    'reset': 1000.0,
+    'barrier': 0.0,
+    'ccx': 1800.0,  # Six CNOTs when decomposed
+    'ccnot': 1800.0,
+    'cswap': 2400.0,  # Eight CNOTs when decomposed
+}
+
+
+def analyze_circuit(
+    circuit: QuantumCircuit,
+    gate_durations_ns: Optional[Dict[str, float]] = None,
+) -> CircuitAnalysis:
+    """Compute the depth, critical path and idle time of a circuit.
+
+    Barriers do not add to the depth or duration but synchronize their qubits,
+    as they do on hardware.
+
+    Args:
+        circuit: The circuit to analyse
+        gate_durations_ns: Durations by gate name overriding the defaults (in nanoseconds)
+
+    Returns:
+        CircuitAnalysis: The analysis
+    """
+    durations = {**DEFAULT_GATE_DURATIONS_NS, **(gate_durations_ns or {})}
+    num_wires = max([circuit.num_qubits, 1] + [qubit + 1 for gate in circuit.gates for qubit in gate.qubits])
+
+    layer = [0] * num_wires
+    two_qubit_layer = [0] * num_wires
+    finish = [0.0] * num_wires
+    busy = [0.0] * num_wires
+    # Index of the gate that finished last on each wire, -1 before any gate
+    last_gate = [-1] * num_wires
+    # For each gate, the gate it waited for (the previous gate on the critical path)
+    predecessor: List[int] = []
+    gate_count = two_qubit_gate_count = 0
+
+    for index, gate in enumerate(circuit.gates):
+        if gate.name == 'measure_all' or (gate.name == 'barrier' and not gate.qubits):
+            wires = range(num_wires)
+        else:
+            wires = gate.qubits or [0]
+
+        if len(wires) == 1:
+            start_wire = wires[0]
+            current = layer[start_wire]
+            current_two_qubit = two_qubit_layer[start_wire]
+        else:
+            start_wire = max(wires, key=finish.__getitem__)
+            current = max([layer[wire] for wire in wires])
+            current_two_qubit = max([two_qubit_layer[wire] for wire in wires])
+        start = finish[start_wire]
+        predecessor.append(last_gate[start_wire])
+
+        if gate.name == 'barrier':
+            end, gate_index = start, last_gate[start_wire]
+        else:
+            multi_qubit = len(wires) > 1 and gate.name != 'measure_all'
+            duration = durations.get(gate.name, DEFAULT_ARITY_DURATIONS_NS.get(len(wires), 300.0))
+            end, gate_index = start + duration, index
+            current += 1
+            current_two_qubit += multi_qubit
+            gate_count += 1
+            two_qubit_gate_count += multi_qubit
+
+        for wire in wires:
+            layer[wire] = current
+            two_qubit_layer[wire] = current_two_qubit
+            busy[wire] += end - start
+            finish[wire] = end
+            last_gate[wire] = gate_index
+
+    duration_ns = max(finish, default=0.0)
+    critical_path = []
+    if gate_count:
+        gate = last_gate[max(range(num_wires), key=finish.__getitem__)]
+        while gate >= 0:
+            critical_path.append(gate)
+            gate = predecessor[gate]
+        critical_path.reverse()
+
+    return CircuitAnalysis(
+        depth=max(layer, default=0),
+        two_qubit_depth=max(two_qubit_layer, default=0),
+        gate_count=gate_count,
+        two_qubit_gate_count=two_qubit_gate_count,
+        duration_ns=duration_ns,
+        critical_path=critical_path,
+        qubit_idle_ns=[duration_ns - busy[wire] for wire in range(circuit.num_qubits)],
+    )
@@ -0,0 +1,287 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+
+"""Indexed catalog of the OpenQASM programs saved in a workspace.
+
+The catalog keeps one JSON index per workspace with the hash, qubit count, gate
+histogram, depth and tags of every `.qasm` file. A refresh only stats files and
+reparses those whose size or modification time changed, so queries stay cheap
+as the workspace grows. Programs and the index are written atomically, so the
+index never describes a partially written file.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+from .atomic_io import atomic_write_text
+from .hashing import sha256_text
+from .models import CatalogEntry
+from .qasm_cache import get_parsed_qasm_cache
+
+
+# Directories that never hold user circuits
+_SKIPPED_DIRS = {'.braket_cache', '.ipynb_checkpoints', '.git', 'node_modules', '__pycache__'}
+
+# Files larger than this are indexed without parsing (in bytes)
+MAX_PARSE_BYTES = 2 * 1024 * 1024
+
+
+class CircuitCatalog:
+    """Incremental, mtime-aware index of the .qasm files under a workspace."""
+
+    def __init__(self, workspace_dir: str, index_path: Optional[str] = None):
+        """Initialize the catalog and load its index.
+
+        Args:
+            workspace_dir: Directory whose .qasm files are catalogued
+            index_path: Location of the JSON index. Defaults to
+                `.braket_cache/catalog.json` in the workspace.
+        """
+        self.workspace_dir = Path(workspace_dir).resolve()
+        self.index_path = Path(index_path) if index_path else self.workspace_dir / '.braket_cache' / 'catalog.json'
+        self._entries: Dict[str, CatalogEntry] = {}
+        # (mtime_ns, size) of each file when it was indexed
+        self._stats: Dict[str, List[int]] = {}
+        self._lock = threading.RLock()
+        self._load()
+
+    def save_program(self, relative_path: str, qasm_program: str, tags: Optional[List[str]] = None) -> CatalogEntry:
+        """Save a program atomically and add it to the catalog.
+
+        Args:
+            relative_path: File path relative to the workspace
+            qasm_program: OpenQASM 3.0 program
+            tags: Tags for the program. If None, existing tags are kept.
+
+        Returns:
+            CatalogEntry: The catalog entry of the saved program
+
+        Raises:
+            ValueError: If the path is outside the workspace
+        """
+        path = self.resolve(relative_path)
+        atomic_write_text(path, qasm_program)
+        with self._lock:
+            entry = self._index_file(path, qasm_program, tags)
+            self._save()
+        return entry
+
+    def add_file(self, relative_path: str, tags: Optional[List[str]] = None) -> CatalogEntry:
+        """Add a program that was written to the workspace by other means.
+
+        Args:
+            relative_path: File path relative to the workspace
+            tags: Tags for the program. If None, existing tags are kept.
+
+        Returns:
+            CatalogEntry: The catalog entry of the program
+
+        Raises:
+            ValueError: If the path is outside the workspace
+        """
+        path = self.resolve(relative_path)
+        with self._lock:
+            entry = self._index_file(path, path.read_text(encoding='utf-8'), tags)
+            self._save()
+        return entry
+
+    def set_tags(self, relative_path: str, tags: List[str]) -> CatalogEntry:
+        """Replace the tags of a catalogued program.
+
+        Raises:
+            KeyError: If the program is not in the catalog
+        """
+        with self._lock:
+            self.refresh()
+            key = self._key(self.resolve(relative_path))
+            entry = self._entries[key]
+            entry.tags = sorted(set(tags))
+            self._save()
+            return entry
+
+    def refresh(self) -> int:
+        """Bring the index up to date with the workspace.
+
+        Unchanged files (same size and modification time) are not read.
+
+        Returns:
+            int: Number of files that were (re)indexed or removed
+        """
+        with self._lock:
+            seen = set()
+            changes = 0
+            for path in self._scan():
+                key = self._key(path)
+                seen.add(key)
+                stat = path.stat()
+                if self._stats.get(key) == [stat.st_mtime_ns, stat.st_size]:
+                    continue
+                try:
+                    self._index_file(path, path.read_text(encoding='utf-8'))
+                    changes += 1
+                except OSError as e:
+                    logger.warning(f"Could not index {path}: {str(e)}")
+
+            for key in set(self._entries) - seen:
+                del self._entries[key]
+                self._stats.pop(key, None)
+                changes += 1
+
+            if changes:
+                self._save()
+            return changes
+
+    def query(
+        self,
+        num_qubits: Optional[int] = None,
+        min_qubits: Optional[int] = None,
+        max_qubits: Optional[int] = None,
+        gate: Optional[str] = None,
+        tag: Optional[str] = None,
+        name: Optional[str] = None,
+        modified_after: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[CatalogEntry]:
+        """Find catalogued programs, most recently modified first.
+
+        Args:
+            num_qubits: Exact qubit count
+            min_qubits: Minimum qubit count
+            max_qubits: Maximum qubit count
+            gate: Gate the program must use
+            tag: Tag the program must have
+            name: Case-insensitive substring of the path
+            modified_after: Only programs modified after this time
+            limit: Maximum number of entries to return
+
+        Returns:
+            List[CatalogEntry]: The matching entries
+        """
+        self.refresh()
+        with self._lock:
+            entries = list(self._entries.values())
+
+        def matches(entry: CatalogEntry) -> bool:
+            qubits = entry.num_qubits
+            if num_qubits is not None and qubits != num_qubits:
+                return False
+            if min_qubits is not None and (qubits is None or qubits < min_qubits):
+                return False
+            if max_qubits is not None and (qubits is None or qubits > max_qubits):
+                return False
+            if gate and gate.lower() not in (entry.gate_counts or {}):
+                return False
+            if tag and tag not in entry.tags:
+                return False
+            if name and name.lower() not in entry.path.lower():
+                return False
+            if modified_after and datetime.fromisoformat(entry.modified_at) <= modified_after:
+                return False
+            return True
+
+        results = sorted(filter(matches, entries), key=lambda entry: entry.modified_at, reverse=True)
+        return results[:limit] if limit else results
+
+    def resolve(self, relative_path: str) -> Path:
+        """Resolve a path relative to the workspace.
+
+        Raises:
+            ValueError: If the path is outside the workspace
+        """
+        path = (self.workspace_dir / relative_path).resolve()
+        if self.workspace_dir not in path.parents:
+            raise ValueError(f"Path {relative_path} is outside the workspace {self.workspace_dir}")
+        return path
+
+    def _key(self, path: Path) -> str:
+        return path.relative_to(self.workspace_dir).as_posix()
+
+    def _scan(self):
+        for dirpath, dirnames, filenames in os.walk(self.workspace_dir):
+            dirnames[:] = [name for name in dirnames if name not in _SKIPPED_DIRS and not name.startswith('.')]
+            for filename in filenames:
+                if filename.endswith('.qasm'):
+                    yield Path(dirpath) / filename
+
+    def _index_file(self, path: Path, text: str, tags: Optional[List[str]] = None) -> CatalogEntry:
+        """Parse a program and store its entry (caller holds the lock)."""
+        key = self._key(path)
+        stat = path.stat()
+        previous = self._entries.get(key)
+        entry = CatalogEntry(
+            path=key,
+            sha256=sha256_text(text),
+            size_bytes=stat.st_size,
+            modified_at=datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            tags=sorted(set(tags)) if tags is not None else (previous.tags if previous else []),
+        )
+
+        if previous and previous.sha256 == entry.sha256 and previous.error is None:
+            # Touched but unchanged; keep the parsed metadata
+            entry = previous.model_copy(update={'modified_at': entry.modified_at, 'tags': entry.tags})
+        elif stat.st_size > MAX_PARSE_BYTES:
+            entry.error = f"Not parsed: larger than {MAX_PARSE_BYTES} bytes"
+        else:
+            try:
+                circuit = get_parsed_qasm_cache().parse(text).circuit
+                entry.num_qubits = circuit.num_qubits
+                entry.num_operations = len(circuit.data)
+                entry.depth = circuit.depth()
+                entry.gate_counts = dict(circuit.count_ops())
+            except Exception as e:
+                entry.error = str(e)[:300]
+
+        self._entries[key] = entry
+        self._stats[key] = [stat.st_mtime_ns, stat.st_size]
+        return entry
+
+    def _load(self) -> None:
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                data = json.load(f)
+            self._entries = {key: CatalogEntry(**entry) for key, entry in data.get('entries', {}).items()}
+            self._stats = data.get('stats', {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Rebuilding unreadable circuit catalog {self.index_path}: {str(e)}")
+            self._entries, self._stats = {}, {}
+
+    def _save(self) -> None:
+        """Write the index atomically (caller holds the lock)."""
+        data = {
+            'entries': {key: entry.model_dump() for key, entry in self._entries.items()},
+            'stats': self._stats,
+        }
+        try:
+            atomic_write_text(self.index_path, json.dumps(data))
+        except OSError as e:
+            logger.warning(f"Could not save circuit catalog: {str(e)}")
+
+
+_catalogs: Dict[str, CircuitCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_circuit_catalog(workspace_dir: str) -> CircuitCatalog:
+    """Get the catalog of a workspace, shared by the whole process."""
+    key = str(Path(workspace_dir).resolve())
+    with _catalogs_lock:
+        if key not in _catalogs:
+            _catalogs[key] = CircuitCatalog(key)
+        return _catalogs[key]
@@ -0,0 +1,224 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+
+"""Content-addressed deduplication of quantum task submissions.
+
+Resubmitting an unchanged circuit ("run it again") creates a new paid task. The
+deduplicator keys each submission by a hash of the canonical circuit, the device
+ARN and the shot count, and remembers the resulting task for a freshness window.
+A matching submission within the window reuses the existing task instead, and
+each such hit is recorded in memory and appended to a JSON Lines log.
+
+Submitting is check-and-reserve: the first of several concurrent identical
+submissions reserves the key, and the others wait until it records its task
+(and then reuse it) or releases the key (and then submit themselves).
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, Dict, Optional, Set
+
+from loguru import logger
+
+from .atomic_io import atomic_write_text
+from .hashing import sha256_text
+from .models import DedupHit, TaskResult
+
+
+class SubmissionDeduplicator:
+    """Remembers recent submissions and completed results by content hash."""
+
+    def __init__(self, freshness_seconds: float, state_dir: Optional[str] = None, max_hits: int = 1000):
+        """Initialize the deduplicator.
+
+        Args:
+            freshness_seconds: How long a submission can be reused (in seconds)
+            state_dir: Directory for the submission index and hit log. If None,
+                state is kept in memory only.
+            max_hits: Maximum number of hits kept in memory
+        """
+        self.freshness_seconds = freshness_seconds
+        self.state_dir = Path(state_dir) if state_dir else None
+        self.hits: Deque[DedupHit] = deque(maxlen=max_hits)
+        self._submissions: Dict[str, Dict[str, object]] = {}
+        self._results: Dict[str, TaskResult] = {}
+        # Keys of submissions in flight, whose task ID is not known yet
+        self._reserved: Set[str] = set()
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+
+        if self.state_dir:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            self._load_index()
+
+    @property
+    def index_path(self) -> Optional[Path]:
+        return self.state_dir / 'dedup_index.json' if self.state_dir else None
+
+    @property
+    def hit_log_path(self) -> Optional[Path]:
+        return self.state_dir / 'dedup_hits.jsonl' if self.state_dir else None
+
+    @staticmethod
+    def submission_key(circuit_fingerprint: str, device_arn: str, shots: int) -> str:
+        """Build the content address of a submission."""
+        return sha256_text(f"{circuit_fingerprint}|{device_arn}|{shots}")
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Get the task of a fresh matching submission.
+
+        Args:
+            key: Content address of the submission
+
+        Returns:
+            Optional[str]: ID of the existing task, or None if there is no
+            submission within the freshness window
+        """
+        with self._lock:
+            return self._fresh_task_id(key)
+
+    def reserve(self, key: str, reuse: bool = True) -> Optional[str]:
+        """Get the task of a fresh matching submission, or reserve the key to submit one.
+
+        Waits while another caller holds the reservation for the same key. When
+        None is returned the caller holds the reservation and must end it with
+        `record_submission` or `release`.
+
+        Args:
+            key: Content address of the submission
+            reuse: Whether an existing task may be returned. If False, the key
+                is always reserved.
+
+        Returns:
+            Optional[str]: ID of the existing task, or None if the caller now
+            holds the reservation
+        """
+        with self._released:
+            self._released.wait_for(lambda: key not in self._reserved)
+            task_id = self._fresh_task_id(key) if reuse else None
+            if task_id is None:
+                self._reserved.add(key)
+            return task_id
+
+    def release(self, key: str) -> None:
+        """End a reservation without recording a task, e.g. because submission failed."""
+        with self._released:
+            self._reserved.discard(key)
+            self._released.notify_all()
+
+    def record_submission(self, key: str, task_id: str, device_arn: str, shots: int) -> None:
+        """Remember a new submission and end the caller's reservation of its key."""
+        with self._released:
+            self._submissions[key] = {
+                'task_id': task_id,
+                'device_arn': device_arn,
+                'shots': shots,
+                'submitted_at': time.time(),
+            }
+            self._prune()
+            self._reserved.discard(key)
+            self._released.notify_all()
+        self._save_index()
+
+    def forget(self, key: str) -> None:
+        """Drop a submission, e.g. because its task failed."""
+        with self._lock:
+            self._submissions.pop(key, None)
+        self._save_index()
+
+    def record_hit(self, key: str) -> Optional[DedupHit]:
+        """Record that a submission was served by an existing task.
+
+        Args:
+            key: Content address of the submission
+
+        Returns:
+            Optional[DedupHit]: The recorded hit, or None if the submission has
+            expired or been forgotten since it was looked up
+        """
+        with self._lock:
+            entry = self._submissions.get(key)
+            if entry is None:
+                return None
+            hit = DedupHit(
+                key=key,
+                task_id=entry['task_id'],
+                device_arn=entry['device_arn'],
+                shots=entry['shots'],
+                age_seconds=time.time() - entry['submitted_at'],
+                hit_at=datetime.now().isoformat(),
+            )
+            self.hits.append(hit)
+
+        logger.info(f"Deduplicated submission: reusing task {hit.task_id} ({hit.age_seconds:.0f}s old)")
+        if self.hit_log_path:
+            try:
+                with open(self.hit_log_path, 'a', encoding='utf-8') as f:
+                    f.write(hit.model_dump_json() + '\n')
+            except OSError as e:
+                logger.warning(f"Could not append to dedup hit log: {str(e)}")
+        return hit
+
+    def cache_result(self, result: TaskResult) -> None:
+        """Keep the completed result of a task that submissions may reuse."""
+        with self._lock:
+            if any(entry['task_id'] == result.task_id for entry in self._submissions.values()):
+                self._results[result.task_id] = result
+
+    def get_cached_result(self, task_id: str) -> Optional[TaskResult]:
+        """Get a cached completed task result."""
+        with self._lock:
+            return self._results.get(task_id)
+
+    def _fresh_task_id(self, key: str) -> Optional[str]:
+        """Get the task of a submission within the freshness window (lock held)."""
+        entry = self._submissions.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry['submitted_at'] > self.freshness_seconds:
+            del self._submissions[key]
+            return None
+        return entry['task_id']
+
+    def _prune(self) -> None:
+        """Drop expired submissions and results of tasks no longer referenced."""
+        now = time.time()
+        expired = [key for key, entry in self._submissions.items() if now - entry['submitted_at'] > self.freshness_seconds]
+        for key in expired:
+            del self._submissions[key]
+        live_tasks = {entry['task_id'] for entry in self._submissions.values()}
+        for task_id in [task_id for task_id in self._results if task_id not in live_tasks]:
+            del self._results[task_id]
+
+    def _load_index(self) -> None:
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                self._submissions = json.load(f)
+            self._prune()
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable dedup index {self.index_path}: {str(e)}")
+
+    def _save_index(self) -> None:
+        if not self.index_path:
+            return
+        with self._lock:
+            data = json.dumps(self._submissions)
+        try:
+            atomic_write_text(self.index_path, data)
+        except OSError as e:
+            logger.warning(f"Could not save dedup index: {str(e)}")
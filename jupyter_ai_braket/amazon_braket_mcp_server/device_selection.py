@@ -0,0 +1,259 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Queue-aware device selection for Amazon Braket.
+
+This module ranks devices for a circuit by combining device capabilities with
+queue depth, execution windows and historical turnaround of completed tasks.
+The functions here are pure; BraketService supplies the device documents and
+task history.
+"""
+
+import statistics
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .models import DeviceInfo, DeviceRanking, DeviceType
+
+
+# Qiskit/OpenQASM standard gate names mapped to the names Braket reports in
+# `supportedGates`. Names that match already are not listed.
+QISKIT_TO_BRAKET_GATES = {
+    'cx': 'cnot',
+    'ccx': 'ccnot',
+    'cp': 'cphaseshift',
+    'p': 'phaseshift',
+    'sdg': 'si',
+    'tdg': 'ti',
+    'sx': 'v',
+    'sxdg': 'vi',
+    'id': 'i',
+    'rxx': 'xx',
+    'ryy': 'yy',
+    'rzz': 'zz',
+}
+
+# Operations that are not gates and never need device support
+NON_GATE_OPERATIONS = {'measure', 'measure_all', 'barrier', 'reset', 'delay'}
+
+# Fallback per-task service time when we have no history for a device (seconds)
+DEFAULT_TASK_SECONDS = {
+    DeviceType.QPU: 120.0,
+    DeviceType.SIMULATOR: 10.0,
+}
+
+_WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def to_braket_gate_names(gate_names: Iterable[str]) -> Set[str]:
+    """Translate Qiskit gate names to Braket gate names.
+
+    Args:
+        gate_names: Gate names as used by Qiskit or OpenQASM 3.0
+
+    Returns:
+        Set[str]: Lower-case Braket gate names, without non-gate operations
+    """
+    names = set()
+    for name in gate_names:
+        name = name.lower()
+        if name in NON_GATE_OPERATIONS:
+            continue
+        names.add(QISKIT_TO_BRAKET_GATES.get(name, name))
+    return names
+
+
+def queue_depth(device_document: Dict[str, Any]) -> int:
+    """Get the number of quantum tasks waiting on a device.
+
+    Args:
+        device_document: Response of the Braket `GetDevice` API
+
+    Returns:
+        int: Normal plus priority quantum tasks in the queue. Values reported
+        as '>4000' are counted as 4001.
+    """
+    total = 0
+    for queue in device_document.get('deviceQueueInfo', []) or []:
+        if queue.get('queue') != 'QUANTUM_TASKS_QUEUE':
+            continue
+        size = str(queue.get('queueSize', '0')).strip()
+        if size.startswith('>'):
+            total += int(size[1:]) + 1
+        elif size.isdigit():
+            total += int(size)
+    return total
+
+
+def _parse_hour(value: str) -> time:
+    """Parse an execution window boundary such as '09:00' or '09:00:00'."""
+    parts = [int(part) for part in str(value).split(':')]
+    while len(parts) < 3:
+        parts.append(0)
+    return time(parts[0] % 24, parts[1], parts[2])
+
+
+def _window_applies(execution_day: str, day: datetime) -> bool:
+    """Check whether an execution window applies to the given day."""
+    weekday = day.weekday()
+    if execution_day == 'Everyday':
+        return True
+    if execution_day == 'Weekdays':
+        return weekday < 5
+    if execution_day == 'Weekend':
+        return weekday >= 5
+    return execution_day == _WEEKDAYS[weekday]
+
+
+def seconds_until_available(windows: List[Dict[str, Any]], now: Optional[datetime] = None) -> float:
+    """Compute how long until a device is inside one of its execution windows.
+
+    Args:
+        windows: `executionWindows` from the device's service capabilities
+        now: Current time (defaults to the current UTC time)
+
+    Returns:
+        float: 0 if the device is available now, otherwise seconds until the
+        next window opens, or infinity if no window opens within a week. A
+        device without windows is always available.
+    """
+    if not windows:
+        return 0.0
+
+    now = now or datetime.now(timezone.utc)
+    best = None
+    # Look back one day for windows that started yesterday and wrap past midnight
+    for day_offset in range(-1, 8):
+        day = (now + timedelta(days=day_offset)).replace(hour=0, minute=0, second=0, microsecond=0)
+        for window in windows:
+            if not _window_applies(window.get('executionDay', 'Everyday'), day):
+                continue
+            start = datetime.combine(day.date(), _parse_hour(window.get('windowStartHour', '00:00')), now.tzinfo)
+            end = datetime.combine(day.date(), _parse_hour(window.get('windowEndHour', '23:59:59')), now.tzinfo)
+            if end <= start:
+                end += timedelta(days=1)
+            if start <= now < end:
+                return 0.0
+            if start > now:
+                wait = (start - now).total_seconds()
+                best = wait if best is None else min(best, wait)
+    return best if best is not None else float('inf')
+
+
+def historical_turnaround(tasks: List[Dict[str, Any]]) -> Optional[float]:
+    """Compute the median turnaround of completed tasks.
+
+    Args:
+        tasks: Task summaries from the Braket `SearchQuantumTasks` API
+
+    Returns:
+        Optional[float]: Median seconds from creation to end, or None if no
+        completed task has both timestamps
+    """
+    durations = []
+    for task in tasks:
+        created_at = task.get('createdAt')
+        ended_at = task.get('endedAt')
+        if isinstance(created_at, datetime) and isinstance(ended_at, datetime):
+            durations.append((ended_at - created_at).total_seconds())
+    return statistics.median(durations) if durations else None
+
+
+def check_device_fit(
+    device: DeviceInfo,
+    num_qubits: int,
+    required_gates: Set[str],
+) -> Tuple[bool, List[str]]:
+    """Check whether a device can run a circuit.
+
+    Args:
+        device: Device capabilities
+        num_qubits: Number of qubits the circuit uses
+        required_gates: Braket gate names the circuit uses
+
+    Returns:
+        Tuple[bool, List[str]]: Whether the device fits, and the reasons it does not
+    """
+    reasons = []
+    if device.status != 'ONLINE':
+        reasons.append(f"device is {device.status or 'in an unknown state'}")
+    if device.qubits < num_qubits:
+        reasons.append(f"device has {device.qubits} qubits, circuit needs {num_qubits}")
+    if required_gates:
+        supported = {gate.lower() for gate in device.supported_gates}
+        missing = sorted(required_gates - supported)
+        if missing:
+            reasons.append(f"unsupported gates: {', '.join(missing)}")
+    return not reasons, reasons
+
+
+def rank_device(
+    device: DeviceInfo,
+    device_document: Dict[str, Any],
+    num_qubits: int,
+    required_gates: Set[str],
+    turnaround: Optional[float],
+    now: Optional[datetime] = None,
+) -> DeviceRanking:
+    """Estimate turnaround for one device.
+
+    The estimate is the wait for the next execution window, plus a default
+    service time per queued task ahead of us, plus our own turnaround. Our
+    turnaround is the device's historical median when known, and the
+    per-device-type default otherwise.
+
+    Args:
+        device: Device capabilities
+        device_document: Response of the Braket `GetDevice` API
+        num_qubits: Number of qubits the circuit uses
+        required_gates: Braket gate names the circuit uses
+        turnaround: Historical median turnaround of our tasks on the device
+        now: Current time (defaults to the current UTC time)
+
+    Returns:
+        DeviceRanking: The device's fit and turnaround estimate
+    """
+    fits, reasons = check_device_fit(device, num_qubits, required_gates)
+    depth = queue_depth(device_document)
+    windows = device_document.get('deviceCapabilities', {}).get('service', {}).get('executionWindows', [])
+    window_wait = seconds_until_available(windows, now)
+    default_seconds = DEFAULT_TASK_SECONDS[device.device_type]
+    per_task = default_seconds if turnaround is None else min(turnaround, default_seconds * 10)
+
+    estimated_turnaround = window_wait + depth * default_seconds + per_task
+    if window_wait == float('inf'):
+        fits = False
+        reasons.append("no execution window in the next 7 days")
+        window_wait = estimated_turnaround = None
+
+    return DeviceRanking(
+        device_arn=device.device_arn,
+        device_name=device.device_name,
+        provider_name=device.provider_name,
+        device_type=device.device_type,
+        fits=fits,
+        reasons=reasons,
+        qubits=device.qubits,
+        queue_depth=depth,
+        available_now=window_wait == 0,
+        seconds_until_available=window_wait,
+        historical_turnaround=turnaround,
+        estimated_turnaround=estimated_turnaround,
+    )
+
+
+def sort_rankings(rankings: List[DeviceRanking]) -> List[DeviceRanking]:
+    """Order rankings with fitting devices first, fastest estimate first."""
+    def key(ranking: DeviceRanking):
+        estimate = ranking.estimated_turnaround
+        return (not ranking.fits, float('inf') if estimate is None else estimate, ranking.queue_depth)
+
+    return sorted(rankings, key=key)
@@ -0,0 +1,196 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+
+"""Size-aware text rendering of circuit diagrams.
+
+The full text drawing of a circuit grows with qubits times depth; a 50-qubit QFT
+is megabytes of box-drawing characters. The renderer here supports folded,
+windowed (first and last layers), qubit-subset and summary-only output, and by
+default picks the most detailed mode that fits a character budget without
+drawing the full circuit first.
+"""
+
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from qiskit import QuantumCircuit as QiskitCircuit, QuantumRegister
+from qiskit.converters import circuit_to_dag
+
+from .models import DiagramMode
+
+
+# Default maximum size of a diagram returned to the agent (in characters)
+DEFAULT_DIAGRAM_CHAR_BUDGET = 4000
+
+# Approximate width of one layer in the text drawing, and of the wire labels
+_LAYER_WIDTH = 9
+_LABEL_WIDTH = 10
+
+
+def estimate_diagram_size(num_qubits: int, num_clbits: int, depth: int) -> int:
+    """Estimate the number of characters of a full text drawing.
+
+    Args:
+        num_qubits: Number of qubit wires
+        num_clbits: Number of classical bits (drawn as one bundled wire)
+        depth: Number of layers
+
+    Returns:
+        int: Approximate size of the drawing
+    """
+    return _diagram_lines(num_qubits, num_clbits) * (_LAYER_WIDTH * depth + _LABEL_WIDTH)
+
+
+def _diagram_lines(num_qubits: int, num_clbits: int) -> int:
+    return 2 * num_qubits + 1 + (2 if num_clbits else 0)
+
+
+def summarize_circuit(circuit: QiskitCircuit) -> str:
+    """Describe a circuit in a few lines without drawing it.
+
+    Args:
+        circuit: Qiskit quantum circuit
+
+    Returns:
+        str: Qubit count, depth and gate counts
+    """
+    gate_counts = dict(circuit.count_ops())
+    multi_qubit = sum(1 for instruction in circuit.data if len(instruction.qubits) > 1)
+    counts = ', '.join(f"{name}: {count}" for name, count in sorted(gate_counts.items(), key=lambda item: -item[1]))
+    return (
+        f"Circuit with {circuit.num_qubits} qubits, {circuit.num_clbits} classical bits, "
+        f"depth {circuit.depth()}, {len(circuit.data)} operations ({multi_qubit} multi-qubit)\n"
+        f"Gate counts: {counts or 'none'}"
+    )
+
+
+def _dag_layers(circuit: QiskitCircuit) -> List[list]:
+    """Get the operation nodes of each layer of a circuit."""
+    return [layer['graph'].op_nodes() for layer in circuit_to_dag(circuit).layers()]
+
+
+def _draw_window(circuit: QiskitCircuit, node_layers: List[list], layers: int) -> str:
+    """Draw the first and last layers of a circuit."""
+    if len(node_layers) <= 2 * layers:
+        return _draw(circuit)
+
+    def build(selected: Iterable[list]) -> QiskitCircuit:
+        sub = _copy_wires(circuit)
+        for nodes in selected:
+            for node in nodes:
+                sub.append(node.op, node.qargs, node.cargs)
+        return sub
+
+    omitted = len(node_layers) - 2 * layers
+    return (
+        f"First {layers} layers:\n{_draw(build(node_layers[:layers]))}\n"
+        f"... {omitted} layers omitted ...\n"
+        f"Last {layers} layers:\n{_draw(build(node_layers[-layers:]))}"
+    )
+
+
+def _copy_wires(circuit: QiskitCircuit) -> QiskitCircuit:
+    """Create an empty circuit on the same qubits and classical bits."""
+    sub = QiskitCircuit(circuit.qubits, circuit.clbits)
+    for register in circuit.qregs:
+        sub.add_register(register)
+    for register in circuit.cregs:
+        sub.add_register(register)
+    return sub
+
+
+def _qubit_subset(circuit: QiskitCircuit, qubits: Sequence[int]) -> Tuple[QiskitCircuit, int]:
+    """Restrict a circuit to the operations acting only on the given qubits.
+
+    Returns:
+        Tuple[QiskitCircuit, int]: The restricted circuit and the number of operations dropped
+        because they also act on other qubits
+    """
+    selected = [index for index in dict.fromkeys(qubits) if 0 <= index < circuit.num_qubits]
+    if not selected:
+        raise ValueError(f"No valid qubit indices in {list(qubits)} for a {circuit.num_qubits}-qubit circuit")
+
+    registers = {index: QuantumRegister(1, f'q{index}') for index in selected}
+    sub = QiskitCircuit(*registers.values(), circuit.clbits)
+    for register in circuit.cregs:
+        sub.add_register(register)
+
+    mapping = {circuit.qubits[index]: registers[index][0] for index in selected}
+    dropped = 0
+    for instruction in circuit.data:
+        if all(qubit in mapping for qubit in instruction.qubits):
+            sub.append(instruction.operation, [mapping[qubit] for qubit in instruction.qubits], instruction.clbits)
+        elif any(qubit in mapping for qubit in instruction.qubits):
+            dropped += 1
+    return sub, dropped
+
+
+def _draw(circuit: QiskitCircuit, fold: int = -1) -> str:
+    return str(circuit.draw(output='text', fold=fold))
+
+
+def render_diagram(
+    circuit: QiskitCircuit,
+    mode: DiagramMode = DiagramMode.AUTO,
+    fold: int = 80,
+    layers: int = 10,
+    qubits: Optional[Sequence[int]] = None,
+    max_chars: int = DEFAULT_DIAGRAM_CHAR_BUDGET,
+) -> Tuple[str, DiagramMode]:
+    """Render a text diagram of a circuit.
+
+    Args:
+        circuit: Qiskit quantum circuit
+        mode: Rendering mode. AUTO picks FULL, then WINDOW, then SUMMARY,
+            whichever is the first to fit `max_chars`.
+        fold: Line width for FOLDED mode
+        layers: Number of layers shown at each end in WINDOW mode
+        qubits: Only draw these qubits (operations that also act on other
+            qubits are left out)
+        max_chars: Character budget for AUTO mode
+
+    Returns:
+        Tuple[str, DiagramMode]: The diagram and the mode that was used
+    """
+    mode = DiagramMode(mode)
+    header = ''
+    if qubits:
+        circuit, dropped = _qubit_subset(circuit, qubits)
+        header = f"Qubits {', '.join(register.name[1:] for register in circuit.qregs)}"
+        header += f" ({dropped} operations on other qubits not shown)\n" if dropped else '\n'
+
+    if mode == DiagramMode.SUMMARY:
+        return header + summarize_circuit(circuit), mode
+    if mode == DiagramMode.FOLDED:
+        return header + _draw(circuit, fold), mode
+    if mode == DiagramMode.FULL:
+        return header + _draw(circuit), mode
+    if mode == DiagramMode.WINDOW:
+        return header + _draw_window(circuit, _dag_layers(circuit), max(layers, 1)), mode
+
+    # AUTO: estimate before drawing, then check the actual size
+    budget = max_chars - len(header)
+    lines = _diagram_lines(circuit.num_qubits, circuit.num_clbits)
+    if estimate_diagram_size(circuit.num_qubits, circuit.num_clbits, circuit.depth()) <= budget:
+        diagram = _draw(circuit)
+        if len(diagram) <= budget:
+            return header + diagram, DiagramMode.FULL
+
+    # Both ends of the window must fit; halve the window until they do
+    layers = min(layers, (budget // lines - _LABEL_WIDTH) // (2 * _LAYER_WIDTH))
+    node_layers = _dag_layers(circuit) if layers >= 1 else []
+    while layers >= 1:
+        diagram = _draw_window(circuit, node_layers, layers)
+        if len(diagram) <= budget:
+            return header + diagram, DiagramMode.WINDOW
+        layers //= 2
+
+    return header + summarize_circuit(circuit), DiagramMode.SUMMARY
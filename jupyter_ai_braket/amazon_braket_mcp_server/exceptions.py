@@ -46,3 +46,9 @@ class VisualizationError(BraketMCPException):
     """Exception raised when there is an error visualizing a circuit or results."""
 
     pass
+
+
+class ThrottlingError(BraketMCPException):
+    """Exception raised when Amazon Braket keeps throttling requests after retries."""
+
+    pass
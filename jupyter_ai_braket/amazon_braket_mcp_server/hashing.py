@@ -0,0 +1,68 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+
+"""Content hashing for quantum circuits and device capabilities.
+
+Hashes computed here key the caches in this package, so they must be stable
+across processes: they are SHA-256 digests of canonical text, never Python's
+built-in `hash()`.
+"""
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit as QiskitCircuit
+
+
+def sha256_text(text: str) -> str:
+    """Get the hex SHA-256 digest of a string."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def sha256_bytes(data: bytes) -> str:
+    """Get the hex SHA-256 digest of raw bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def circuit_hash(circuit: 'QiskitCircuit') -> str:
+    """Hash a Qiskit circuit by its canonical OpenQASM 3.0 serialization.
+
+    Args:
+        circuit: Qiskit quantum circuit
+
+    Returns:
+        str: Hex SHA-256 digest of the serialized circuit
+    """
+    from qiskit import qasm3
+
+    return sha256_text(qasm3.dumps(circuit))
+
+
+def braket_circuit_hash(circuit: Any) -> str:
+    """Hash a Braket circuit by its OpenQASM 3.0 serialization.
+
+    Args:
+        circuit: Braket circuit
+
+    Returns:
+        str: Hex SHA-256 digest of the serialized circuit
+    """
+    from braket.circuits.serialization import IRType
+
+    return sha256_text(circuit.to_ir(IRType.OPENQASM).source)
+
+
+def json_hash(value: Any) -> str:
+    """Hash a JSON-serializable value independently of dictionary key order."""
+    return sha256_text(json.dumps(value, sort_keys=True, default=str))
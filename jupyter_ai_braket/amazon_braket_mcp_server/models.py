@@ -19,7 +19,8 @@ that represent both the quantum circuit structure and its contents.
 """
 
 from enum import Enum
-from pydantic import BaseModel, Field
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict, List, Optional, Union, Any
 
 
@@ -51,6 +52,23 @@ class GateType(str, Enum):
     MEASURE_ALL = "measure_all"  # Measure all qubits
 
 
+class DiagramMode(str, Enum):
+    """Enumeration of circuit diagram rendering modes."""
+
+    AUTO = "auto"  # Pick a mode that fits the character budget
+    FULL = "full"  # Whole circuit on one line per wire
+    FOLDED = "folded"  # Whole circuit wrapped to a fixed width
+    WINDOW = "window"  # First and last layers only
+    SUMMARY = "summary"  # Counts and depth only, no diagram
+
+
+class DiagramFormat(str, Enum):
+    """Enumeration of streamed circuit diagram formats."""
+
+    TEXT = "text"  # One line per qubit, folded into blocks of moments
+    SVG = "svg"  # One column per moment
+
+
 class Gate(BaseModel):
     """Represents a quantum gate in a circuit.
     
@@ -114,6 +132,193 @@ class TaskResult(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 
+class DetailLevel(str, Enum):
+    """Enumeration of tool response detail levels."""
+
+    SUMMARY = "summary"  # Counts and totals only
+    FULL = "full"  # Everything, including raw shots and metadata
+
+
+class HistogramBinning(str, Enum):
+    """Enumeration of how measurement outcomes are grouped in a histogram."""
+
+    OUTCOME = "outcome"  # One bar per bitstring
+    HAMMING_WEIGHT = "hamming_weight"  # One bar per number of 1s
+    QUBITS = "qubits"  # One bar per bitstring of a subset of qubits
+
+
+class TaskResultSummary(BaseModel):
+    """Compact view of a quantum task result.
+
+    Attributes:
+        task_id: The ID of the quantum task
+        status: The status of the task
+        device: The device the task ran on
+        shots: Number of shots used
+        execution_time: Time taken to execute the task (in seconds)
+        counts: Counts of the most frequent measurement outcomes
+        num_outcomes: Number of distinct measurement outcomes
+        other_shots: Shots with outcomes left out of `counts`
+        most_likely: The most frequent measurement outcome
+        has_measurements: Whether per-shot measurements are available with detail='full'
+        metadata_keys: Metadata fields available with detail='full'
+    """
+
+    task_id: str
+    status: TaskStatus
+    device: str
+    shots: int
+    execution_time: Optional[float] = None
+    counts: Optional[Dict[str, int]] = None
+    num_outcomes: int = 0
+    other_shots: int = 0
+    most_likely: Optional[str] = None
+    has_measurements: bool = False
+    metadata_keys: List[str] = []
+
+
+class TaskResultFields(BaseModel):
+    """Requested fields of a quantum task result.
+
+    Any field of TaskResult or TaskResultSummary may be present besides the
+    task ID.
+
+    Attributes:
+        task_id: The ID of the quantum task
+    """
+
+    model_config = ConfigDict(extra='allow')
+
+    task_id: str
+
+
+class TaskProgress(BaseModel):
+    """Status and queue position of a quantum task.
+
+    Attributes:
+        task_id: The ID of the quantum task
+        status: The status of the task
+        queue_position: Position in the device queue, while the task is queued
+            (may be reported as e.g. '>2000')
+        queue_priority: Queue the task waits in (Normal or Priority)
+        message: Additional information from the service
+    """
+
+    task_id: str
+    status: TaskStatus
+    queue_position: Optional[str] = None
+    queue_priority: Optional[str] = None
+    message: Optional[str] = None
+
+
+class TaskWait(BaseModel):
+    """How long a task was waited for.
+
+    Attributes:
+        waited_seconds: Time spent waiting (in seconds)
+        timed_out: Whether the wait ended before the task finished
+    """
+
+    waited_seconds: float
+    timed_out: bool
+
+
+class WaitedTaskResultSummary(TaskWait, TaskResultSummary):
+    """Compact result of a task that finished while it was waited for."""
+
+
+class WaitedTaskResult(TaskWait, TaskResult):
+    """Full result of a task that finished while it was waited for."""
+
+
+class WaitedTaskResultFields(TaskWait, TaskResultFields):
+    """Requested result fields of a task that finished while it was waited for."""
+
+
+class WaitedTaskProgress(TaskWait, TaskProgress):
+    """Latest status of a task that was still running when the wait timed out."""
+
+
+class QuantumTaskSummary(BaseModel):
+    """Compact view of a quantum task found by SearchQuantumTasks.
+
+    Attributes:
+        quantumTaskArn: The ARN of the task
+        status: The status of the task
+        deviceArn: The ARN of the device the task runs on
+        shots: Number of shots requested
+        createdAt: When the task was created
+        endedAt: When the task ended, if it has
+    """
+
+    quantumTaskArn: str
+    status: str
+    deviceArn: str
+    shots: int
+    createdAt: datetime
+    endedAt: Optional[datetime] = None
+
+
+class QuantumTaskEntry(BaseModel):
+    """Quantum task found by SearchQuantumTasks, with every field the API returned.
+
+    Attributes:
+        quantumTaskArn: The ARN of the task
+    """
+
+    model_config = ConfigDict(extra='allow')
+
+    quantumTaskArn: str
+
+
+class ResultsVisualization(BaseModel):
+    """Chart and description of quantum task results.
+
+    Attributes:
+        result: The task result, compact unless the full result was requested
+        description: Statistics and patterns of the measurement outcomes
+        ascii_visualization: Text histogram of the outcomes
+        visualization_file: Path of the chart image in the workspace
+        visualization_id: Content ID of the chart image
+        visualization_url: Jupyter server path that serves the chart image
+        usage_note: How to view the chart
+        visualization_data: Base64 PNG of the chart, only if requested
+    """
+
+    result: Union[TaskResultSummary, TaskResult]
+    description: Dict[str, Any]
+    ascii_visualization: str
+    visualization_file: str
+    visualization_id: Optional[str] = None
+    visualization_url: Optional[str] = None
+    usage_note: str
+    visualization_data: Optional[str] = None
+
+
+class ErrorResponse(BaseModel):
+    """Error reported by a tool instead of its result.
+
+    Attributes:
+        error: What went wrong
+    """
+
+    error: str
+
+
+class ShotChunk(BaseModel):
+    """Represents one slice of a shot budget that is split across tasks.
+
+    Attributes:
+        index: Position of the chunk in the execution plan
+        device_arn: The ARN of the device the chunk runs on
+        shots: Number of shots in the chunk
+    """
+
+    index: int
+    device_arn: str
+    shots: int
+
+
 class DeviceType(str, Enum):
     """Enumeration of device types."""
     
@@ -147,3 +352,270 @@ class DeviceInfo(BaseModel):
     paradigm: str
     max_shots: int
     supported_gates: List[str] = []
+
+
+class DeviceSummary(BaseModel):
+    """Compact view of a quantum device.
+
+    Attributes:
+        device_arn: The ARN of the device
+        device_name: The name of the device
+        device_type: The type of the device (QPU or SIMULATOR)
+        provider_name: The provider of the device
+        status: The current status of the device
+        qubits: Number of qubits supported by the device
+        num_supported_gates: Number of gates supported by the device
+    """
+
+    device_arn: str
+    device_name: str
+    device_type: DeviceType
+    provider_name: str
+    status: str
+    qubits: int
+    num_supported_gates: int = 0
+
+
+class DeviceRanking(BaseModel):
+    """Ranking of a device for running a specific circuit.
+
+    Attributes:
+        device_arn: The ARN of the device
+        device_name: The name of the device
+        provider_name: The provider of the device
+        device_type: The type of the device (QPU or SIMULATOR)
+        fits: Whether the device can run the circuit
+        reasons: Why the device cannot run the circuit (empty if it fits)
+        qubits: Number of qubits supported by the device
+        queue_depth: Number of quantum tasks waiting on the device
+        available_now: Whether the device is inside an execution window
+        seconds_until_available: Seconds until the next execution window opens
+        historical_turnaround: Median turnaround of our completed tasks (in seconds)
+        estimated_turnaround: Estimated time until a new task completes (in seconds)
+    """
+
+    device_arn: str
+    device_name: str
+    provider_name: str
+    device_type: DeviceType
+    fits: bool
+    reasons: List[str] = []
+    qubits: int
+    queue_depth: int
+    available_now: bool
+    seconds_until_available: Optional[float] = None
+    historical_turnaround: Optional[float] = None
+    estimated_turnaround: Optional[float] = None
+
+
+class OptimizationConfig(BaseModel):
+    """Configuration of the circuit optimization pipeline.
+
+    Attributes:
+        passes: Names of the passes to run, in order
+        fold_basis: Euler basis used to re-synthesize single-qubit runs; the default
+            ZYZ basis emits rz and ry gates, which Braket devices accept directly
+        tolerance: Angle below which a merged rotation is treated as the identity
+        max_iterations: Maximum number of times the pass sequence is repeated
+    """
+
+    passes: List[str] = [
+        'remove_unmeasured_operations',
+        'cancel_inverses',
+        'merge_rotations',
+        'fold_single_qubit_runs',
+    ]
+    fold_basis: str = 'ZYZ'
+    tolerance: float = 1e-9
+    max_iterations: int = 3
+
+
+class CircuitMetrics(BaseModel):
+    """Size metrics of a quantum circuit.
+
+    Attributes:
+        gate_count: Number of gates, excluding measurements and barriers
+        two_qubit_gate_count: Number of gates acting on two or more qubits
+        depth: Circuit depth, excluding barriers
+        gate_counts: Number of gates of each type
+    """
+
+    gate_count: int
+    two_qubit_gate_count: int
+    depth: int
+    gate_counts: Dict[str, int] = {}
+
+
+class CircuitAnalysis(BaseModel):
+    """Dependency analysis of a quantum circuit.
+
+    Attributes:
+        depth: Number of layers when every gate runs as soon as its qubits are free
+        two_qubit_depth: Depth counting only gates on two or more qubits
+        gate_count: Number of gates, excluding barriers
+        two_qubit_gate_count: Number of gates acting on two or more qubits
+        duration_ns: Length of the critical path using typical gate durations (in nanoseconds)
+        critical_path: Indices of the gates on the longest chain of dependent gates, in order
+        qubit_idle_ns: Time each qubit spends waiting between the start and end of the circuit
+    """
+
+    depth: int
+    two_qubit_depth: int
+    gate_count: int
+    two_qubit_gate_count: int
+    duration_ns: float
+    critical_path: List[int] = []
+    qubit_idle_ns: List[float] = []
+
+
+class OptimizationReport(BaseModel):
+    """Report of a circuit optimization run.
+
+    Attributes:
+        before: Metrics of the input circuit
+        after: Metrics of the optimized circuit
+        passes: Metrics after the last run of each pass
+        skipped_reason: Why the circuit was not optimized (if it was not)
+    """
+
+    before: CircuitMetrics
+    after: CircuitMetrics
+    passes: Dict[str, CircuitMetrics] = {}
+    skipped_reason: Optional[str] = None
+
+
+class DedupHit(BaseModel):
+    """A submission that was served by an existing quantum task.
+
+    Attributes:
+        key: Content address of the submission (circuit, device and shots)
+        task_id: ID of the reused quantum task
+        device_arn: The ARN of the device
+        shots: Number of shots
+        age_seconds: Age of the reused task when it was reused (in seconds)
+        hit_at: When the submission was deduplicated (ISO 8601)
+    """
+
+    key: str
+    task_id: str
+    device_arn: str
+    shots: int
+    age_seconds: float
+    hit_at: str
+
+
+class LibraryCircuit(BaseModel):
+    """Summary of a generated library circuit program.
+
+    Attributes:
+        family: Circuit family (e.g. ghz, qft, w_state)
+        num_qubits: Number of qubits in the circuit
+        num_operations: Number of operations, including the barrier and measurements
+        size_bytes: Size of the OpenQASM 3.0 program
+        file_path: Where the program was written (if it was written to a file)
+    """
+
+    family: str
+    num_qubits: int
+    num_operations: int
+    size_bytes: int
+    file_path: Optional[str] = None
+
+
+class QasmValidationResult(BaseModel):
+    """Result of validating one OpenQASM 3.0 program.
+
+    Attributes:
+        name: File path relative to the workspace, or the program's position in the batch
+        valid: Whether the program parsed successfully
+        num_qubits: Number of qubits (if valid)
+        num_operations: Number of operations (if valid)
+        error: Parse or read error (if invalid)
+    """
+
+    name: str
+    valid: bool
+    num_qubits: Optional[int] = None
+    num_operations: Optional[int] = None
+    error: Optional[str] = None
+
+
+class CatalogEntry(BaseModel):
+    """A saved OpenQASM program in the workspace circuit catalog.
+
+    Attributes:
+        path: File path relative to the workspace
+        sha256: Hash of the file contents
+        size_bytes: File size
+        modified_at: File modification time (ISO 8601)
+        num_qubits: Number of qubits (if the program parses)
+        num_operations: Number of operations (if the program parses)
+        depth: Circuit depth (if known)
+        gate_counts: Number of gates of each type (if known)
+        tags: User-assigned tags
+        error: Parse error (if the program does not parse)
+    """
+
+    path: str
+    sha256: str
+    size_bytes: int
+    modified_at: str
+    num_qubits: Optional[int] = None
+    num_operations: Optional[int] = None
+    depth: Optional[int] = None
+    gate_counts: Optional[Dict[str, int]] = None
+    tags: List[str] = []
+    error: Optional[str] = None
+
+
+class LatencyStats(BaseModel):
+    """Latency and response size percentiles of a tool or traced operation.
+
+    Percentiles cover the most recent calls; call and error counts cover the
+    whole lifetime of the server.
+
+    Attributes:
+        name: Tool or span name
+        calls: Number of calls
+        errors: Number of calls that failed
+        p50_ms: Median latency (in milliseconds)
+        p95_ms: 95th percentile latency (in milliseconds)
+        p99_ms: 99th percentile latency (in milliseconds)
+        max_ms: Slowest call among the recent calls (in milliseconds)
+        p50_payload_bytes: Median size of the JSON response (tools only)
+        p95_payload_bytes: 95th percentile size of the JSON response (tools only)
+        max_payload_bytes: Largest JSON response among the recent calls (tools only)
+    """
+
+    name: str
+    calls: int
+    errors: int = 0
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    p50_payload_bytes: Optional[int] = None
+    p95_payload_bytes: Optional[int] = None
+    max_payload_bytes: Optional[int] = None
+
+
+class StoredVisualization(BaseModel):
+    """An image in the workspace visualization store.
+
+    Attributes:
+        sha256: Hash of the image contents
+        file: File name inside the store directory
+        size_bytes: File size
+        name: Name the image was first saved under
+        description: Description of the image
+        created_at: When the image was first saved (Unix time)
+        last_used_at: When the image was last saved (Unix time)
+    """
+
+    sha256: str
+    file: str
+    size_bytes: int
+    name: str
+    description: str = ""
+    created_at: float
+    last_used_at: float
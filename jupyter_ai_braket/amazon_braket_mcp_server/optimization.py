@@ -0,0 +1,318 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+
+"""Gate-count reducing optimization passes applied before submission.
+
+Gate count and depth drive both cost and fidelity on QPUs. The passes here are
+cheap peephole rewrites on Qiskit circuits that never change measured outcomes:
+
+- remove_unmeasured_operations: drop gates whose effect cannot reach any
+  measurement, such as gates after a qubit's final measurement
+- cancel_inverses: remove adjacent gate pairs that multiply to the identity
+- merge_rotations: combine adjacent rotations about the same axis
+- fold_single_qubit_runs: replace runs of single-qubit gates with one gate
+
+Each pass works in a single forward or backward sweep using per-qubit stacks
+of the most recent kept operation, so cancellations cascade (h x x h -> empty).
+"""
+
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+from qiskit import QuantumCircuit as QiskitCircuit
+from qiskit.circuit import CONTROL_FLOW_OP_NAMES, CircuitInstruction
+from qiskit.quantum_info import Operator
+from qiskit.synthesis import OneQubitEulerDecomposer
+
+from .models import CircuitMetrics, OptimizationConfig, OptimizationReport
+
+
+# Gates that are their own inverse
+SELF_INVERSE_GATES = {'id', 'h', 'x', 'y', 'z', 'cx', 'cy', 'cz', 'ch', 'swap', 'ccx', 'ccz', 'cswap'}
+
+# Pairs of distinct gates that are each other's inverse
+INVERSE_GATE_PAIRS = {
+    ('s', 'sdg'), ('sdg', 's'),
+    ('t', 'tdg'), ('tdg', 't'),
+    ('sx', 'sxdg'), ('sxdg', 'sx'),
+    ('cs', 'csdg'), ('csdg', 'cs'),
+}
+
+# Gates whose action does not depend on the order of their qubits
+SYMMETRIC_GATES = {'cz', 'swap', 'ccz', 'cp', 'rxx', 'ryy', 'rzz'}
+
+# Rotations that compose additively, with the angle period after which they
+# are the identity up to global phase
+ROTATION_PERIODS = {
+    'rx': 2 * math.pi, 'ry': 2 * math.pi, 'rz': 2 * math.pi, 'p': 2 * math.pi,
+    'rxx': 2 * math.pi, 'ryy': 2 * math.pi, 'rzz': 2 * math.pi,
+    'cp': 2 * math.pi, 'crx': 4 * math.pi, 'cry': 4 * math.pi, 'crz': 4 * math.pi,
+}
+
+# Operations that never take part in a rewrite
+NON_UNITARY_OPERATIONS = {'measure', 'reset', 'barrier', 'delay'}
+
+# Combine callback: returns None to keep both operations, or the list of
+# operations that replaces the pair (empty when they cancel)
+CombineFn = Callable[[CircuitInstruction, CircuitInstruction], Optional[List[CircuitInstruction]]]
+
+
+def circuit_metrics(circuit: QiskitCircuit) -> CircuitMetrics:
+    """Measure the gate counts and depth of a circuit.
+
+    Args:
+        circuit: Qiskit quantum circuit
+
+    Returns:
+        CircuitMetrics: Gate counts (excluding measurements and barriers) and depth
+    """
+    gate_counts = {
+        name: count for name, count in circuit.count_ops().items()
+        if name not in NON_UNITARY_OPERATIONS
+    }
+    two_qubit_gates = sum(
+        1 for instruction in circuit.data
+        if len(instruction.qubits) >= 2 and instruction.operation.name not in NON_UNITARY_OPERATIONS
+    )
+    return CircuitMetrics(
+        gate_count=sum(gate_counts.values()),
+        two_qubit_gate_count=two_qubit_gates,
+        depth=circuit.depth(lambda instruction: instruction.operation.name != 'barrier'),
+        gate_counts=gate_counts,
+    )
+
+
+def _same_qubits(a: CircuitInstruction, b: CircuitInstruction) -> bool:
+    """Check whether two operations act on the same qubits, in an equivalent order."""
+    if a.qubits == b.qubits:
+        return True
+    return a.operation.name in SYMMETRIC_GATES and set(a.qubits) == set(b.qubits)
+
+
+def _is_rewritable(instruction: CircuitInstruction) -> bool:
+    """Check whether an operation is a plain unitary gate."""
+    operation = instruction.operation
+    return (
+        operation.name not in NON_UNITARY_OPERATIONS
+        and not instruction.clbits
+        and all(isinstance(param, (int, float)) for param in operation.params)
+    )
+
+
+def _peephole(circuit: QiskitCircuit, combine: CombineFn) -> QiskitCircuit:
+    """Rewrite adjacent operation pairs with a combine callback.
+
+    Two operations are adjacent when the earlier one is the most recent kept
+    operation on every qubit of the later one.
+    """
+    kept: List[Optional[CircuitInstruction]] = []
+    stacks: Dict[object, List[int]] = {qubit: [] for qubit in circuit.qubits}
+
+    for instruction in circuit.data:
+        tops = {stacks[qubit][-1] if stacks[qubit] else None for qubit in instruction.qubits}
+        previous_index = tops.pop() if len(tops) == 1 else None
+        previous = kept[previous_index] if previous_index is not None else None
+
+        replacement = None
+        if (
+            previous is not None
+            and len(previous.qubits) == len(instruction.qubits)
+            and _is_rewritable(previous)
+            and _is_rewritable(instruction)
+        ):
+            replacement = combine(previous, instruction)
+
+        if replacement is None:
+            kept.append(instruction)
+            for qubit in instruction.qubits:
+                stacks[qubit].append(len(kept) - 1)
+        elif not replacement:
+            kept[previous_index] = None
+            for qubit in previous.qubits:
+                stacks[qubit].pop()
+        else:
+            kept[previous_index] = replacement[0]
+
+    optimized = circuit.copy_empty_like()
+    for instruction in kept:
+        if instruction is not None:
+            optimized.append(instruction)
+    return optimized
+
+
+def _combine_inverses(previous: CircuitInstruction, current: CircuitInstruction) -> Optional[List[CircuitInstruction]]:
+    """Cancel a gate followed by its inverse."""
+    a, b = previous.operation.name, current.operation.name
+    if previous.operation.params or current.operation.params:
+        return None
+    if a == b and a in SELF_INVERSE_GATES and _same_qubits(previous, current):
+        return []
+    if (a, b) in INVERSE_GATE_PAIRS and previous.qubits == current.qubits:
+        return []
+    return None
+
+
+def _combine_rotations(
+    previous: CircuitInstruction,
+    current: CircuitInstruction,
+    tolerance: float,
+) -> Optional[List[CircuitInstruction]]:
+    """Merge two rotations about the same axis, dropping the result if it is the identity."""
+    name = current.operation.name
+    if name != previous.operation.name or name not in ROTATION_PERIODS or not _same_qubits(previous, current):
+        return None
+
+    angle = float(previous.operation.params[0]) + float(current.operation.params[0])
+    period = ROTATION_PERIODS[name]
+    remainder = math.remainder(angle, period)
+    if abs(remainder) <= tolerance:
+        return []
+
+    merged = previous.operation.copy()
+    merged.params = [angle]
+    return [previous.replace(operation=merged)]
+
+
+def cancel_inverses(circuit: QiskitCircuit, config: OptimizationConfig) -> QiskitCircuit:
+    """Remove adjacent pairs of gates that are each other's inverse."""
+    return _peephole(circuit, _combine_inverses)
+
+
+def merge_rotations(circuit: QiskitCircuit, config: OptimizationConfig) -> QiskitCircuit:
+    """Combine adjacent rotations about the same axis on the same qubits."""
+    return _peephole(circuit, lambda a, b: _combine_rotations(a, b, config.tolerance))
+
+
+def remove_unmeasured_operations(circuit: QiskitCircuit, config: OptimizationConfig) -> QiskitCircuit:
+    """Remove gates whose effect cannot reach any measurement.
+
+    A backward sweep tracks the qubits that still feed a later measurement. A
+    gate that touches none of them (for example a gate after a qubit's final
+    measurement, or on a qubit that is never measured or entangled with a
+    measured one) is dropped. Circuits without measurements are returned
+    unchanged, since their full state may be observed through result types.
+    """
+    if not any(instruction.operation.name == 'measure' for instruction in circuit.data):
+        return circuit
+
+    live = set()
+    kept = []
+    for instruction in reversed(circuit.data):
+        name = instruction.operation.name
+        if name in ('measure', 'reset') or instruction.clbits:
+            live.update(instruction.qubits)
+            kept.append(instruction)
+        elif name in ('barrier', 'delay'):
+            kept.append(instruction)
+        elif live.intersection(instruction.qubits):
+            live.update(instruction.qubits)
+            kept.append(instruction)
+
+    optimized = circuit.copy_empty_like()
+    for instruction in reversed(kept):
+        optimized.append(instruction)
+    return optimized
+
+
+def fold_single_qubit_runs(circuit: QiskitCircuit, config: OptimizationConfig) -> QiskitCircuit:
+    """Replace runs of consecutive single-qubit gates with an equivalent shorter sequence.
+
+    Each maximal run on a qubit is multiplied out and re-synthesized in the
+    configured Euler basis (at most rz, ry, rz by default). The run is replaced
+    only if the synthesized sequence is shorter; runs that multiply to the
+    identity are removed.
+    """
+    decomposer = OneQubitEulerDecomposer(config.fold_basis)
+    # Each slot holds the operations that replace one input operation
+    output: List[List[CircuitInstruction]] = []
+    runs: Dict[object, List[int]] = {}
+
+    def flush(qubit) -> None:
+        indices = runs.pop(qubit, [])
+        if len(indices) < 2:
+            return
+        run = QiskitCircuit(1)
+        for index in indices:
+            run.append(output[index][0].operation, [0])
+        synthesized = decomposer(Operator(run).data)
+        if len(synthesized.data) >= len(indices):
+            return
+        for index in indices:
+            output[index] = []
+        output[indices[0]] = [
+            CircuitInstruction(instruction.operation, (qubit,), ()) for instruction in synthesized.data
+        ]
+
+    for instruction in circuit.data:
+        if len(instruction.qubits) == 1 and _is_rewritable(instruction):
+            runs.setdefault(instruction.qubits[0], []).append(len(output))
+            output.append([instruction])
+            continue
+        for qubit in instruction.qubits:
+            flush(qubit)
+        output.append([instruction])
+    for qubit in list(runs):
+        flush(qubit)
+
+    optimized = circuit.copy_empty_like()
+    for instructions in output:
+        for instruction in instructions:
+            optimized.append(instruction)
+    return optimized
+
+
+OPTIMIZATION_PASSES: Dict[str, Callable[[QiskitCircuit, OptimizationConfig], QiskitCircuit]] = {
+    'remove_unmeasured_operations': remove_unmeasured_operations,
+    'cancel_inverses': cancel_inverses,
+    'merge_rotations': merge_rotations,
+    'fold_single_qubit_runs': fold_single_qubit_runs,
+}
+
+
+def optimize_circuit(
+    circuit: QiskitCircuit,
+    config: Optional[OptimizationConfig] = None,
+) -> Tuple[QiskitCircuit, OptimizationReport]:
+    """Run the configured optimization passes on a circuit.
+
+    Args:
+        circuit: Qiskit quantum circuit
+        config: Passes and options to use (defaults to all passes)
+
+    Returns:
+        Tuple[QiskitCircuit, OptimizationReport]: The optimized circuit and a
+        report of gate counts and depth before and after each pass
+
+    Raises:
+        ValueError: If the configuration names an unknown pass
+    """
+    config = config or OptimizationConfig()
+    unknown = [name for name in config.passes if name not in OPTIMIZATION_PASSES]
+    if unknown:
+        raise ValueError(f"Unknown optimization passes: {', '.join(unknown)}. Available: {sorted(OPTIMIZATION_PASSES)}")
+
+    before = circuit_metrics(circuit)
+    if any(instruction.operation.name in CONTROL_FLOW_OP_NAMES for instruction in circuit.data):
+        # Classical control flow is not analysed; submit such circuits unchanged
+        return circuit, OptimizationReport(before=before, after=before, passes={}, skipped_reason='control flow')
+
+    pass_metrics = {}
+    optimized = circuit
+    for _ in range(config.max_iterations):
+        previous_size = optimized.size()
+        for name in config.passes:
+            optimized = OPTIMIZATION_PASSES[name](optimized, config)
+            pass_metrics[name] = circuit_metrics(optimized)
+        if optimized.size() == previous_size:
+            break
+
+    return optimized, OptimizationReport(before=before, after=circuit_metrics(optimized), passes=pass_metrics)
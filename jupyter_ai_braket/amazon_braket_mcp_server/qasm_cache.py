@@ -0,0 +1,173 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+
+"""Cache of parsed OpenQASM 3.0 programs.
+
+During an agent loop the same program is often validated, drawn and analysed
+several times. Parsing with `qasm3.loads` and drawing with `circuit.draw` are the
+expensive steps, so parsed circuits and their diagrams are kept in an LRU cache
+keyed by a hash of the normalized program text.
+
+Cached circuits are shared between callers and must not be modified in place.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple
+
+from qiskit import QuantumCircuit as QiskitCircuit, qasm3
+
+from .diagrams import DEFAULT_DIAGRAM_CHAR_BUDGET, render_diagram
+from .hashing import sha256_text
+from .models import DiagramMode
+from .tracing import get_tracer
+
+
+# Rendered diagrams kept per parsed program, one per distinct set of options
+MAX_DIAGRAMS_PER_PROGRAM = 8
+
+_BLOCK_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+_LINE_COMMENT = re.compile(r'//[^\n]*')
+_WHITESPACE = re.compile(r'[ \t\r\f\v]+')
+
+
+def normalize_qasm(qasm_program: str) -> str:
+    """Normalize an OpenQASM program so that formatting changes hash the same.
+
+    Comments, blank lines and repeated whitespace are removed; statements and
+    their order are unchanged.
+
+    Args:
+        qasm_program: OpenQASM 3.0 program
+
+    Returns:
+        str: The normalized program
+    """
+    text = _LINE_COMMENT.sub('', _BLOCK_COMMENT.sub('', qasm_program))
+    lines = (_WHITESPACE.sub(' ', line).strip() for line in text.split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+class ParsedQasm:
+    """A parsed OpenQASM program with its counts and lazily rendered diagrams."""
+
+    def __init__(self, key: str, circuit: QiskitCircuit):
+        """Initialize the entry.
+
+        Args:
+            key: Hash of the normalized program
+            circuit: The parsed circuit
+        """
+        self.key = key
+        self.circuit = circuit
+        self.num_qubits = circuit.num_qubits
+        self.num_operations = len(circuit.data)
+        self._diagrams: 'OrderedDict[tuple, Tuple[str, DiagramMode]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def diagram(self) -> str:
+        """Full ASCII diagram of the circuit, rendered on first use."""
+        return self.render(DiagramMode.FULL)[0]
+
+    def render(
+        self,
+        mode: DiagramMode = DiagramMode.AUTO,
+        fold: int = 80,
+        layers: int = 10,
+        qubits: Optional[Sequence[int]] = None,
+        max_chars: int = DEFAULT_DIAGRAM_CHAR_BUDGET,
+    ) -> Tuple[str, DiagramMode]:
+        """Render a diagram of the circuit, reusing earlier renders with the same options.
+
+        See `diagrams.render_diagram` for the arguments.
+
+        Returns:
+            Tuple[str, DiagramMode]: The diagram and the mode that was used
+        """
+        key = (DiagramMode(mode), fold, layers, tuple(qubits) if qubits else None, max_chars)
+        with get_tracer().span('qasm.render', mode=key[0].value) as span, self._lock:
+            span.set_attribute('cache_hit', key in self._diagrams)
+            if key not in self._diagrams:
+                self._diagrams[key] = render_diagram(self.circuit, key[0], fold, layers, qubits, max_chars)
+                while len(self._diagrams) > MAX_DIAGRAMS_PER_PROGRAM:
+                    self._diagrams.popitem(last=False)
+            self._diagrams.move_to_end(key)
+            return self._diagrams[key]
+
+
+class ParsedQasmCache:
+    """Thread-safe LRU cache of parsed OpenQASM programs."""
+
+    def __init__(self, max_entries: int = 128):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of parsed programs to keep
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, ParsedQasm]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def parse(self, qasm_program: str) -> ParsedQasm:
+        """Parse a program, or return the cached parse of an equivalent program.
+
+        Args:
+            qasm_program: OpenQASM 3.0 program
+
+        Returns:
+            ParsedQasm: The parsed program
+
+        Raises:
+            Exception: Any error raised by `qasm3.loads` for invalid programs
+        """
+        with get_tracer().span('qasm.parse', size_bytes=len(qasm_program)) as span:
+            key = sha256_text(normalize_qasm(qasm_program))
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    span.set_attribute('cache_hit', True)
+                    return entry
+                self.misses += 1
+            span.set_attribute('cache_hit', False)
+
+            # Parse outside the lock; a concurrent parse of the same program is harmless
+            entry = ParsedQasm(key, qasm3.loads(qasm_program))
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return entry
+
+    def clear(self) -> None:
+        """Drop all cached programs."""
+        with self._lock:
+            self._entries.clear()
+
+
+_shared_cache: Optional[ParsedQasmCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_parsed_qasm_cache() -> ParsedQasmCache:
+    """Get the parsed-QASM cache shared by the whole process."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ParsedQasmCache()
+        return _shared_cache
@@ -0,0 +1,245 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+
+"""Shared, throttling-aware rate limiting for Amazon Braket API calls.
+
+Every Braket API call made through a BraketService client first takes a token
+from a per-API token bucket. Buckets serve two priority lanes: interactive
+calls (a chat user waiting on a tool) are always served before bulk calls
+(batch submissions and background polling). Calls that are throttled anyway
+are retried by the limiter with exponential backoff and full jitter, so
+individual callers never implement their own retry loops.
+"""
+
+import contextvars
+import random
+import threading
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from botocore.exceptions import ClientError
+from loguru import logger
+
+from .exceptions import ThrottlingError
+
+
+T = TypeVar('T')
+
+# Error codes AWS uses to signal throttling
+THROTTLING_ERROR_CODES = {
+    'ThrottlingException',
+    'Throttling',
+    'TooManyRequestsException',
+    'RequestLimitExceeded',
+    'ProvisionedThroughputExceededException',
+}
+
+# Sustained requests per second and burst size per Braket API. These stay below
+# the default per-account Braket quotas so that several users sharing an account
+# do not push each other into throttling.
+DEFAULT_API_LIMITS: Dict[str, Tuple[float, int]] = {
+    'CreateQuantumTask': (10.0, 20),
+    'GetQuantumTask': (50.0, 100),
+    'SearchQuantumTasks': (4.0, 8),
+    'CancelQuantumTask': (2.0, 4),
+    'GetDevice': (4.0, 8),
+    'SearchDevices': (4.0, 8),
+}
+DEFAULT_LIMIT: Tuple[float, int] = (5.0, 10)
+
+
+class Priority(IntEnum):
+    """Priority lanes for API calls; lower values are served first."""
+
+    INTERACTIVE = 0
+    BULK = 1
+
+
+_current_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    'braket_api_priority', default=Priority.INTERACTIVE
+)
+
+
+class TokenBucket:
+    """A thread-safe token bucket with priority lanes."""
+
+    def __init__(self, rate: float, capacity: int):
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (the burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._waiting = {priority: 0 for priority in Priority}
+        self._condition = threading.Condition()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _has_priority(self, priority: Priority) -> bool:
+        return all(self._waiting[other] == 0 for other in Priority if other < priority)
+
+    def acquire(self, priority: Priority = Priority.INTERACTIVE, timeout: Optional[float] = None) -> bool:
+        """Take one token, blocking until one is available.
+
+        Args:
+            priority: Lane of the caller. Callers in a lower lane wait while any
+                caller in a higher lane is waiting.
+            timeout: Maximum time to wait (in seconds); None waits indefinitely
+
+        Returns:
+            bool: True if a token was taken, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._waiting[priority] += 1
+            try:
+                while True:
+                    self._refill()
+                    if self._tokens >= 1 and self._has_priority(priority):
+                        self._tokens -= 1
+                        return True
+
+                    wait = max((1 - self._tokens) / self.rate, 0.001)
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return False
+                        wait = min(wait, remaining)
+                    self._condition.wait(wait)
+            finally:
+                self._waiting[priority] -= 1
+                self._condition.notify_all()
+
+
+class RateLimiter:
+    """Per-API token buckets plus retry with jitter for throttled calls."""
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 20.0,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            limits: (requests per second, burst) per API operation name, merged
+                over DEFAULT_API_LIMITS
+            max_retries: Maximum retries of a throttled call
+            base_delay: Backoff before the first retry (in seconds)
+            max_delay: Maximum backoff between retries (in seconds)
+        """
+        self.limits = {**DEFAULT_API_LIMITS, **(limits or {})}
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self.throttled_calls = 0
+
+    def bucket(self, operation_name: str) -> TokenBucket:
+        """Get the bucket for an API operation, creating it on first use."""
+        with self._lock:
+            if operation_name not in self._buckets:
+                rate, capacity = self.limits.get(operation_name, DEFAULT_LIMIT)
+                self._buckets[operation_name] = TokenBucket(rate, capacity)
+            return self._buckets[operation_name]
+
+    def acquire(self, operation_name: str) -> None:
+        """Take a token for an API operation in the caller's priority lane."""
+        self.bucket(operation_name).acquire(_current_priority.get())
+
+    @contextmanager
+    def lane(self, priority: Priority):
+        """Run API calls made in this context in the given priority lane.
+
+        The lane is stored in a context variable, so it applies to the current
+        thread or task only. Worker threads must enter the lane themselves.
+        """
+        token = _current_priority.set(priority)
+        try:
+            yield
+        finally:
+            _current_priority.reset(token)
+
+    def instrument_client(self, client: Any) -> Any:
+        """Make every API call of a boto3 client take a token first.
+
+        Args:
+            client: A boto3 client
+
+        Returns:
+            The same client, for chaining
+        """
+        def before_call(model, **kwargs):
+            self.acquire(model.name)
+
+        service_id = client.meta.service_model.service_id.hyphenize()
+        client.meta.events.register(f'before-call.{service_id}', before_call)
+        return client
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call a function, retrying with backoff and jitter if it is throttled.
+
+        Args:
+            fn: Function that makes one or more Braket API calls
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            The function's return value
+
+        Raises:
+            ThrottlingError: If the call is still throttled after all retries
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return fn(*args, **kwargs)
+            except ClientError as e:
+                code = e.response.get('Error', {}).get('Code', '')
+                if code not in THROTTLING_ERROR_CODES:
+                    raise
+                with self._lock:
+                    self.throttled_calls += 1
+                if attempt == self.max_retries:
+                    raise ThrottlingError(
+                        f"Amazon Braket is throttling requests ({code}) and the call did not succeed after "
+                        f"{self.max_retries} retries. Please wait a moment and try again."
+                    ) from e
+                # Full jitter: sleep a random time up to the exponential backoff
+                delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+                logger.warning(f"Throttled by Amazon Braket ({code}); retrying in {delay:.2f}s")
+                time.sleep(delay)
+        raise AssertionError('unreachable')
+
+
+_shared_rate_limiter: Optional[RateLimiter] = None
+_shared_rate_limiter_lock = threading.Lock()
+
+
+def get_shared_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter shared by all BraketService instances."""
+    global _shared_rate_limiter
+    with _shared_rate_limiter_lock:
+        if _shared_rate_limiter is None:
+            _shared_rate_limiter = RateLimiter()
+        return _shared_rate_limiter
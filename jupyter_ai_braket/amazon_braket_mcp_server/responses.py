@@ -0,0 +1,238 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Compact tool responses for Amazon Braket results and devices.
+
+Full task results carry every measured shot and the raw task metadata, and
+results visualizations carry a base64 PNG. Returned verbatim, these dominate
+the model's context while adding little to the answer. The helpers here build
+the default summary views and let callers ask for raw data explicitly, either
+with detail='full' or by naming the fields they need.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from .models import (
+    DetailLevel,
+    DeviceInfo,
+    DeviceSummary,
+    ErrorResponse,
+    QuantumTaskEntry,
+    QuantumTaskSummary,
+    ResultsVisualization,
+    TaskProgress,
+    TaskResult,
+    TaskResultFields,
+    TaskResultSummary,
+    WaitedTaskProgress,
+    WaitedTaskResult,
+    WaitedTaskResultFields,
+    WaitedTaskResultSummary,
+)
+from .visualization.histogram import top_k_counts
+
+
+# Most frequent outcomes kept in a summary; the rest are folded into `other_shots`
+MAX_SUMMARY_OUTCOMES = 16
+
+
+def parse_detail(detail: str) -> DetailLevel:
+    """Parse a detail level given as a tool argument.
+
+    Args:
+        detail: 'summary' or 'full' (case-insensitive)
+
+    Returns:
+        DetailLevel: The parsed detail level
+
+    Raises:
+        ValueError: If the detail level is unknown
+    """
+    try:
+        return DetailLevel(str(detail).lower())
+    except ValueError:
+        valid = ', '.join(level.value for level in DetailLevel)
+        raise ValueError(f"Unknown detail level '{detail}', expected one of: {valid}")
+
+
+def select_fields(data: Dict[str, Any], fields: Sequence[str], always: Sequence[str] = ()) -> Dict[str, Any]:
+    """Keep only the requested fields of a response.
+
+    Args:
+        data: The response to filter
+        fields: Names of the fields to keep
+        always: Fields kept even if they are not requested (e.g. identifiers)
+
+    Returns:
+        Dict[str, Any]: The filtered response, in the order of `data`
+
+    Raises:
+        ValueError: If a requested field does not exist
+    """
+    unknown = sorted(set(fields) - set(data))
+    if unknown:
+        raise ValueError(
+            f"Unknown field(s): {', '.join(unknown)}. Available fields: {', '.join(sorted(data))}"
+        )
+    wanted = set(fields) | set(always)
+    return {key: value for key, value in data.items() if key in wanted}
+
+
+def summarize_task_result(result: TaskResult, max_outcomes: int = MAX_SUMMARY_OUTCOMES) -> TaskResultSummary:
+    """Build the compact view of a task result.
+
+    Args:
+        result: The full task result
+        max_outcomes: Number of most frequent outcomes to keep
+
+    Returns:
+        TaskResultSummary: Totals and the most frequent outcomes, without per-shot data
+    """
+    counts = result.counts or {}
+    top, _, other_shots = top_k_counts(counts, max_outcomes)
+    return TaskResultSummary(
+        task_id=result.task_id,
+        status=result.status,
+        device=result.device,
+        shots=result.shots,
+        execution_time=result.execution_time,
+        counts=dict(top) if counts else None,
+        num_outcomes=len(counts),
+        other_shots=other_shots,
+        most_likely=top[0][0] if top else None,
+        has_measurements=bool(result.measurements),
+        metadata_keys=sorted(result.metadata or {}),
+    )
+
+
+def shape_task_result(
+    result: TaskResult,
+    detail: str = DetailLevel.SUMMARY.value,
+    fields: Optional[List[str]] = None,
+) -> Union[TaskResultSummary, TaskResult, TaskResultFields]:
+    """Build a task result response at the requested level of detail.
+
+    Args:
+        result: The full task result
+        detail: 'summary' for totals and top counts, 'full' for everything
+        fields: If given, return only these fields (plus task_id). Any field of
+                the full or summary view may be named, e.g. ['measurements'].
+
+    Returns:
+        Union[TaskResultSummary, TaskResult, TaskResultFields]: The response
+    """
+    level = parse_detail(detail)
+    if fields:
+        # Full values win over their truncated summary counterparts
+        available = {**summarize_task_result(result).model_dump(), **result.model_dump()}
+        return TaskResultFields(**select_fields(available, fields, always=('task_id',)))
+    if level == DetailLevel.FULL:
+        return result
+    return summarize_task_result(result)
+
+
+_WAITED_MODELS = {
+    TaskResultSummary: WaitedTaskResultSummary,
+    TaskResult: WaitedTaskResult,
+    TaskResultFields: WaitedTaskResultFields,
+    TaskProgress: WaitedTaskProgress,
+}
+
+
+def add_wait(
+    response: Union[TaskResultSummary, TaskResult, TaskResultFields, TaskProgress],
+    waited_seconds: float,
+    timed_out: bool,
+) -> Union[WaitedTaskResultSummary, WaitedTaskResult, WaitedTaskResultFields, WaitedTaskProgress]:
+    """Add how long a task was waited for to a task result or progress response."""
+    return _WAITED_MODELS[type(response)](
+        **response.model_dump(), waited_seconds=round(waited_seconds, 1), timed_out=timed_out,
+    )
+
+
+def task_result_from_response(result: Dict[str, Any]) -> TaskResult:
+    """Rebuild a task result from a get_task_result response for analysis.
+
+    Statistics and histograms need every outcome, so summaries whose counts
+    leave out the least frequent outcomes are rejected.
+
+    Args:
+        result: A full response, or one with at least status, device, shots
+            and counts
+
+    Returns:
+        TaskResult: The task result
+
+    Raises:
+        ValueError: If the counts of the response are truncated
+    """
+    other_shots = result.get('other_shots') or 0
+    if other_shots:
+        raise ValueError(
+            f"The counts of this result leave out {other_shots} of {result.get('shots')} shots. "
+            f"Pass the result of get_task_result with detail='full' or "
+            f"fields=['status', 'device', 'shots', 'counts'] instead of the summary."
+        )
+    return TaskResult(
+        task_id=result.get('task_id'),
+        status=result.get('status'),
+        measurements=result.get('measurements'),
+        counts=result.get('counts'),
+        device=result.get('device'),
+        shots=result.get('shots'),
+        execution_time=result.get('execution_time'),
+        metadata=result.get('metadata'),
+    )
+
+
+def summarize_device(device: DeviceInfo) -> DeviceSummary:
+    """Build the compact view of a device, without its gate list."""
+    return DeviceSummary(
+        device_arn=device.device_arn,
+        device_name=device.device_name,
+        device_type=device.device_type,
+        provider_name=device.provider_name,
+        status=device.status,
+        qubits=device.qubits,
+        num_supported_gates=len(device.supported_gates),
+    )
+
+
+def shape_task_search_entry(
+    task: Dict[str, Any],
+    detail: str = DetailLevel.SUMMARY.value,
+) -> Union[QuantumTaskSummary, QuantumTaskEntry]:
+    """Build a `SearchQuantumTasks` entry at the requested level of detail.
+
+    The summary drops output locations and tags.
+    """
+    if parse_detail(detail) == DetailLevel.FULL:
+        return QuantumTaskEntry(**task)
+    return QuantumTaskSummary.model_validate(task)
+
+
+def shape_results_visualization(
+    response: Dict[str, Any],
+    detail: str = DetailLevel.SUMMARY.value,
+    include_image: bool = False,
+) -> Union[ResultsVisualization, ErrorResponse]:
+    """Build a results visualization response at the requested level of detail.
+
+    The base64 PNG is left out unless `include_image` is set; the image is
+    referenced by `visualization_id` and `visualization_url` instead. The
+    summary also replaces the embedded result with its compact view.
+    """
+    if 'error' in response:
+        return ErrorResponse(error=response['error'])
+    shaped = {key: value for key, value in response.items() if include_image or key != 'visualization_data'}
+    result = TaskResult(**response['result'])
+    shaped['result'] = result if parse_detail(detail) == DetailLevel.FULL else summarize_task_result(result)
+    return ResultsVisualization(**shaped)
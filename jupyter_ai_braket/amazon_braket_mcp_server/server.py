@@ -9,27 +9,78 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
 # and limitations under the License.
 
-"""awslabs braket MCP Server implementation."""
-
+"""awslabs braket MCP Server implementation.
+
+Qiskit, boto3 and the Braket SDK take seconds to import. They are imported on
+first use (or by the warm-up started in `main`), so the server answers
+the MCP handshake and `list_tools` without waiting for them.
+"""
+
+import argparse
+import asyncio
+import contextvars
+import functools
+import hmac
+import importlib
 import os
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
-
-from qiskit import QuantumCircuit as QiskitCircuit, qasm3
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, TypeVar, Union, Any
 
 from .models import (
     QuantumCircuit,
     Gate,
-    TaskResult,
     TaskStatus,
     DeviceInfo,
+    DetailLevel,
     DeviceType,
+    DiagramMode,
+    DeviceSummary,
+    ErrorResponse,
+    OptimizationConfig,
+    QuantumTaskEntry,
+    QuantumTaskSummary,
+    ResultsVisualization,
+    TaskResult,
+    TaskResultFields,
+    TaskResultSummary,
+    WaitedTaskProgress,
+    WaitedTaskResult,
+    WaitedTaskResultFields,
+    WaitedTaskResultSummary,
 )
-from .braket_service import BraketService
+from .batch_validation import validate_qasm_files, validate_qasm_programs
+from .circuit_library import generate_qasm, write_qasm
+from .hashing import json_hash
+from .rate_limiting import Priority
+from .responses import (
+    add_wait,
+    parse_detail,
+    shape_results_visualization,
+    shape_task_result,
+    shape_task_search_entry,
+    summarize_device,
+    task_result_from_response,
+)
+from .tracing import get_tracer
+from .visualization.histogram import DEFAULT_TOP_K, parse_binning
+from .visualization.plot_renderer import get_plot_renderer
+from .workspace import default_workspace_dir, resolve_workspace_dir
+import pydantic_core
 from loguru import logger
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit as QiskitCircuit
+
+    from .braket_service import BraketService
+    from .circuit_catalog import CircuitCatalog
+    from .qasm_cache import ParsedQasm
 
 
 # Remove all default handlers then add our own
@@ -45,28 +96,265 @@ mcp = FastMCP(
 
 # Global variable to hold the braket service instance
 _braket_service = None
+_braket_service_lock = threading.Lock()
+
+# Request headers that scope a shared HTTP server to one user's region,
+# workspace and AWS credentials
+REGION_HEADER = 'x-braket-region'
+WORKSPACE_HEADER = 'x-braket-workspace-dir'
+ACCESS_KEY_ID_HEADER = 'x-aws-access-key-id'
+SECRET_ACCESS_KEY_HEADER = 'x-aws-secret-access-key'
+SESSION_TOKEN_HEADER = 'x-aws-session-token'
+
+# Set to 1 to let HTTP requests without AWS credential headers act under this
+# process's own AWS identity
+ALLOW_DEFAULT_CREDENTIALS_ENV = 'BRAKET_MCP_ALLOW_DEFAULT_CREDENTIALS'
+
+# Services created for scoped requests, least recently used first
+_scoped_services: 'OrderedDict[str, BraketService]' = OrderedDict()
+MAX_SCOPED_SERVICES = int(os.environ.get('BRAKET_MCP_MAX_SCOPED_SERVICES', '32'))
+
+# Bounded pool for blocking boto3 and Qiskit work, so a slow call does not
+# stall the event loop and concurrent tool requests overlap
+_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get('BRAKET_MCP_MAX_WORKERS', '8')),
+    thread_name_prefix='braket-mcp',
+)
+
+T = TypeVar('T')
+
+# Modules imported by the warm-up, in the order tools usually need them
+WARMUP_MODULES = (
+    '.qasm_cache',
+    '.circuit_catalog',
+    '.braket_service',
+    'braket.aws',
+    'qiskit_braket_provider',
+)
+
+
+class ServiceScope(NamedTuple):
+    """Region, workspace and credentials requested by one HTTP client."""
+
+    region: Optional[str]
+    workspace_dir: Optional[str]
+    access_key_id: Optional[str]
+    secret_access_key: Optional[str]
+    session_token: Optional[str]
+
+
+def get_request_scope() -> Optional[ServiceScope]:
+    """Get the service scope requested by the current HTTP request.
+
+    HTTP requests must carry their own AWS credentials unless
+    BRAKET_MCP_ALLOW_DEFAULT_CREDENTIALS is set, so that clients of a shared
+    server cannot act under the identity of the process running it.
+
+    Returns:
+        Optional[ServiceScope]: The requested scope, or None outside an HTTP
+        request or if the request carries no scoping headers
+
+    Raises:
+        ValueError: If the request carries incomplete or no credentials, or
+            requests a workspace outside BRAKET_WORKSPACE_ROOT
+    """
+    try:
+        request = mcp.get_context().request_context.request
+    except (LookupError, ValueError):
+        return None
+    if request is None:
+        return None
+
+    headers = request.headers
+    scope = ServiceScope(
+        region=headers.get(REGION_HEADER),
+        workspace_dir=headers.get(WORKSPACE_HEADER),
+        access_key_id=headers.get(ACCESS_KEY_ID_HEADER),
+        secret_access_key=headers.get(SECRET_ACCESS_KEY_HEADER),
+        session_token=headers.get(SESSION_TOKEN_HEADER),
+    )
+    if bool(scope.access_key_id) != bool(scope.secret_access_key):
+        raise ValueError(f'Both {ACCESS_KEY_ID_HEADER} and {SECRET_ACCESS_KEY_HEADER} are required')
+    if not scope.access_key_id and not _allow_default_credentials():
+        raise ValueError(
+            f'Requests must carry {ACCESS_KEY_ID_HEADER} and {SECRET_ACCESS_KEY_HEADER}; '
+            f'set {ALLOW_DEFAULT_CREDENTIALS_ENV}=1 to use the server\'s own AWS credentials'
+        )
+    if not any(scope):
+        return None
+    if scope.workspace_dir:
+        scope = scope._replace(workspace_dir=resolve_workspace_dir(scope.workspace_dir))
+    return scope
+
+
+def _allow_default_credentials() -> bool:
+    return os.environ.get(ALLOW_DEFAULT_CREDENTIALS_ENV, '').strip().lower() in ('1', 'true', 'yes')
+
+
+def get_workspace_dir() -> str:
+    """Get the workspace directory of the current request."""
+    scope = get_request_scope()
+    return scope.workspace_dir if scope and scope.workspace_dir else default_workspace_dir()
+
+
+def _dedup_window_seconds() -> Optional[float]:
+    dedup_window = os.environ.get('BRAKET_DEDUP_WINDOW_SECONDS', '').strip()
+    return float(dedup_window) if dedup_window else None
+
+
+def _get_scoped_service(scope: ServiceScope) -> 'BraketService':
+    """Get or create the Braket service for a request scope."""
+    import boto3
+
+    from .braket_service import BraketService
+
+    key = json_hash(scope._asdict())
+    with _braket_service_lock:
+        service = _scoped_services.get(key)
+        if service is not None:
+            _scoped_services.move_to_end(key)
+            return service
+
+    region = scope.region or os.environ.get('AWS_REGION', None)
+    boto_session = None
+    if scope.access_key_id:
+        boto_session = boto3.Session(
+            aws_access_key_id=scope.access_key_id,
+            aws_secret_access_key=scope.secret_access_key,
+            aws_session_token=scope.session_token,
+            region_name=region,
+        )
+    logger.info(f'Creating scoped Braket service (region: {region}, workspace: {scope.workspace_dir})')
+    service = BraketService(
+        region_name=region,
+        workspace_dir=scope.workspace_dir or default_workspace_dir(),
+        dedup_window_seconds=_dedup_window_seconds(),
+        boto_session=boto_session,
+    )
+
+    with _braket_service_lock:
+        service = _scoped_services.setdefault(key, service)
+        _scoped_services.move_to_end(key)
+        while len(_scoped_services) > MAX_SCOPED_SERVICES:
+            _scoped_services.popitem(last=False)
+    return service
 
 
 def get_braket_service():
     """Lazily initialize the Braket service connection.
 
     This function ensures the service is only initialized when needed,
-    not at import time, which helps with testing.
+    not at import time, which helps with testing. Requests over HTTP that carry
+    scoping headers get a service for their own region, workspace and
+    credentials; all other requests share the default service.
 
     Returns:
         BraketService: The initialized Braket service instance
     """
+    scope = get_request_scope()
+    if scope is not None:
+        return _get_scoped_service(scope)
+
     global _braket_service
     if _braket_service is None:
-        region = os.environ.get('AWS_REGION', None)
-        workspace_dir = os.environ.get('BRAKET_WORKSPACE_DIR', os.getcwd())
-        logger.info(f'AWS_REGION: {region}')
-        logger.info(f'BRAKET_WORKSPACE_DIR: {workspace_dir}')
-        _braket_service = BraketService(region_name=region, workspace_dir=workspace_dir)
+        # Tools run on several worker threads; only one may create the service
+        with _braket_service_lock:
+            if _braket_service is None:
+                from .braket_service import BraketService
+
+                region = os.environ.get('AWS_REGION', None)
+                workspace_dir = default_workspace_dir()
+                logger.info(f'AWS_REGION: {region}')
+                logger.info(f'BRAKET_WORKSPACE_DIR: {workspace_dir}')
+                _braket_service = BraketService(
+                    region_name=region,
+                    workspace_dir=workspace_dir,
+                    dedup_window_seconds=_dedup_window_seconds(),
+                )
 
     return _braket_service
 
 
+async def run_blocking(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking function in the server's thread pool.
+
+    Context variables of the caller, such as the rate limiter's priority lane,
+    are carried over to the worker thread.
+
+    Args:
+        fn: Function to run
+        *args: Positional arguments for the function
+        **kwargs: Keyword arguments for the function
+
+    Returns:
+        The function's return value
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(_executor, functools.partial(context.run, fn, *args, **kwargs))
+
+
+# The helpers below import Qiskit on first use. Tools call them through
+# run_blocking, so that first import does not stall the event loop.
+
+def parse_qasm(qasm_program: str) -> 'ParsedQasm':
+    """Parse an OpenQASM 3.0 program through the shared parse cache."""
+    from .qasm_cache import get_parsed_qasm_cache
+
+    return get_parsed_qasm_cache().parse(qasm_program)
+
+
+def dump_qasm(circuit: 'QiskitCircuit') -> str:
+    """Serialize a Qiskit circuit as an OpenQASM 3.0 program."""
+    from qiskit import qasm3
+
+    return qasm3.dumps(circuit)
+
+
+def get_workspace_catalog(workspace_dir: str) -> 'CircuitCatalog':
+    """Get the circuit catalog of a workspace."""
+    from .circuit_catalog import get_circuit_catalog
+
+    return get_circuit_catalog(workspace_dir)
+
+
+def _is_error_response(result: Any) -> bool:
+    """Check whether a tool returned an error (tools report errors instead of raising)."""
+    if isinstance(result, list) and len(result) == 1:
+        result = result[0]
+    return isinstance(result, ErrorResponse) or (isinstance(result, dict) and 'error' in result)
+
+
+def traced_tool(name: str) -> Callable:
+    """Register an async function as an MCP tool whose calls are traced.
+
+    Each call runs in a 'tool.<name>' span, and its latency and JSON response
+    size are recorded for get_server_stats.
+
+    Args:
+        name: Tool name
+    """
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = get_tracer()
+            started = time.perf_counter()
+            try:
+                with tracer.span(f'tool.{name}') as span:
+                    result = await fn(*args, **kwargs)
+                    payload_bytes = len(pydantic_core.to_json(result, fallback=str))
+                    span.set_attribute('payload_bytes', payload_bytes)
+            except BaseException:
+                tracer.record_tool_call(name, time.perf_counter() - started, 0, error=True)
+                raise
+            tracer.record_tool_call(name, time.perf_counter() - started, payload_bytes, _is_error_response(result))
+            return result
+
+        return mcp.tool(name=name)(wrapper)
+
+    return decorator
+
+
 # Add default device ARN support
 def get_default_device_arn():
     """Get the default device ARN from environment or use SV1 simulator."""
@@ -77,56 +365,99 @@ def get_default_device_arn():
 
 
 @mcp.resource(uri='amazon-braket://devices', name='QuantumDevices', mime_type='application/json')
-def get_devices_resource() -> List[DeviceInfo]:
+async def get_devices_resource() -> List[DeviceInfo]:
     """Get the list of available quantum devices."""
-    return get_braket_service().list_devices()
-
-
-@mcp.tool(name='create_quantum_circuit')
-def create_quantum_circuit(qasm_program: str, filename: Optional[str] = None) -> Dict[str, Any]:
+    return await run_blocking(lambda: get_braket_service().list_devices())
+
+
+@traced_tool('create_quantum_circuit')
+async def create_quantum_circuit(
+    qasm_program: str,
+    filename: Optional[str] = None,
+    diagram_mode: str = 'auto',
+    diagram_layers: int = 10,
+    diagram_qubits: Optional[List[int]] = None,
+    diagram_fold: int = 80,
+    tags: Optional[List[str]] = None,
+) -> Dict[str, Any]:
     """Create a quantum circuit from an OpenQASM 3.0 program string.
 
     Args:
         qasm_program: String containing the OpenQASM 3.0 program
         filename: Optional filename for the .qasm file. If provided, the circuit is saved to this file.
                   If not provided, the circuit is only verified and visualized without saving.
+        diagram_mode: How to render the circuit diagram: 'auto' (default, keeps large circuits short),
+                      'full', 'folded', 'window' (first and last layers only) or 'summary' (no diagram)
+        diagram_layers: Number of layers shown at each end in 'window' mode
+        diagram_qubits: Optional list of qubit indices to draw; other qubits are left out
+        diagram_fold: Line width in 'folded' mode
+        tags: Optional tags stored with the saved file in the circuit catalog (see query_circuit_catalog)
 
     Returns:
         Dictionary containing the verification status, circuit diagram, and file path (if saved)
     """
+    return await run_blocking(
+        _create_quantum_circuit,
+        qasm_program,
+        filename,
+        diagram_mode,
+        diagram_layers,
+        diagram_qubits,
+        diagram_fold,
+        tags,
+    )
+
+
+def _create_quantum_circuit(
+    qasm_program: str,
+    filename: Optional[str] = None,
+    diagram_mode: str = 'auto',
+    diagram_layers: int = 10,
+    diagram_qubits: Optional[List[int]] = None,
+    diagram_fold: int = 80,
+    tags: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Verify, draw and optionally save an OpenQASM 3.0 program (blocking)."""
     try:
-        # Verify the QASM 3.0 program by loading it with qiskit
+        # Verify the QASM 3.0 program by loading it with qiskit (cached per normalized program)
         logger.info("Verifying OpenQASM 3.0 program...")
-        circuit = qasm3.loads(qasm_program)
-        logger.info(f"Successfully verified circuit with {circuit.num_qubits} qubits and {len(circuit.data)} operations")
+        parsed = parse_qasm(qasm_program)
+        logger.info(f"Successfully verified circuit with {parsed.num_qubits} qubits and {parsed.num_operations} operations")
 
-        # Generate ASCII rendering of the circuit
-        logger.info("Generating circuit ASCII visualization...")
-        ascii_diagram = circuit.draw(output='text')
+        # Render the circuit within the character budget (cached per options)
+        diagram, used_mode = parsed.render(
+            DiagramMode(diagram_mode), fold=diagram_fold, layers=diagram_layers, qubits=diagram_qubits
+        )
 
         # Prepare base response
         response = {
             'success': True,
-            'num_qubits': circuit.num_qubits,
-            'num_operations': len(circuit.data),
-            'circuit_diagram': str(ascii_diagram),
+            'num_qubits': parsed.num_qubits,
+            'num_operations': parsed.num_operations,
+            'circuit_diagram': diagram,
+            'diagram_mode': used_mode.value,
         }
 
         # Save to file if filename is provided
         if filename:
-            # Use current working directory
-            workspace_dir = Path(os.getcwd())
+            # Use the request's workspace, or the current working directory
+            workspace_dir = Path(get_workspace_dir())
 
             # Ensure the workspace directory exists
             workspace_dir.mkdir(parents=True, exist_ok=True)
 
-            # Construct the full file path
-            file_path = workspace_dir / filename
+            # Resolve the file path, refusing paths that leave the workspace
+            catalog = get_workspace_catalog(str(workspace_dir))
+            try:
+                file_path = catalog.resolve(filename)
+            except ValueError as e:
+                logger.warning(f"Refusing to save QASM 3.0 program: {str(e)}")
+                return {'error': str(e), 'success': False}
 
-            # Save the QASM 3.0 code to the file
+            # Save the QASM 3.0 code to the file atomically and record it in the catalog
             logger.info(f"Saving QASM 3.0 program to {file_path}...")
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(qasm_program)
+            entry = catalog.save_program(filename, qasm_program, tags)
+            response['sha256'] = entry.sha256
 
             logger.info(f"Successfully saved QASM 3.0 program to {file_path}")
             response['file_path'] = str(file_path)
@@ -141,6 +472,99 @@ def create_quantum_circuit(qasm_program: str, filename: Optional[str] = None) ->
         return {'error': str(e), 'success': False}
 
 
+@traced_tool('query_circuit_catalog')
+async def query_circuit_catalog(
+    num_qubits: Optional[int] = None,
+    min_qubits: Optional[int] = None,
+    max_qubits: Optional[int] = None,
+    gate: Optional[str] = None,
+    tag: Optional[str] = None,
+    name: Optional[str] = None,
+    modified_within_days: Optional[float] = None,
+    limit: int = 20,
+) -> Dict[str, Any]:
+    """Find saved .qasm circuits in the workspace, most recently modified first.
+
+    Answers from an index; only files that changed since the last query are parsed.
+
+    Args:
+        num_qubits: Exact number of qubits
+        min_qubits: Minimum number of qubits
+        max_qubits: Maximum number of qubits
+        gate: Gate the circuit must use (e.g. 'cx')
+        tag: Tag the circuit must have
+        name: Substring of the file path
+        modified_within_days: Only circuits modified within this many days
+        limit: Maximum number of circuits to return
+
+    Returns:
+        Dictionary containing the matching circuits with hash, qubit count, gate counts, depth and tags
+    """
+    try:
+        modified_after = datetime.now() - timedelta(days=modified_within_days) if modified_within_days else None
+        catalog = await run_blocking(get_workspace_catalog, get_workspace_dir())
+        entries = await run_blocking(
+            catalog.query,
+            num_qubits=num_qubits,
+            min_qubits=min_qubits,
+            max_qubits=max_qubits,
+            gate=gate,
+            tag=tag,
+            name=name,
+            modified_after=modified_after,
+        )
+        return {
+            'total': len(entries),
+            'circuits': [entry.model_dump(exclude_none=True) for entry in entries[:limit]],
+        }
+    except Exception as e:
+        logger.exception(f"Error querying circuit catalog: {str(e)}")
+        return {'error': str(e)}
+
+
+@traced_tool('validate_qasm_batch')
+async def validate_qasm_batch(
+    programs: Optional[List[str]] = None,
+    pattern: Optional[str] = None,
+    only_invalid: bool = False,
+) -> Dict[str, Any]:
+    """Validate many OpenQASM 3.0 programs in parallel without drawing or saving them.
+
+    Args:
+        programs: Optional list of OpenQASM 3.0 program strings
+        pattern: Optional glob pattern of .qasm files in the workspace, e.g. '**/*.qasm'
+        only_invalid: Only list the programs that failed to parse
+
+    Returns:
+        Dictionary containing valid/invalid counts and per-program qubit count, operation count or error
+    """
+    try:
+        if not programs and not pattern:
+            return {'error': 'Provide programs or a pattern', 'success': False}
+
+        results = []
+        if programs:
+            results.extend(await run_blocking(validate_qasm_programs, programs))
+        if pattern:
+            results.extend(await run_blocking(validate_qasm_files, pattern, get_workspace_dir()))
+
+        valid = sum(1 for result in results if result.valid)
+        return {
+            'success': True,
+            'total': len(results),
+            'valid': valid,
+            'invalid': len(results) - valid,
+            'results': [
+                result.model_dump(exclude_none=True)
+                for result in results
+                if not (only_invalid and result.valid)
+            ],
+        }
+    except Exception as e:
+        logger.exception(f"Error validating QASM programs: {str(e)}")
+        return {'error': str(e), 'success': False}
+
+
 # @mcp.tool(name='run_quantum_task')
 # def run_quantum_task(
 #     circuit: Dict[str, Any],
@@ -203,47 +627,127 @@ def create_quantum_circuit(qasm_program: str, filename: Optional[str] = None) ->
 #         return {'error': str(e)}
 
 
-@mcp.tool(name='get_task_result')
-def get_task_result(task_id: str) -> Dict[str, Any]:
+@traced_tool('get_task_result')
+async def get_task_result(
+    task_id: str,
+    detail: str = 'summary',
+    fields: Optional[List[str]] = None,
+) -> Union[TaskResultSummary, TaskResult, TaskResultFields, ErrorResponse]:
     """Get the result of a quantum task.
     
     Args:
         task_id: ID of the quantum task
+        detail: 'summary' (default) for totals and the most frequent counts, or 'full' for
+                every measured shot and the raw task metadata
+        fields: Return only these fields, e.g. ['counts'] or ['measurements'] (overrides detail)
     
     Returns:
-        Dictionary containing the task result
+        The task result summary, full result or requested fields
     """
     try:
         # Get the task result
-        result = get_braket_service().get_task_result(task_id)
+        result = await run_blocking(lambda: get_braket_service().get_task_result(task_id))
         
-        # Return the result as a dictionary
-        return result.model_dump()
+        return shape_task_result(result, detail, fields)
     except Exception as e:
         logger.exception(f"Error getting task result: {str(e)}")
-        return {'error': str(e)}
+        return ErrorResponse(error=str(e))
+
+
+# Task statuses after which a task no longer changes
+FINAL_TASK_STATUSES = {TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED}
+
+
+def _poll_task_progress(task_id: str):
+    """Get a task's progress in the bulk lane, so polling yields to interactive calls."""
+    service = get_braket_service()
+    with service.rate_limiter.lane(Priority.BULK):
+        return service.get_task_progress(task_id)
+
+
+@traced_tool('wait_for_task')
+async def wait_for_task(
+    task_id: str,
+    ctx: Context,
+    timeout_seconds: float = 300,
+    poll_interval_seconds: float = 5,
+    detail: str = 'summary',
+    fields: Optional[List[str]] = None,
+) -> Union[WaitedTaskResultSummary, WaitedTaskResult, WaitedTaskResultFields, WaitedTaskProgress, ErrorResponse]:
+    """Wait for a quantum task to finish, reporting its status and queue position as progress.
+
+    Use this instead of calling get_task_result repeatedly.
+
+    Args:
+        task_id: ID of the quantum task
+        timeout_seconds: Maximum time to wait (in seconds)
+        poll_interval_seconds: Initial time between status checks (in seconds); it grows
+                               up to 30 seconds while the task is queued
+        detail: 'summary' (default) or 'full', as for get_task_result
+        fields: Return only these fields of the result, as for get_task_result
+
+    Returns:
+        The task result if the task finished, or its latest status if the wait timed out
+    """
+    try:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        interval = max(poll_interval_seconds, 1)
+        last_update = None
+
+        while True:
+            progress = await run_blocking(_poll_task_progress, task_id)
+            elapsed = loop.time() - started
+
+            # Only report changes, so the client is not flooded with identical updates
+            update = (progress.status, progress.queue_position)
+            if update != last_update:
+                last_update = update
+                message = f"Task {task_id} is {progress.status.value}"
+                if progress.queue_position:
+                    message += f" (queue position {progress.queue_position})"
+                await ctx.report_progress(progress=elapsed, total=timeout_seconds, message=message)
+
+            if progress.status in FINAL_TASK_STATUSES:
+                result = await run_blocking(lambda: get_braket_service().get_task_result(task_id))
+                return add_wait(shape_task_result(result, detail, fields), elapsed, timed_out=False)
+
+            remaining = timeout_seconds - elapsed
+            if remaining <= 0:
+                return add_wait(progress, elapsed, timed_out=True)
+
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * 1.5, 30)
+    except Exception as e:
+        logger.exception(f"Error waiting for task: {str(e)}")
+        return ErrorResponse(error=str(e))
 
 
-@mcp.tool(name='list_devices')
-def list_devices() -> List[Dict[str, Any]]:
+@traced_tool('list_devices')
+async def list_devices(detail: str = 'summary') -> List[Union[DeviceSummary, DeviceInfo, ErrorResponse]]:
     """List available quantum devices.
     
+    Args:
+        detail: 'summary' (default) for names, status and qubit counts, or 'full' to
+                include connectivity, shot limits and supported gates
+    
     Returns:
         List of available quantum devices
     """
     try:
         # Get the list of devices
-        devices = get_braket_service().list_devices()
+        devices = await run_blocking(lambda: get_braket_service().list_devices())
         
-        # Convert to dictionaries
-        return [device.model_dump() for device in devices]
+        if parse_detail(detail) == DetailLevel.FULL:
+            return devices
+        return [summarize_device(device) for device in devices]
     except Exception as e:
         logger.exception(f"Error listing devices: {str(e)}")
-        return [{'error': str(e)}]
+        return [ErrorResponse(error=str(e))]
 
 
-@mcp.tool(name='get_device_info')
-def get_device_info(device_arn: str) -> Dict[str, Any]:
+@traced_tool('get_device_info')
+async def get_device_info(device_arn: str) -> Dict[str, Any]:
     """Get information about a specific quantum device.
     
     Args:
@@ -254,7 +758,7 @@ def get_device_info(device_arn: str) -> Dict[str, Any]:
     """
     try:
         # Get the device information
-        device_info = get_braket_service().get_device_info(device_arn)
+        device_info = await run_blocking(lambda: get_braket_service().get_device_info(device_arn))
         
         # Return the device info as a dictionary
         return device_info.model_dump()
@@ -263,8 +767,115 @@ def get_device_info(device_arn: str) -> Dict[str, Any]:
         return {'error': str(e)}
 
 
-@mcp.tool(name='cancel_quantum_task')
-def cancel_quantum_task(task_id: str) -> Dict[str, Any]:
+@traced_tool('rank_devices')
+async def rank_devices(
+    qasm_program: Optional[str] = None,
+    num_qubits: Optional[int] = None,
+    required_gates: Optional[List[str]] = None,
+    include_simulators: bool = True,
+    max_results: int = 5,
+) -> Dict[str, Any]:
+    """Rank quantum devices by estimated turnaround for a circuit.
+
+    Combines device capabilities with current queue depth, execution windows and
+    the turnaround of our own recently completed tasks. Use this to pick a device
+    instead of choosing one from list_devices.
+
+    Args:
+        qasm_program: Optional OpenQASM 3.0 program; its qubit count and gates are used
+        num_qubits: Number of qubits the circuit needs (if no program is given)
+        required_gates: Gate names the circuit uses (if no program is given)
+        include_simulators: Whether to rank managed simulators as well as QPUs
+        max_results: Maximum number of rankings to return
+
+    Returns:
+        Dictionary containing the fastest fitting device and the ranked devices
+    """
+    try:
+        if qasm_program:
+            circuit = (await run_blocking(parse_qasm, qasm_program)).circuit
+            num_qubits = circuit.num_qubits
+            required_gates = list(circuit.count_ops().keys())
+
+        rankings = await run_blocking(lambda: get_braket_service().rank_devices(
+            num_qubits=num_qubits or 0,
+            required_gates=required_gates,
+            include_simulators=include_simulators,
+        ))
+        best = next((ranking for ranking in rankings if ranking.fits), None)
+
+        return {
+            'best_device': best.model_dump() if best else None,
+            'rankings': [ranking.model_dump() for ranking in rankings[:max_results]],
+        }
+    except Exception as e:
+        logger.exception(f"Error ranking devices: {str(e)}")
+        return {'error': str(e)}
+
+
+@traced_tool('transpile_circuit')
+async def transpile_circuit(qasm_program: str, device_arn: str) -> Dict[str, Any]:
+    """Transpile an OpenQASM 3.0 program to a device's native gates and qubit connectivity.
+
+    Results are cached per circuit and device, so repeated calls are cheap.
+
+    Args:
+        qasm_program: String containing the OpenQASM 3.0 program
+        device_arn: ARN of the target device
+
+    Returns:
+        Dictionary containing the transpiled program and gate counts and depth before and after
+    """
+    try:
+        circuit = (await run_blocking(parse_qasm, qasm_program)).circuit
+        transpiled, cache_hit = await run_blocking(
+            lambda: get_braket_service().transpile_for_device(circuit, device_arn)
+        )
+
+        return {
+            'success': True,
+            'device_arn': device_arn,
+            'cache_hit': cache_hit,
+            'qasm_program': await run_blocking(dump_qasm, transpiled),
+            'original': {'gate_counts': dict(circuit.count_ops()), 'depth': circuit.depth()},
+            'transpiled': {'gate_counts': dict(transpiled.count_ops()), 'depth': transpiled.depth()},
+        }
+    except Exception as e:
+        logger.exception(f"Error transpiling circuit: {str(e)}")
+        return {'error': str(e), 'success': False}
+
+
+@traced_tool('optimize_circuit')
+async def optimize_circuit(qasm_program: str, passes: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Reduce the gate count of an OpenQASM 3.0 program without changing its measured outcomes.
+
+    Available passes: remove_unmeasured_operations, cancel_inverses, merge_rotations,
+    fold_single_qubit_runs. All passes run by default.
+
+    Args:
+        qasm_program: String containing the OpenQASM 3.0 program
+        passes: Optional list of pass names to run, in order
+
+    Returns:
+        Dictionary containing the optimized program and gate counts and depth before and after
+    """
+    try:
+        circuit = (await run_blocking(parse_qasm, qasm_program)).circuit
+        config = OptimizationConfig(passes=passes) if passes else None
+        optimized, report = await run_blocking(lambda: get_braket_service().optimize_circuit(circuit, config))
+
+        return {
+            'success': True,
+            'qasm_program': await run_blocking(dump_qasm, optimized),
+            'report': report.model_dump(),
+        }
+    except Exception as e:
+        logger.exception(f"Error optimizing circuit: {str(e)}")
+        return {'error': str(e), 'success': False}
+
+
+@traced_tool('cancel_quantum_task')
+async def cancel_quantum_task(task_id: str) -> Dict[str, Any]:
     """Cancel a quantum task.
     
     Args:
@@ -275,7 +886,7 @@ def cancel_quantum_task(task_id: str) -> Dict[str, Any]:
     """
     try:
         # Cancel the task
-        success = get_braket_service().cancel_quantum_task(task_id)
+        success = await run_blocking(lambda: get_braket_service().cancel_quantum_task(task_id))
         
         return {
             'task_id': task_id,
@@ -286,13 +897,14 @@ def cancel_quantum_task(task_id: str) -> Dict[str, Any]:
         return {'error': str(e)}
 
 
-@mcp.tool(name='search_quantum_tasks')
-def search_quantum_tasks(
+@traced_tool('search_quantum_tasks')
+async def search_quantum_tasks(
     device_arn: Optional[str] = None,
     state: Optional[str] = None,
     max_results: int = 10,
     days_ago: Optional[int] = None,
-) -> List[Dict[str, Any]]:
+    detail: str = 'summary',
+) -> List[Union[QuantumTaskSummary, QuantumTaskEntry, ErrorResponse]]:
     """Search for quantum tasks.
     
     Args:
@@ -300,6 +912,8 @@ def search_quantum_tasks(
         state: Filter by task state
         max_results: Maximum number of results to return
         days_ago: Filter by creation time (days ago)
+        detail: 'summary' (default) for ARN, status, device, shots and times, or 'full'
+                to include output locations and tags
     
     Returns:
         List of quantum tasks
@@ -311,116 +925,202 @@ def search_quantum_tasks(
             created_after = datetime.now() - timedelta(days=days_ago)
         
         # Search for tasks
-        tasks = get_braket_service().search_quantum_tasks(
+        tasks = await run_blocking(lambda: get_braket_service().search_quantum_tasks(
             device_arn=device_arn,
             state=state,
             max_results=max_results,
             created_after=created_after,
-        )
+        ))
         
-        return tasks
+        return [shape_task_search_entry(task, detail) for task in tasks]
     except Exception as e:
         logger.exception(f"Error searching quantum tasks: {str(e)}")
-        return [{'error': str(e)}]
+        return [ErrorResponse(error=str(e))]
+
+
+@functools.lru_cache(maxsize=64)
+def generate_circuit_qasm(kind: str, num_qubits: int) -> str:
+    """Generate the OpenQASM 3.0 program of a library circuit.
+
+    Programs are emitted directly as text and are deterministic, so they are
+    cached per kind and size.
+
+    Args:
+        kind: 'bell', 'ghz' or 'qft'
+        num_qubits: Number of qubits in the circuit (ignored for 'bell')
+
+    Returns:
+        str: OpenQASM 3.0 program
+    """
+    return generate_qasm(kind, num_qubits)[0]
 
 
-@mcp.tool(name='create_bell_pair_circuit')
-def create_bell_pair_circuit(filename: Optional[str] = None) -> Dict[str, Any]:
+@traced_tool('create_bell_pair_circuit')
+async def create_bell_pair_circuit(filename: Optional[str] = None, diagram_mode: str = 'auto') -> Dict[str, Any]:
     """Create a Bell pair circuit (entangled qubits).
 
     Args:
         filename: Optional filename for the .qasm file. If provided, the circuit is saved to this file.
                   If not provided, the circuit is only verified and visualized without saving.
+        diagram_mode: How to render the circuit diagram: 'auto', 'full', 'folded', 'window' or 'summary'
 
     Returns:
         Dictionary containing the verification status, ASCII circuit diagram, and file path (if saved)
     """
     try:
-        # Create Bell pair circuit using Qiskit
-        circuit = QiskitCircuit(2)
-        circuit.h(0)  # Hadamard on qubit 0
-        circuit.cx(0, 1)  # CNOT with control=0, target=1
-        circuit.measure_all()  # Add measurements
-
-        # Convert to QASM 3.0
-        qasm_program = qasm3.dumps(circuit)
+        # Emit the Bell pair program directly as OpenQASM 3.0 (cached)
+        qasm_program = await run_blocking(generate_circuit_qasm, 'bell', 2)
 
         # Call create_quantum_circuit to verify and save
-        return create_quantum_circuit(qasm_program, filename)
+        return await run_blocking(_create_quantum_circuit, qasm_program, filename, diagram_mode)
     except Exception as e:
         logger.exception(f"Error creating Bell pair circuit: {str(e)}")
         return {'error': str(e), 'success': False}
 
 
-@mcp.tool(name='create_ghz_circuit')
-def create_ghz_circuit(filename: Optional[str] = None, num_qubits: int = 3) -> Dict[str, Any]:
+@traced_tool('create_ghz_circuit')
+async def create_ghz_circuit(
+    filename: Optional[str] = None,
+    num_qubits: int = 3,
+    diagram_mode: str = 'auto',
+) -> Dict[str, Any]:
     """Create a GHZ state circuit.
 
     Args:
         filename: Optional filename for the .qasm file. If provided, the circuit is saved to this file.
                   If not provided, the circuit is only verified and visualized without saving.
         num_qubits: Number of qubits in the circuit (default: 3)
+        diagram_mode: How to render the circuit diagram: 'auto', 'full', 'folded', 'window' or 'summary'
 
     Returns:
         Dictionary containing the verification status, ASCII circuit diagram, and file path (if saved)
     """
     try:
-        # Create GHZ circuit using Qiskit
-        circuit = QiskitCircuit(num_qubits)
-        circuit.h(0)  # Hadamard on qubit 0
-        for i in range(num_qubits - 1):
-            circuit.cx(i, i + 1)  # Chain of CNOT gates
-        circuit.measure_all()  # Add measurements
-
-        # Convert to QASM 3.0
-        qasm_program = qasm3.dumps(circuit)
+        # Emit the program directly as OpenQASM 3.0 (cached per size)
+        qasm_program = await run_blocking(generate_circuit_qasm, 'ghz', num_qubits)
 
         # Call create_quantum_circuit to verify and save
-        return create_quantum_circuit(qasm_program, filename)
+        return await run_blocking(_create_quantum_circuit, qasm_program, filename, diagram_mode)
     except Exception as e:
         logger.exception(f"Error creating GHZ circuit: {str(e)}")
         return {'error': str(e), 'success': False}
 
 
-@mcp.tool(name='create_qft_circuit')
-def create_qft_circuit(filename: Optional[str] = None, num_qubits: int = 3) -> Dict[str, Any]:
+@traced_tool('create_qft_circuit')
+async def create_qft_circuit(
+    filename: Optional[str] = None,
+    num_qubits: int = 3,
+    diagram_mode: str = 'auto',
+) -> Dict[str, Any]:
     """Create a Quantum Fourier Transform circuit.
 
     Args:
         filename: Optional filename for the .qasm file. If provided, the circuit is saved to this file.
                   If not provided, the circuit is only verified and visualized without saving.
         num_qubits: Number of qubits in the circuit (default: 3)
+        diagram_mode: How to render the circuit diagram: 'auto', 'full', 'folded', 'window' or 'summary'
 
     Returns:
         Dictionary containing the verification status, ASCII circuit diagram, and file path (if saved)
     """
     try:
-        # Create QFT circuit using Qiskit
-        circuit = QiskitCircuit(num_qubits)
+        # Emit the program directly as OpenQASM 3.0 (cached per size)
+        qasm_program = await run_blocking(generate_circuit_qasm, 'qft', num_qubits)
+
+        # Call create_quantum_circuit to verify and save
+        return await run_blocking(_create_quantum_circuit, qasm_program, filename, diagram_mode)
+    except Exception as e:
+        logger.exception(f"Error creating QFT circuit: {str(e)}")
+        return {'error': str(e), 'success': False}
 
-        # Implement QFT algorithm
-        import math
-        for i in range(num_qubits):
-            # Apply Hadamard gate
-            circuit.h(i)
-            # Apply controlled-phase rotations
-            for j in range(i + 1, num_qubits):
-                angle = 2 * math.pi / (2 ** (j - i + 1))
-                circuit.cp(angle, j, i)
 
-        # Reverse qubit order with SWAP gates
-        for i in range(num_qubits // 2):
-            circuit.swap(i, num_qubits - i - 1)
+# Programs up to this size are validated, drawn and returned inline (in characters)
+INLINE_QASM_MAX_CHARS = 20000
 
-        circuit.measure_all()  # Add measurements
 
-        # Convert to QASM 3.0
-        qasm_program = qasm3.dumps(circuit)
+@traced_tool('generate_library_circuit')
+async def generate_library_circuit(
+    family: str,
+    num_qubits: int,
+    filename: Optional[str] = None,
+    marked: Optional[str] = None,
+    iterations: Optional[int] = None,
+    depth: Optional[int] = None,
+    seed: Optional[int] = None,
+    diagram_mode: str = 'auto',
+) -> Dict[str, Any]:
+    """Generate a library circuit as OpenQASM 3.0, scaling to hundreds of qubits.
 
-        # Call create_quantum_circuit to verify and save
-        return create_quantum_circuit(qasm_program, filename)
+    Families: bell, ghz, qft, w_state, grover (phase oracle for one marked bitstring),
+    random_clifford. Large programs are only summarized unless a filename is given,
+    in which case they are streamed to the file.
+
+    Args:
+        family: Circuit family
+        num_qubits: Number of qubits in the circuit
+        filename: Optional filename for the .qasm file
+        marked: For grover, the marked bitstring with qubit 0 rightmost (default: all ones)
+        iterations: For grover, the number of Grover iterations (default: optimal up to 12 qubits, else 1)
+        depth: For random_clifford, the number of layers (default: num_qubits)
+        seed: For random_clifford, the random seed
+        diagram_mode: How to render the circuit diagram of small circuits: 'auto', 'full', 'folded',
+                      'window' or 'summary'
+
+    Returns:
+        Dictionary containing the circuit summary, and for small circuits the program and its diagram
+    """
+    params = {
+        'grover': {'marked': marked, 'iterations': iterations},
+        'random_clifford': {'depth': depth, 'seed': seed},
+    }.get(family, {})
+    return await run_blocking(_generate_library_circuit, family, num_qubits, filename, diagram_mode, params)
+
+
+def _generate_library_circuit(
+    family: str,
+    num_qubits: int,
+    filename: Optional[str],
+    diagram_mode: str,
+    params: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Generate, and optionally save, a library circuit (blocking)."""
+    try:
+        entry = None
+        if filename:
+            # Rejects paths outside the workspace before anything is written
+            catalog = get_workspace_catalog(get_workspace_dir())
+            file_path = catalog.resolve(filename)
+            logger.info(f"Streaming {family} circuit with {num_qubits} qubits to {file_path}...")
+            summary = write_qasm(str(file_path), family, num_qubits, **params)
+            entry = catalog.add_file(filename)
+            qasm_program = file_path.read_text(encoding='utf-8') if summary.size_bytes <= INLINE_QASM_MAX_CHARS else None
+        else:
+            qasm_program, summary = generate_qasm(family, num_qubits, **params)
+            if summary.size_bytes > INLINE_QASM_MAX_CHARS:
+                qasm_program = None
+
+        response = {'success': True, **summary.model_dump(exclude_none=True)}
+        if entry is not None:
+            response['sha256'] = entry.sha256
+        if qasm_program is None:
+            response['message'] = (
+                f'Circuit has {summary.num_operations} operations ({summary.size_bytes} bytes); '
+                + ('saved without inline validation' if filename else 'pass a filename to save it')
+            )
+            return response
+
+        # Small programs are validated and drawn like create_quantum_circuit
+        parsed = parse_qasm(qasm_program)
+        diagram, used_mode = parsed.render(DiagramMode(diagram_mode))
+        response.update({
+            'qasm_program': qasm_program,
+            'circuit_diagram': diagram,
+            'diagram_mode': used_mode.value,
+            'message': f'Circuit verified and saved to {summary.file_path}' if filename else 'Circuit verified successfully',
+        })
+        return response
     except Exception as e:
-        logger.exception(f"Error creating QFT circuit: {str(e)}")
+        logger.exception(f"Error generating {family} circuit: {str(e)}")
         return {'error': str(e), 'success': False}
 
 
@@ -462,40 +1162,55 @@ def create_qft_circuit(filename: Optional[str] = None, num_qubits: int = 3) -> D
 #         return {'error': str(e)}
 
 
-@mcp.tool(name='visualize_results')
-def visualize_results(result: Dict[str, Any]) -> Dict[str, Any]:
+@traced_tool('visualize_results')
+async def visualize_results(
+    result: Dict[str, Any],
+    detail: str = 'summary',
+    top_k: int = DEFAULT_TOP_K,
+    bin_by: str = 'outcome',
+    qubits: Optional[List[int]] = None,
+    include_image: bool = False,
+) -> Union[ResultsVisualization, ErrorResponse]:
     """Visualize the results of a quantum task.
     
+    The chart image is returned by reference: `visualization_file` is its path in the
+    workspace and `visualization_url` the Jupyter server path that serves it.
+    
     Args:
-        result: Result of the quantum task
+        result: Result of the quantum task from get_task_result with detail='full' or
+                fields=['status', 'device', 'shots', 'counts']; summaries whose counts
+                leave out outcomes (other_shots > 0) are rejected
+        detail: 'summary' (default) returns the description, ASCII chart and image reference;
+                'full' also returns the full result
+        top_k: Maximum number of bars in the ASCII chart; other outcomes are summed into one bar
+        bin_by: 'outcome' (default), 'hamming_weight' (bars by number of 1s) or 'qubits'
+                (bars by the bits of the given qubits only)
+        qubits: Bit positions to keep when bin_by='qubits', 0 being the leftmost bit
+        include_image: Also return the PNG inline as base64 (`visualization_data`); only
+                       needed when the image cannot be fetched by reference
     
     Returns:
-        Dictionary containing the visualization
+        The chart reference, ASCII chart and description of the results
     """
     try:
         # Convert the result dictionary to a TaskResult object
-        task_result = TaskResult(
-            task_id=result.get('task_id'),
-            status=result.get('status'),
-            measurements=result.get('measurements'),
-            counts=result.get('counts'),
-            device=result.get('device'),
-            shots=result.get('shots'),
-            execution_time=result.get('execution_time'),
-            metadata=result.get('metadata'),
-        )
+        task_result = task_result_from_response(result)
+        
+        parse_binning(bin_by)
         
         # Create visualization
-        response = get_braket_service().create_results_visualization(task_result)
+        response = await run_blocking(lambda: get_braket_service().create_results_visualization(
+            task_result, include_data=include_image, top_k=top_k, bin_by=bin_by, qubits=qubits,
+        ))
         
-        return response
+        return shape_results_visualization(response, detail, include_image)
     except Exception as e:
         logger.exception(f"Error visualizing results: {str(e)}")
-        return {'error': str(e)}
+        return ErrorResponse(error=str(e))
 
 
-@mcp.tool(name='describe_visualization')
-def describe_visualization(visualization_data: Dict[str, Any]) -> Dict[str, Any]:
+@traced_tool('describe_visualization')
+async def describe_visualization(visualization_data: Dict[str, Any]) -> Dict[str, Any]:
     """Convert visualization data into human-readable descriptions.
     
     Args:
@@ -527,7 +1242,7 @@ def describe_visualization(visualization_data: Dict[str, Any]) -> Dict[str, Any]
             )
             
             # Generate description
-            description = get_braket_service().describe_circuit(circuit_def)
+            description = await run_blocking(lambda: get_braket_service().describe_circuit(circuit_def))
             return {
                 'type': 'circuit_description',
                 'description': description
@@ -538,19 +1253,10 @@ def describe_visualization(visualization_data: Dict[str, Any]) -> Dict[str, Any]
             result_dict = visualization_data['result']
             
             # Convert to TaskResult object
-            task_result = TaskResult(
-                task_id=result_dict.get('task_id'),
-                status=result_dict.get('status'),
-                measurements=result_dict.get('measurements'),
-                counts=result_dict.get('counts'),
-                device=result_dict.get('device'),
-                shots=result_dict.get('shots'),
-                execution_time=result_dict.get('execution_time'),
-                metadata=result_dict.get('metadata'),
-            )
+            task_result = task_result_from_response(result_dict)
             
             # Generate description
-            description = get_braket_service().describe_results(task_result)
+            description = await run_blocking(lambda: get_braket_service().describe_results(task_result))
             return {
                 'type': 'results_description',
                 'description': description
@@ -565,9 +1271,134 @@ def describe_visualization(visualization_data: Dict[str, Any]) -> Dict[str, Any]
         return {'error': str(e)}
 
 
+def warm_up() -> None:
+    """Import the slow dependencies of the tools and start the plot worker, so first tool calls do not wait for them."""
+    started = time.perf_counter()
+    for module in WARMUP_MODULES:
+        try:
+            importlib.import_module(module, __package__)
+        except Exception as e:
+            logger.warning(f'Warm-up could not import {module}: {e}')
+    try:
+        get_plot_renderer().warm_up()
+    except Exception as e:
+        logger.warning(f'Warm-up could not start the plot renderer: {e}')
+    logger.info(f'Warm-up finished in {time.perf_counter() - started:.1f}s')
+
+
+def start_warm_up() -> Optional[Future]:
+    """Start the warm-up in the background unless BRAKET_MCP_WARMUP is set to 0.
+
+    The imports run on a worker of the tool thread pool rather than on a
+    short-lived thread: Qiskit segfaults when a circuit is parsed after the
+    thread that imported `qiskit.qasm3` has exited.
+    """
+    if os.environ.get('BRAKET_MCP_WARMUP', '1').strip().lower() in ('0', 'false', 'no'):
+        return None
+    return _executor.submit(warm_up)
+
+
+@traced_tool('get_server_stats')
+async def get_server_stats(
+    tool: Optional[str] = None,
+    include_spans: bool = False,
+    recent_spans: int = 0,
+) -> Dict[str, Any]:
+    """Get latency and response size statistics of this server's tools.
+
+    Use this to find out which tools are slow or return large responses.
+
+    Args:
+        tool: Only report this tool
+        include_spans: Also report latency of internal operations (Braket API calls,
+                       S3 downloads, QASM parsing and drawing)
+        recent_spans: Number of most recent spans to return, newest first
+
+    Returns:
+        Dictionary containing per-tool p50/p95/p99 latency (ms) and payload sizes (bytes)
+    """
+    try:
+        tracer = get_tracer()
+        tools = tracer.tool_stats()
+        if tool:
+            tools = [stats for stats in tools if stats.name == tool]
+        response = {
+            'uptime_seconds': round(time.time() - tracer.started, 1),
+            'tools': [stats.model_dump(exclude_none=True) for stats in tools],
+        }
+        if include_spans:
+            response['spans'] = [
+                stats.model_dump(exclude_none=True) for stats in tracer.span_stats() if not stats.name.startswith('tool.')
+            ]
+        if recent_spans > 0:
+            response['recent_spans'] = tracer.recent_spans(recent_spans)
+        if tracer.export_path:
+            response['trace_file'] = tracer.export_path
+        return response
+    except Exception as e:
+        logger.exception(f"Error getting server stats: {str(e)}")
+        return {'error': str(e)}
+
+
+class BearerTokenMiddleware:
+    """ASGI middleware that rejects HTTP requests without the expected bearer token."""
+
+    def __init__(self, app, token: str):
+        self.app = app
+        self.expected = f'Bearer {token}'.encode()
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http':
+            authorization = dict(scope.get('headers', [])).get(b'authorization', b'')
+            if not hmac.compare_digest(authorization, self.expected):
+                await send({'type': 'http.response.start', 'status': 401, 'headers': [(b'content-type', b'text/plain')]})
+                await send({'type': 'http.response.body', 'body': b'Unauthorized'})
+                return
+        await self.app(scope, receive, send)
+
+
 def main():
     """Run the MCP server with CLI argument support."""
-    mcp.run()
+    parser = argparse.ArgumentParser(description='Amazon Braket MCP server')
+    parser.add_argument(
+        '--transport',
+        choices=['stdio', 'sse', 'streamable-http'],
+        default=os.environ.get('BRAKET_MCP_TRANSPORT', 'stdio'),
+        help='Transport to serve on (default: stdio)',
+    )
+    parser.add_argument('--host', default=os.environ.get('BRAKET_MCP_HOST', '127.0.0.1'), help='HTTP host to bind')
+    parser.add_argument('--port', type=int, default=int(os.environ.get('BRAKET_MCP_PORT', '8000')), help='HTTP port')
+    args = parser.parse_args()
+
+    # Answer the handshake right away and import Qiskit and the Braket SDK meanwhile
+    start_warm_up()
+
+    if args.transport == 'stdio':
+        mcp.run()
+        return
+
+    import uvicorn
+
+    mcp.settings.host = args.host
+    mcp.settings.port = args.port
+    loopback = args.host in ('127.0.0.1', 'localhost', '::1')
+    token = os.environ.get('BRAKET_MCP_AUTH_TOKEN', '').strip()
+    if not loopback:
+        # Other hosts can reach the server, so clients must authenticate and
+        # must not choose workspaces anywhere on disk
+        if not token:
+            parser.error(f'BRAKET_MCP_AUTH_TOKEN is required to serve on {args.host}')
+        if not os.environ.get('BRAKET_WORKSPACE_ROOT', '').strip():
+            parser.error(f'BRAKET_WORKSPACE_ROOT is required to serve on {args.host}')
+        # Host-header checks only make sense for a server bound to localhost
+        mcp.settings.transport_security = None
+
+    app = mcp.streamable_http_app() if args.transport == 'streamable-http' else mcp.sse_app()
+    if token:
+        app = BearerTokenMiddleware(app, token)
+
+    logger.info(f'Serving Braket MCP server over {args.transport} on {args.host}:{args.port}')
+    uvicorn.run(app, host=args.host, port=args.port, log_level=mcp.settings.log_level.lower())
 
 
 if __name__ == '__main__':
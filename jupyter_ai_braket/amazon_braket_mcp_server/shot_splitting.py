@@ -0,0 +1,152 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Shot splitting and result merging for Amazon Braket tasks.
+
+A single quantum task is capped by the device's maximum shot count. This module
+plans how a larger shot budget is split into chunks that fit one or several
+equivalent devices, and merges the chunk results back into one TaskResult.
+"""
+
+from collections import Counter
+from typing import Dict, List, Optional
+
+from .models import ShotChunk, TaskResult, TaskStatus
+
+
+def plan_shot_chunks(shots: int, max_shots_by_device: Dict[str, int]) -> List[ShotChunk]:
+    """Split a shot budget into chunks that fit the given devices.
+
+    Chunks are assigned to the devices round-robin so that concurrent chunks are
+    spread across all devices. A device with an unknown limit (0) accepts the
+    whole remaining budget in one chunk.
+
+    Args:
+        shots: Total number of shots to run
+        max_shots_by_device: Maximum shots per task, keyed by device ARN
+
+    Returns:
+        List[ShotChunk]: The chunks in submission order
+
+    Raises:
+        ValueError: If the shot count is not positive or no devices are given
+    """
+    if shots <= 0:
+        raise ValueError(f"Shots must be a positive integer, got {shots}")
+    if not max_shots_by_device:
+        raise ValueError("At least one device is required to plan shot chunks")
+
+    device_arns = list(max_shots_by_device.keys())
+    chunks = []
+    remaining = shots
+    while remaining > 0:
+        device_arn = device_arns[len(chunks) % len(device_arns)]
+        limit = max_shots_by_device[device_arn] or remaining
+        chunk_shots = min(remaining, limit)
+        chunks.append(ShotChunk(index=len(chunks), device_arn=device_arn, shots=chunk_shots))
+        remaining -= chunk_shots
+
+    return chunks
+
+
+class TaskResultMerger:
+    """Incrementally merge chunk results into a single TaskResult.
+
+    Results can be added in any order as chunks finish. Measurements are kept in
+    chunk order so the merged shot list is reproducible.
+    """
+
+    def __init__(self, task_id: str, chunks: List[ShotChunk]):
+        """Initialize the merger.
+
+        Args:
+            task_id: ID to report for the merged result
+            chunks: The planned chunks that will be merged
+        """
+        self.task_id = task_id
+        self.chunks = chunks
+        self.counts: Counter = Counter()
+        self._measurements: Dict[int, List[List[int]]] = {}
+        self._chunk_task_ids: Dict[int, str] = {}
+        self._failed_chunks: Dict[int, str] = {}
+        self._completed_shots = 0
+
+    @property
+    def completed_chunks(self) -> int:
+        """Number of chunks merged so far."""
+        return len(self._chunk_task_ids)
+
+    def add(self, chunk: ShotChunk, result: TaskResult) -> None:
+        """Merge the result of one chunk.
+
+        Args:
+            chunk: The chunk that produced the result
+            result: The chunk's task result
+        """
+        self._chunk_task_ids[chunk.index] = result.task_id
+        if result.status != TaskStatus.COMPLETED:
+            self._failed_chunks[chunk.index] = f"Task {result.task_id} finished with status {result.status.value}"
+            return
+
+        if result.counts:
+            self.counts.update(result.counts)
+        if result.measurements is not None:
+            self._measurements[chunk.index] = result.measurements
+        self._completed_shots += chunk.shots
+
+    def add_failure(self, chunk: ShotChunk, error: str) -> None:
+        """Record a chunk that could not be run.
+
+        Args:
+            chunk: The chunk that failed
+            error: Description of the failure
+        """
+        self._failed_chunks[chunk.index] = error
+
+    def result(self, execution_time: Optional[float] = None) -> TaskResult:
+        """Build the merged TaskResult from the chunks merged so far.
+
+        Args:
+            execution_time: Wall-clock time of the whole split execution (in seconds)
+
+        Returns:
+            TaskResult: The merged result
+        """
+        measurements = None
+        if self._measurements:
+            measurements = []
+            for index in sorted(self._measurements):
+                measurements.extend(self._measurements[index])
+
+        device_arns = sorted({chunk.device_arn for chunk in self.chunks})
+        status = TaskStatus.FAILED if self._failed_chunks else TaskStatus.COMPLETED
+
+        return TaskResult(
+            task_id=self.task_id,
+            status=status,
+            measurements=measurements,
+            counts=dict(self.counts) if self.counts else None,
+            device=device_arns[0] if len(device_arns) == 1 else ','.join(device_arns),
+            shots=self._completed_shots,
+            execution_time=execution_time,
+            metadata={
+                'split_execution': True,
+                'requested_shots': sum(chunk.shots for chunk in self.chunks),
+                'chunks': [
+                    {
+                        **chunk.model_dump(),
+                        'task_id': self._chunk_task_ids.get(chunk.index),
+                        'error': self._failed_chunks.get(chunk.index),
+                    }
+                    for chunk in self.chunks
+                ],
+            },
+        )
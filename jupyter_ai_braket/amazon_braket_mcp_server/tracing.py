@@ -0,0 +1,300 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Span tracing and per-tool latency statistics for the Braket MCP server.
+
+A span times one named unit of work, such as a tool call, a Braket API call or
+parsing a program. Spans nest through a context variable, so spans opened on a
+worker thread by `run_blocking` become children of the tool's span. Finished
+spans are kept in an in-memory ring buffer and, if BRAKET_MCP_TRACE_FILE is
+set, appended to that file as JSON lines; no collector is needed.
+
+Tool calls also record their latency and response size, which the
+`get_server_stats` tool reports as percentiles.
+"""
+
+import contextvars
+import functools
+import json
+import math
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Sequence, TypeVar
+
+from loguru import logger
+
+from .models import LatencyStats
+
+
+T = TypeVar('T')
+
+_current_span: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar('braket_current_span', default=None)
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Get the nearest-rank percentile of some values.
+
+    Args:
+        values: The values (need not be sorted)
+        q: Percentile between 0 and 100
+
+    Returns:
+        float: The smallest value that at least q percent of the values do not exceed,
+        or 0 if there are no values
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class Span:
+    """One timed unit of work."""
+
+    __slots__ = ('name', 'trace_id', 'span_id', 'parent_id', 'attributes', 'started_at', 'duration_ms', 'error', '_start')
+
+    def __init__(self, name: str, parent: Optional['Span'], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self.duration_ms: Optional[float] = None
+        self.error: Optional[str] = None
+        self._start = time.perf_counter()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a value to the span, e.g. whether a cache was hit."""
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the span as a JSON-serializable dictionary."""
+        return {
+            'name': self.name,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'started_at': self.started_at,
+            'duration_ms': self.duration_ms,
+            'error': self.error,
+            'attributes': self.attributes,
+        }
+
+
+class _Samples:
+    """Recent latencies and payload sizes of one tool or span name."""
+
+    def __init__(self, max_samples: int):
+        self.calls = 0
+        self.errors = 0
+        self.latencies_ms: Deque[float] = deque(maxlen=max_samples)
+        self.payload_bytes: Deque[int] = deque(maxlen=max_samples)
+
+    def stats(self, name: str) -> LatencyStats:
+        latencies = list(self.latencies_ms)
+        payloads = list(self.payload_bytes)
+        return LatencyStats(
+            name=name,
+            calls=self.calls,
+            errors=self.errors,
+            p50_ms=round(percentile(latencies, 50), 3),
+            p95_ms=round(percentile(latencies, 95), 3),
+            p99_ms=round(percentile(latencies, 99), 3),
+            max_ms=round(max(latencies, default=0.0), 3),
+            p50_payload_bytes=int(percentile(payloads, 50)) if payloads else None,
+            p95_payload_bytes=int(percentile(payloads, 95)) if payloads else None,
+            max_payload_bytes=max(payloads) if payloads else None,
+        )
+
+
+class Tracer:
+    """Thread-safe recorder of spans and tool call statistics."""
+
+    def __init__(self, max_spans: int = 2000, max_samples: int = 1000, export_path: Optional[str] = None):
+        """Initialize the tracer.
+
+        Args:
+            max_spans: Number of finished spans kept in memory
+            max_samples: Number of recent calls per name used for percentiles
+            export_path: JSON lines file that finished spans are appended to
+        """
+        self.max_samples = max_samples
+        self.export_path = export_path
+        self.started = time.time()
+        self._spans: Deque[Dict[str, Any]] = deque(maxlen=max_spans)
+        self._span_samples: Dict[str, _Samples] = {}
+        self._tool_samples: Dict[str, _Samples] = {}
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """Time a block of work as a child of the current span.
+
+        Args:
+            name: Span name, e.g. 'braket.get_task_result'
+            **attributes: Values to attach to the span
+
+        Yields:
+            Span: The open span, for adding attributes
+        """
+        span = Span(name, _current_span.get(), attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f'{type(e).__name__}: {e}'
+            raise
+        finally:
+            _current_span.reset(token)
+            self._finish(span)
+
+    def _finish(self, span: Span) -> None:
+        span.duration_ms = (time.perf_counter() - span._start) * 1000
+        record = span.to_dict()
+        with self._lock:
+            self._spans.append(record)
+            samples = self._span_samples.get(span.name)
+            if samples is None:
+                samples = self._span_samples[span.name] = _Samples(self.max_samples)
+            samples.calls += 1
+            samples.errors += span.error is not None
+            samples.latencies_ms.append(span.duration_ms)
+        if self.export_path:
+            self._export(record)
+
+    def _export(self, record: Dict[str, Any]) -> None:
+        try:
+            line = json.dumps(record, default=str) + '\n'
+            with self._export_lock, open(self.export_path, 'a', encoding='utf-8') as f:
+                f.write(line)
+        except OSError as e:
+            logger.warning(f"Could not export span to {self.export_path}: {e}; disabling export")
+            self.export_path = None
+
+    def record_tool_call(self, tool: str, seconds: float, payload_bytes: int, error: bool = False) -> None:
+        """Record the latency and response size of one tool call.
+
+        Args:
+            tool: Tool name
+            seconds: Time from the request to the response
+            payload_bytes: Size of the JSON response
+            error: Whether the tool returned an error
+        """
+        with self._lock:
+            samples = self._tool_samples.get(tool)
+            if samples is None:
+                samples = self._tool_samples[tool] = _Samples(self.max_samples)
+            samples.calls += 1
+            samples.errors += error
+            samples.latencies_ms.append(seconds * 1000)
+            samples.payload_bytes.append(payload_bytes)
+
+    def tool_stats(self) -> List[LatencyStats]:
+        """Get latency and payload percentiles per tool, most called first."""
+        with self._lock:
+            stats = [samples.stats(name) for name, samples in self._tool_samples.items()]
+        return sorted(stats, key=lambda s: (-s.calls, s.name))
+
+    def span_stats(self) -> List[LatencyStats]:
+        """Get latency percentiles per span name, slowest median first."""
+        with self._lock:
+            stats = [samples.stats(name) for name, samples in self._span_samples.items()]
+        return sorted(stats, key=lambda s: (-s.p50_ms, s.name))
+
+    def recent_spans(self, limit: int = 50, name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get the most recently finished spans, newest first.
+
+        Args:
+            limit: Maximum number of spans to return
+            name: Only spans with names starting with this prefix
+        """
+        with self._lock:
+            spans = list(self._spans)
+        spans.reverse()
+        if name:
+            spans = [span for span in spans if span['name'].startswith(name)]
+        return spans[:limit]
+
+    def instrument_client(self, client: Any) -> Any:
+        """Record every API call of a boto3 client as a span named after the operation.
+
+        Args:
+            client: A boto3 client
+
+        Returns:
+            The same client, for chaining
+        """
+        service_id = client.meta.service_model.service_id.hyphenize()
+        # botocore runs a call's events on the calling thread, so open spans are per thread
+        open_spans = threading.local()
+
+        def before_call(model, **kwargs):
+            context = self.span(f'aws.{service_id}.{model.name}')
+            context.__enter__()
+            open_spans.__dict__.setdefault('stack', []).append(context)
+
+        def after_call(exception=None, **kwargs):
+            stack = getattr(open_spans, 'stack', None)
+            if stack:
+                error_type = type(exception) if exception is not None else None
+                stack.pop().__exit__(error_type, exception, None)
+
+        client.meta.events.register(f'before-call.{service_id}', before_call)
+        client.meta.events.register(f'after-call.{service_id}', after_call)
+        client.meta.events.register(f'after-call-error.{service_id}', after_call)
+        return client
+
+    def clear(self) -> None:
+        """Drop all spans and statistics."""
+        with self._lock:
+            self._spans.clear()
+            self._span_samples.clear()
+            self._tool_samples.clear()
+
+
+_shared_tracer: Optional[Tracer] = None
+_shared_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Get the tracer shared by the whole process.
+
+    BRAKET_MCP_TRACE_FILE sets a JSON lines file to export spans to, and
+    BRAKET_MCP_TRACE_BUFFER the number of spans kept in memory (default 2000).
+    """
+    global _shared_tracer
+    if _shared_tracer is None:
+        with _shared_tracer_lock:
+            if _shared_tracer is None:
+                _shared_tracer = Tracer(
+                    max_spans=int(os.environ.get('BRAKET_MCP_TRACE_BUFFER', '2000')),
+                    export_path=os.environ.get('BRAKET_MCP_TRACE_FILE', '').strip() or None,
+                )
+    return _shared_tracer
+
+
+def traced(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorate a function so that each call is recorded as a span of the shared tracer."""
+    def decorator(fn: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            with get_tracer().span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
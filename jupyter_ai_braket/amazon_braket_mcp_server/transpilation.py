@@ -0,0 +1,327 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+
+"""Device-specific transpilation with a persistent cache.
+
+Circuits are mapped to a device's native gate set and qubit connectivity before
+submission. Routing is expensive, so results are cached in memory and on disk,
+keyed by (circuit hash, device ARN, capabilities version). A change in the
+device's reported capabilities invalidates its entries automatically.
+
+Routing runs on qubits compacted to 0..n-1, and the routed circuit is then
+relabeled to the device's own qubit labels, which can start above 0 or have
+gaps. OpenQASM does not carry the layout, so cached entries keep it in a JSON
+file next to the program.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from qiskit import QuantumCircuit as QiskitCircuit, QuantumRegister, qasm3, transpile
+from qiskit.circuit.library.standard_gates import get_standard_gate_name_mapping
+from qiskit.transpiler import CouplingMap, Layout, TranspileLayout
+from loguru import logger
+
+from .atomic_io import atomic_write_text
+from .device_selection import QISKIT_TO_BRAKET_GATES
+from .hashing import circuit_hash, json_hash, sha256_text
+
+
+BRAKET_TO_QISKIT_GATES = {braket: qiskit for qiskit, braket in QISKIT_TO_BRAKET_GATES.items()}
+
+
+def capabilities_version(device_document: Dict[str, Any]) -> str:
+    """Identify the version of a device's capabilities relevant to transpilation.
+
+    Args:
+        device_document: Response of the Braket `GetDevice` API, with
+            `deviceCapabilities` parsed from JSON
+
+    Returns:
+        str: Short digest of the paradigm (qubits and connectivity), supported
+        operations and the capabilities' update time
+    """
+    capabilities = device_document.get('deviceCapabilities', {})
+    relevant = {
+        'paradigm': capabilities.get('paradigm', {}),
+        'operations': capabilities.get('action', {}).get('braket.ir.openqasm.program', {}).get('supportedOperations', []),
+        'updated_at': capabilities.get('service', {}).get('updatedAt'),
+    }
+    return json_hash(relevant)[:16]
+
+
+def basis_gates_for_device(device_document: Dict[str, Any]) -> Optional[List[str]]:
+    """Get the Qiskit basis gates matching a device's supported operations.
+
+    Args:
+        device_document: Response of the Braket `GetDevice` API
+
+    Returns:
+        Optional[List[str]]: Qiskit gate names, or None if the device reports no
+        gates Qiskit can target (in which case gates are left untranslated)
+    """
+    capabilities = device_document.get('deviceCapabilities', {})
+    operations = capabilities.get('action', {}).get('braket.ir.openqasm.program', {}).get('supportedOperations', [])
+    standard_gates = get_standard_gate_name_mapping()
+
+    basis = set()
+    for operation in operations:
+        # Provider-native gates such as IonQ's gpi have no Qiskit equivalent
+        name = BRAKET_TO_QISKIT_GATES.get(operation.lower(), operation.lower())
+        if name in standard_gates:
+            basis.add(name)
+    if not basis:
+        return None
+    return sorted(basis)
+
+
+def device_qubit_labels(device_document: Dict[str, Any]) -> Optional[List[int]]:
+    """Get the sorted qubit labels of a device's connectivity graph.
+
+    Device qubit labels are not always contiguous from 0 (some providers
+    number from 1 or skip retired qubits).
+
+    Args:
+        device_document: Response of the Braket `GetDevice` API
+
+    Returns:
+        Optional[List[int]]: Qubit labels, or None for fully connected devices
+    """
+    paradigm = device_document.get('deviceCapabilities', {}).get('paradigm', {})
+    connectivity = paradigm.get('connectivity') or {}
+    if isinstance(connectivity, str):
+        connectivity = json.loads(connectivity) if connectivity else {}
+    graph = connectivity.get('connectivityGraph') or {}
+    if connectivity.get('fullyConnected') or not graph:
+        return None
+    return sorted({int(node) for node in graph} | {int(n) for edges in graph.values() for n in edges})
+
+
+def coupling_map_for_device(device_document: Dict[str, Any]) -> Optional[CouplingMap]:
+    """Build a Qiskit coupling map from a device's connectivity graph.
+
+    Labels are compacted to indices in sorted order: physical qubit i of the
+    map is device qubit `device_qubit_labels(device_document)[i]`.
+
+    Args:
+        device_document: Response of the Braket `GetDevice` API
+
+    Returns:
+        Optional[CouplingMap]: The coupling map, or None for fully connected devices
+    """
+    labels = device_qubit_labels(device_document)
+    if labels is None:
+        return None
+
+    connectivity = device_document['deviceCapabilities']['paradigm']['connectivity']
+    if isinstance(connectivity, str):
+        connectivity = json.loads(connectivity)
+    index = {label: i for i, label in enumerate(labels)}
+    edges = [
+        (index[int(node)], index[int(neighbor)])
+        for node, neighbors in connectivity['connectivityGraph'].items()
+        for neighbor in neighbors
+    ]
+    return CouplingMap(edges)
+
+
+def device_layout_data(layout: TranspileLayout, labels: List[int]) -> Dict[str, Any]:
+    """Describe the layout of a circuit routed on compacted qubits in device labels.
+
+    Args:
+        layout: Layout of the circuit returned by `transpile`
+        labels: Device qubit labels of the compacted physical qubits
+
+    Returns:
+        Dict[str, Any]: JSON-serializable layout with `num_qubits` (qubits of
+        the relabeled circuit), `input_qubits` (qubits of the original circuit),
+        `initial` (device qubit of each original and ancilla qubit) and `final`
+        (where routing moves the state of each device qubit)
+    """
+    num_qubits = max(labels) + 1
+    final = list(range(num_qubits))
+    for physical, moved_to in enumerate(layout.routing_permutation()):
+        final[labels[physical]] = labels[moved_to]
+    return {
+        'num_qubits': num_qubits,
+        'input_qubits': len(layout.final_index_layout(filter_ancillas=True)),
+        'initial': [labels[physical] for physical in layout.initial_index_layout()],
+        'final': final,
+    }
+
+
+def apply_device_layout(circuit: QiskitCircuit, layout_data: Dict[str, Any]) -> QiskitCircuit:
+    """Attach a layout from `device_layout_data` to a circuit on device qubits.
+
+    Args:
+        circuit: Circuit whose qubit i is device qubit i. It may have fewer
+            qubits than the device, e.g. when loaded from OpenQASM.
+
+    Returns:
+        QiskitCircuit: The circuit on all device qubits, with its layout set
+    """
+    num_qubits = layout_data['num_qubits']
+    if circuit.num_qubits < num_qubits:
+        padded = QiskitCircuit(QuantumRegister(num_qubits, 'q'), *circuit.cregs, name=circuit.name)
+        padded.compose(circuit, qubits=range(circuit.num_qubits), clbits=range(circuit.num_clbits), inplace=True)
+        circuit = padded
+
+    initial, input_qubits = layout_data['initial'], layout_data['input_qubits']
+    virtual = list(QuantumRegister(input_qubits, 'q'))
+    if len(initial) > input_qubits:
+        virtual.extend(QuantumRegister(len(initial) - input_qubits, 'ancilla'))
+    circuit._layout = TranspileLayout(
+        initial_layout=Layout({device: qubit for device, qubit in zip(initial, virtual)}),
+        input_qubit_mapping={qubit: index for index, qubit in enumerate(virtual)},
+        final_layout=Layout({circuit.qubits[index]: device for index, device in enumerate(layout_data['final'])}),
+        _input_qubit_count=input_qubits,
+        _output_qubit_list=list(circuit.qubits),
+    )
+    return circuit
+
+
+def to_device_qubits(circuit: QiskitCircuit, labels: List[int]) -> Tuple[QiskitCircuit, Dict[str, Any]]:
+    """Relabel a circuit routed on compacted qubits to the device's qubit labels.
+
+    Args:
+        circuit: Circuit returned by `transpile` with `coupling_map_for_device`
+        labels: Device qubit labels from `device_qubit_labels`
+
+    Returns:
+        Tuple[QiskitCircuit, Dict[str, Any]]: The circuit on device qubits with
+        its layout set, and the layout as returned by `device_layout_data`
+    """
+    relabeled = QiskitCircuit(*circuit.cregs, name=circuit.name)
+    relabeled.add_register(QuantumRegister(max(labels) + 1, 'q'))
+    relabeled.compose(
+        circuit,
+        qubits=[labels[index] for index in range(circuit.num_qubits)],
+        clbits=range(circuit.num_clbits),
+        inplace=True,
+    )
+    layout_data = device_layout_data(circuit.layout, labels)
+    return apply_device_layout(relabeled, layout_data), layout_data
+
+
+class TranspilationCache:
+    """LRU cache of transpiled circuits, backed by a directory of QASM files."""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = 256):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for persisted entries. If None, only the
+                in-memory cache is used.
+            max_entries: Maximum number of circuits kept in memory
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, QiskitCircuit] = OrderedDict()
+        self._lock = threading.Lock()
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(circuit: QiskitCircuit, device_arn: str, version: str) -> str:
+        """Build the cache key for a circuit on a device."""
+        return sha256_text(f"{circuit_hash(circuit)}|{device_arn}|{version}")
+
+    def get(self, key: str) -> Optional[QiskitCircuit]:
+        """Look up a transpiled circuit in memory, then on disk."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        if self.cache_dir:
+            path = self.cache_dir / f"{key}.qasm"
+            if path.exists():
+                try:
+                    circuit = qasm3.loads(path.read_text(encoding='utf-8'))
+                    layout_path = self.cache_dir / f"{key}.layout.json"
+                    if layout_path.exists():
+                        circuit = apply_device_layout(circuit, json.loads(layout_path.read_text(encoding='utf-8')))
+                    self._remember(key, circuit)
+                    return circuit
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable transpilation cache entry {path}: {str(e)}")
+        return None
+
+    def put(self, key: str, circuit: QiskitCircuit, layout_data: Optional[Dict[str, Any]] = None) -> None:
+        """Store a transpiled circuit in memory and on disk.
+
+        Args:
+            key: Cache key from `make_key`
+            circuit: Transpiled circuit
+            layout_data: Layout from `device_layout_data`, persisted next to the
+                program because OpenQASM does not carry it
+        """
+        self._remember(key, circuit)
+        if self.cache_dir:
+            try:
+                # The layout goes first, so a reader that finds the program finds its layout
+                if layout_data is not None:
+                    atomic_write_text(self.cache_dir / f"{key}.layout.json", json.dumps(layout_data))
+                atomic_write_text(self.cache_dir / f"{key}.qasm", qasm3.dumps(circuit))
+            except Exception as e:
+                logger.warning(f"Could not persist transpilation cache entry: {str(e)}")
+
+    def _remember(self, key: str, circuit: QiskitCircuit) -> None:
+        with self._lock:
+            self._entries[key] = circuit
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def transpile_for_device(
+    circuit: QiskitCircuit,
+    device_document: Dict[str, Any],
+    cache: TranspilationCache,
+    optimization_level: int = 1,
+) -> Tuple[QiskitCircuit, bool]:
+    """Transpile a circuit to a device's native gates and topology, using the cache.
+
+    Args:
+        circuit: Qiskit quantum circuit
+        device_document: Response of the Braket `GetDevice` API
+        cache: Cache of transpiled circuits
+        optimization_level: Qiskit transpiler optimization level
+
+    Returns:
+        Tuple[QiskitCircuit, bool]: The transpiled circuit, and whether it came
+        from the cache
+    """
+    device_arn = device_document.get('deviceArn', '')
+    key = TranspilationCache.make_key(circuit, device_arn, capabilities_version(device_document))
+    cached = cache.get(key)
+    if cached is not None:
+        logger.debug(f"Transpilation cache hit for {device_arn}")
+        return cached, True
+
+    logger.info(f"Transpiling {circuit.num_qubits}-qubit circuit for {device_arn}")
+    transpiled = transpile(
+        circuit,
+        basis_gates=basis_gates_for_device(device_document),
+        coupling_map=coupling_map_for_device(device_document),
+        optimization_level=optimization_level,
+        seed_transpiler=0,
+    )
+    layout_data = None
+    labels = device_qubit_labels(device_document)
+    if labels is not None:
+        transpiled, layout_data = to_device_qubits(transpiled, labels)
+    cache.put(key, transpiled, layout_data)
+    return transpiled, False
@@ -16,8 +16,11 @@ than base64 encoded images, making it easier for AI models to understand
 and reason about quantum circuits and their results.
 """
 
-from typing import Dict, List, Any, Union
-from ..models import QuantumCircuit, Gate, TaskResult
+from typing import Dict, List, Any, Optional, Union
+from ..models import HistogramBinning, QuantumCircuit, Gate, TaskResult
+from .circuit_layout import assign_moments, render_moments
+from .histogram import DEFAULT_TOP_K, bin_counts, parse_binning, top_k_counts
+from .result_statistics import ResultStatistics, get_result_statistics
 
 
 class ASCIICircuitVisualizer:
@@ -71,114 +74,39 @@ class ASCIICircuitVisualizer:
         """
         num_qubits = circuit.num_qubits
         gates = circuit.gates
-        
-        # Initialize circuit lines
-        lines = []
-        for i in range(num_qubits):
-            lines.append(f"q{i}: ")
-        
-        # Track current position for each qubit line
-        positions = [len(f"q{i}: ") for i in range(num_qubits)]
-        max_pos = max(positions)
-        
-        # Pad all lines to same length
-        for i in range(num_qubits):
-            lines[i] += "─" * (max_pos - positions[i])
-        
-        # Process each gate
-        gate_descriptions = []
-        for gate in gates:
-            if gate.name == 'measure_all':
-                # Add measurement to all qubits
-                for i in range(num_qubits):
-                    lines[i] += "─M─"
-                gate_descriptions.append("Measure all qubits")
-                continue
-                
-            if gate.name in ['h', 'x', 'y', 'z', 's', 't']:
-                # Single qubit gates
-                qubit = gate.qubits[0] if gate.qubits else 0
-                symbol = self.GATE_SYMBOLS.get(gate.name, gate.name.upper())
-                
-                # Pad other lines
-                for i in range(num_qubits):
-                    if i == qubit:
-                        lines[i] += f"─{symbol}─"
-                    else:
-                        lines[i] += "─" * (len(symbol) + 2)
-                        
-                gate_descriptions.append(f"{symbol} gate on qubit {qubit}")
-                
-            elif gate.name in ['rx', 'ry', 'rz']:
-                # Rotation gates with parameters
-                qubit = gate.qubits[0] if gate.qubits else 0
-                symbol = self.GATE_SYMBOLS.get(gate.name, gate.name.upper())
-                param = gate.params[0] if gate.params else 0
-                
-                # Format parameter
-                param_str = f"({param:.2f})" if isinstance(param, (int, float)) else f"({param})"
-                full_symbol = f"{symbol}{param_str}"
-                
-                # Pad other lines
-                for i in range(num_qubits):
-                    if i == qubit:
-                        lines[i] += f"─{full_symbol}─"
-                    else:
-                        lines[i] += "─" * (len(full_symbol) + 2)
-                        
-                gate_descriptions.append(f"{symbol} rotation gate on qubit {qubit} with parameter {param}")
-                
-            elif gate.name == 'cx':
-                # CNOT gate
-                control = gate.qubits[0] if len(gate.qubits) > 0 else 0
-                target = gate.qubits[1] if len(gate.qubits) > 1 else 1
-                
-                for i in range(num_qubits):
-                    if i == control:
-                        lines[i] += "─●─"
-                    elif i == target:
-                        lines[i] += "─X─"
-                    else:
-                        lines[i] += "─│─"
-                        
-                gate_descriptions.append(f"CNOT gate: control qubit {control}, target qubit {target}")
-                
-            elif gate.name == 'swap':
-                # SWAP gate
-                qubit1 = gate.qubits[0] if len(gate.qubits) > 0 else 0
-                qubit2 = gate.qubits[1] if len(gate.qubits) > 1 else 1
-                
-                for i in range(num_qubits):
-                    if i == qubit1 or i == qubit2:
-                        lines[i] += "─x─"
-                    else:
-                        lines[i] += "─│─"
-                        
-                gate_descriptions.append(f"SWAP gate between qubits {qubit1} and {qubit2}")
-                
-            else:
-                # Generic gate representation
-                symbol = gate.name.upper()[:3]  # Truncate to 3 chars
-                affected_qubits = gate.qubits if gate.qubits else [0]
-                
-                for i in range(num_qubits):
-                    if i in affected_qubits:
-                        lines[i] += f"─{symbol}─"
-                    else:
-                        lines[i] += "─" * (len(symbol) + 2)
-                        
-                gate_descriptions.append(f"{gate.name} gate on qubits {affected_qubits}")
-        
-        # Join lines
-        ascii_circuit = "\n".join(lines)
-        
+
+        # Pack gates on disjoint wires into shared columns
+        moments = assign_moments(gates, num_qubits)
+        ascii_circuit = render_moments(moments, num_qubits)
+
         return {
             "ascii_circuit": ascii_circuit,
-            "gate_sequence": gate_descriptions,
+            "gate_sequence": [self._describe_gate(gate) for gate in gates],
             "num_qubits": num_qubits,
             "num_gates": len(gates),
+            "num_moments": len(moments),
             "description": self._generate_circuit_description(circuit)
         }
+
+    def _describe_gate(self, gate: Gate) -> str:
+        """Describe one gate for the gate sequence."""
+        qubits = gate.qubits
+        if gate.name == 'measure_all':
+            return "Measure all qubits"
+        if gate.name in ['rx', 'ry', 'rz']:
+            param = gate.params[0] if gate.params else 0
+            return f"{gate.name.upper()} rotation gate on qubit {qubits[0] if qubits else 0} with parameter {param}"
+        if gate.name == 'cx' and len(qubits) == 2:
+            return f"CNOT gate: control qubit {qubits[0]}, target qubit {qubits[1]}"
+        if gate.name in ['cy', 'cz'] and len(qubits) == 2:
+            return f"Controlled-{gate.name[1].upper()} gate: control qubit {qubits[0]}, target qubit {qubits[1]}"
+        if gate.name == 'ccx' and len(qubits) == 3:
+            return f"Toffoli gate: control qubits {qubits[0]} and {qubits[1]}, target qubit {qubits[2]}"
+        if gate.name == 'swap' and len(qubits) == 2:
+            return f"SWAP gate between qubits {qubits[0]} and {qubits[1]}"
+        if len(qubits) == 1:
+            return f"{self.GATE_SYMBOLS.get(gate.name, gate.name.upper())} gate on qubit {qubits[0]}"
+        return f"{gate.name} gate on qubits {qubits or [0]}"
     
     def _generate_circuit_description(self, circuit: QuantumCircuit) -> str:
         """Generate a human-readable description of the circuit.
@@ -241,23 +169,45 @@ class ASCIIResultsVisualizer:
         """Initialize the ASCII results visualizer."""
         pass
     
-    def visualize_results(self, result: TaskResult) -> str:
+    def visualize_results(
+        self,
+        result: TaskResult,
+        top_k: int = DEFAULT_TOP_K,
+        bin_by: str = HistogramBinning.OUTCOME.value,
+        qubits: Optional[List[int]] = None,
+    ) -> str:
         """Main method to visualize results as ASCII.
         
         Args:
             result: The quantum task result to visualize
+            top_k: Maximum number of bars before the rest are folded into "other"
+            bin_by: 'outcome', 'hamming_weight' or 'qubits'
+            qubits: Bitstring positions to keep when binning by qubits
             
         Returns:
             ASCII string representation of the results
         """
-        result_data = self.results_to_ascii(result)
+        result_data = self.results_to_ascii(result, top_k=top_k, bin_by=bin_by, qubits=qubits)
         return result_data["ascii_histogram"]
     
-    def results_to_ascii(self, result: TaskResult) -> Dict[str, Any]:
+    def results_to_ascii(
+        self,
+        result: TaskResult,
+        top_k: int = DEFAULT_TOP_K,
+        bin_by: str = HistogramBinning.OUTCOME.value,
+        qubits: Optional[List[int]] = None,
+    ) -> Dict[str, Any]:
         """Convert quantum task results to ASCII representation.
         
+        The histogram has at most `top_k` bars plus an "other" bar, however
+        many distinct outcomes were measured. Outcomes can first be grouped by
+        Hamming weight or by the bits of a subset of qubits.
+        
         Args:
             result: The quantum task result
+            top_k: Maximum number of bars before the rest are folded into "other"
+            bin_by: 'outcome', 'hamming_weight' or 'qubits'
+            qubits: Bitstring positions to keep when binning by qubits
             
         Returns:
             Dictionary containing ASCII representation and analysis
@@ -268,30 +218,45 @@ class ASCIIResultsVisualizer:
                 "analysis": {"error": "No counts data"}
             }
         
-        # Sort counts by binary value
-        sorted_counts = dict(sorted(result.counts.items()))
-        total_shots = sum(sorted_counts.values())
+        binning = parse_binning(bin_by)
+        bins = bin_counts(result.counts, binning, qubits)
+        total_shots = sum(bins.values())
+        
+        # Hamming weight bins are bounded by the register width and kept in weight order
+        if binning == HistogramBinning.HAMMING_WEIGHT:
+            top, other_outcomes, other_shots = list(bins.items()), 0, 0
+            labels = [label for label, _ in top]
+        else:
+            top, other_outcomes, other_shots = top_k_counts(bins, top_k)
+            top.sort()
+            labels = [f"|{state}⟩" for state, _ in top]
+        rows = list(zip(labels, (count for _, count in top)))
+        if other_outcomes:
+            rows.append((f"other ({other_outcomes})", other_shots))
         
         # Create ASCII histogram
-        max_count = max(sorted_counts.values())
+        max_count = max(count for _, count in rows)
         max_bar_length = 40  # Maximum bar length in characters
+        label_width = max(len(label) for label, _ in rows)
         
         histogram_lines = []
         histogram_lines.append("Measurement Results Histogram:")
         histogram_lines.append("=" * 50)
         
-        for state, count in sorted_counts.items():
+        for label, count in rows:
             # Calculate bar length
             bar_length = int((count / max_count) * max_bar_length)
             bar = "█" * bar_length
             percentage = (count / total_shots) * 100
             
             # Format line
-            line = f"|{state}⟩: {bar:<{max_bar_length}} {count:>4} ({percentage:5.1f}%)"
+            line = f"{label:<{label_width}}: {bar:<{max_bar_length}} {count:>4} ({percentage:5.1f}%)"
             histogram_lines.append(line)
         
         histogram_lines.append("=" * 50)
         histogram_lines.append(f"Total shots: {total_shots}")
+        if other_outcomes:
+            histogram_lines.append(f"Showing {len(top)} of {len(bins)} {'outcomes' if binning == HistogramBinning.OUTCOME else 'bins'}")
         
         ascii_histogram = "\n".join(histogram_lines)
         
@@ -300,6 +265,10 @@ class ASCIIResultsVisualizer:
         
         return {
             "ascii_histogram": ascii_histogram,
+            "binning": binning.value,
+            "num_bins": len(bins),
+            "other_outcomes": other_outcomes,
+            "other_shots": other_shots,
             "analysis": analysis,
             "summary": self._generate_summary(result, analysis)
         }
@@ -313,39 +282,29 @@ class ASCIIResultsVisualizer:
         Returns:
             Dictionary containing analysis results
         """
-        if not result.counts:
+        stats = get_result_statistics(result)
+        if stats is None:
             return {"error": "No measurement data"}
         
-        sorted_counts = dict(sorted(result.counts.items()))
-        total_shots = sum(sorted_counts.values())
-        
-        # Basic statistics
-        num_unique_states = len(sorted_counts)
-        most_probable_state = max(sorted_counts.items(), key=lambda x: x[1])
-        least_probable_state = min(sorted_counts.items(), key=lambda x: x[1])
-        
-        # Calculate probabilities
-        probabilities = {state: count/total_shots for state, count in sorted_counts.items()}
-        
         # Detect quantum phenomena
         analysis = {
-            "total_shots": total_shots,
-            "unique_states_measured": num_unique_states,
-            "most_probable_state": most_probable_state[0],
-            "most_probable_count": most_probable_state[1],
-            "most_probable_probability": most_probable_state[1] / total_shots,
-            "probability_distribution": probabilities,
+            "total_shots": stats.total_shots,
+            "unique_states_measured": stats.num_outcomes,
+            "most_probable_state": stats.most_probable,
+            "most_probable_count": stats.most_probable_count,
+            "most_probable_probability": stats.max_probability,
+            "probability_distribution": stats.probabilities,
         }
         
         # Detect entanglement patterns
-        if self._detect_bell_pair_pattern(sorted_counts):
+        if self._detect_bell_pair_pattern(stats):
             analysis["quantum_phenomenon"] = "Bell pair entanglement"
             analysis["entanglement_detected"] = True
-            analysis["classical_correlation"] = self._calculate_correlation(sorted_counts)
-        elif self._detect_ghz_pattern(sorted_counts):
+            analysis["classical_correlation"] = self._calculate_correlation(stats)
+        elif self._detect_ghz_pattern(stats):
             analysis["quantum_phenomenon"] = "GHZ state entanglement"
             analysis["entanglement_detected"] = True
-        elif self._detect_superposition_pattern(sorted_counts):
+        elif self._detect_superposition_pattern(stats):
             analysis["quantum_phenomenon"] = "Quantum superposition"
             analysis["superposition_detected"] = True
         else:
@@ -354,53 +313,28 @@ class ASCIIResultsVisualizer:
         
         return analysis
     
-    def _detect_bell_pair_pattern(self, counts: Dict[str, int]) -> bool:
+    def _detect_bell_pair_pattern(self, stats: ResultStatistics) -> bool:
         """Detect if results show Bell pair entanglement pattern."""
         # Bell pairs should only show |00⟩ and |11⟩ states
-        states = set(counts.keys())
-        return states.issubset({'00', '11'}) and len(states) == 2
+        return stats.num_outcomes == 2 and stats.outcomes_within({'00', '11'})
     
-    def _detect_ghz_pattern(self, counts: Dict[str, int]) -> bool:
+    def _detect_ghz_pattern(self, stats: ResultStatistics) -> bool:
         """Detect if results show GHZ state pattern."""
         # GHZ states should show all-0s and all-1s states
-        states = set(counts.keys())
-        if len(states) != 2:
+        if stats.num_outcomes != 2:
             return False
-        
-        # Check if we have complementary all-0s and all-1s states
-        state_list = list(states)
-        if len(state_list[0]) != len(state_list[1]):
-            return False
-        
-        return (set(state_list[0]) == {'0'} and set(state_list[1]) == {'1'}) or \
-               (set(state_list[0]) == {'1'} and set(state_list[1]) == {'0'})
+        width = len(stats.outcomes[0])
+        return stats.outcomes_within({'0' * width, '1' * width})
     
-    def _detect_superposition_pattern(self, counts: Dict[str, int]) -> bool:
+    def _detect_superposition_pattern(self, stats: ResultStatistics) -> bool:
         """Detect if results show superposition pattern."""
         # Superposition typically shows relatively uniform distribution
-        if len(counts) < 2:
-            return False
-        
-        total = sum(counts.values())
-        expected_prob = 1.0 / len(counts)
-        
-        # Check if probabilities are reasonably uniform (within 20% of expected)
-        for count in counts.values():
-            prob = count / total
-            if abs(prob - expected_prob) > 0.2:
-                return False
-        
-        return True
+        # (every probability within 20% of the uniform one)
+        return stats.num_outcomes >= 2 and stats.max_deviation_from_uniform <= 0.2
     
-    def _calculate_correlation(self, counts: Dict[str, int]) -> float:
+    def _calculate_correlation(self, stats: ResultStatistics) -> float:
         """Calculate classical correlation for two-qubit states."""
-        if len(counts) == 0:
-            return 0.0
-        
-        total = sum(counts.values())
-        correlated_count = counts.get('00', 0) + counts.get('11', 0)
-        
-        return correlated_count / total
+        return stats.probability('00') + stats.probability('11')
     
     def _generate_summary(self, result: TaskResult, analysis: Dict[str, Any]) -> str:
         """Generate a human-readable summary of the results.
@@ -0,0 +1,172 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Moment-packed ASCII layout for quantum circuits.
+
+Gates are assigned to moments as early as possible: a gate goes into the first
+moment after the last one that touched any wire it covers. A multi-qubit gate
+covers every wire between its outermost qubits, because its vertical connector
+is drawn across them. Gates on disjoint wires therefore share a column, and the
+diagram is as wide as the circuit is deep rather than as long as its gate list.
+
+Each wire is built as a list of cell strings and joined once at the end.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+from ..models import Gate
+
+
+# Controlled gates: number of leading control qubits and the target symbol
+CONTROLLED_GATES: Dict[str, Tuple[int, str]] = {
+    'cx': (1, 'X'),
+    'cnot': (1, 'X'),
+    'cy': (1, 'Y'),
+    'cz': (1, 'Z'),
+    'ch': (1, 'H'),
+    'ccx': (2, 'X'),
+    'ccnot': (2, 'X'),
+    'cswap': (1, 'x'),
+}
+
+# Single-qubit gates drawn with a fixed symbol
+GATE_SYMBOLS = {
+    'h': 'H',
+    'x': 'X',
+    'y': 'Y',
+    'z': 'Z',
+    's': 'S',
+    't': 'T',
+    'sdg': 'S†',
+    'tdg': 'T†',
+    'measure': 'M',
+}
+
+# Gates drawn with their first parameter
+PARAMETERIZED_GATES = {'rx': 'RX', 'ry': 'RY', 'rz': 'RZ', 'p': 'P', 'phaseshift': 'P'}
+
+# Operations that act on every wire when they list no qubits
+ALL_QUBIT_OPERATIONS = {'measure_all', 'barrier'}
+
+CONTROL = '●'
+CONNECTOR = '│'
+WIRE = '─'
+
+
+def gate_wires(gate: Gate, num_qubits: int) -> List[int]:
+    """Get the wires a gate acts on."""
+    if gate.name == 'measure_all' or (gate.name == 'barrier' and not gate.qubits):
+        return list(range(num_qubits))
+    return list(gate.qubits) if gate.qubits else [0]
+
+
+def assign_moments(gates: Sequence[Gate], num_qubits: int) -> List[List[Gate]]:
+    """Pack gates into moments, keeping the order of gates that share a wire.
+
+    Rows of the diagram have no lines between them, so a multi-qubit gate never
+    shares a moment with a gate on the wire just above or below it; otherwise
+    the two would read as one larger gate. Runs in O(total wire span of all gates).
+
+    Args:
+        gates: Gates in circuit order
+        num_qubits: Number of qubits in the circuit
+
+    Returns:
+        List[List[Gate]]: Gates of each moment, in circuit order
+    """
+    # First moment after the last gate, and after the last multi-qubit gate, on
+    # each wire. Two padding wires avoid bounds checks for the neighbours.
+    size = max(num_qubits, 1) + 2
+    frontier = [0] * size
+    multi_frontier = [0] * size
+    moments: List[List[Gate]] = []
+    for gate in gates:
+        wires = gate_wires(gate, num_qubits)
+        low, high = min(wires) + 1, max(wires) + 1
+        if high + 1 >= len(frontier):
+            frontier.extend([0] * (high + 2 - len(frontier)))
+            multi_frontier.extend([0] * (high + 2 - len(multi_frontier)))
+
+        multi = len(wires) > 1
+        if multi:
+            moment = max(frontier[low - 1:high + 2])
+        else:
+            moment = max(frontier[low], multi_frontier[low - 1], multi_frontier[low + 1])
+
+        if moment >= len(moments):
+            moments.extend([] for _ in range(moment + 1 - len(moments)))
+        moments[moment].append(gate)
+        for wire in range(low, high + 1):
+            frontier[wire] = moment + 1
+            if multi:
+                multi_frontier[wire] = moment + 1
+    return moments
+
+
+def gate_labels(gate: Gate, num_qubits: int) -> Dict[int, str]:
+    """Get the symbol drawn on each wire a gate acts on."""
+    wires = gate_wires(gate, num_qubits)
+    name = gate.name.lower()
+
+    if name in CONTROLLED_GATES:
+        num_controls, target = CONTROLLED_GATES[name]
+        labels = {wire: CONTROL for wire in wires[:num_controls]}
+        labels.update({wire: target for wire in wires[num_controls:]})
+        return labels
+    if name == 'swap':
+        return {wire: 'x' for wire in wires}
+    if name in ('measure_all', 'measure'):
+        return {wire: 'M' for wire in wires}
+    if name == 'barrier':
+        return {wire: '║' for wire in wires}
+    if name in PARAMETERIZED_GATES:
+        param = gate.params[0] if gate.params else 0
+        param_str = f"{param:.2f}" if isinstance(param, (int, float)) else str(param)
+        return {wire: f"{PARAMETERIZED_GATES[name]}({param_str})" for wire in wires}
+    symbol = GATE_SYMBOLS.get(name, name.upper()[:3])
+    return {wire: symbol for wire in wires}
+
+
+def moment_cells(moment: Sequence[Gate], num_qubits: int) -> Dict[int, str]:
+    """Get the symbol drawn on each wire in one moment, including connectors."""
+    cells: Dict[int, str] = {}
+    for gate in moment:
+        labels = gate_labels(gate, num_qubits)
+        cells.update(labels)
+        # Vertical connector across the wires between the gate's outermost qubits
+        if len(labels) > 1:
+            for wire in range(min(labels), max(labels)):
+                cells.setdefault(wire, CONNECTOR)
+    return cells
+
+
+def render_moments(moments: Sequence[Sequence[Gate]], num_qubits: int) -> str:
+    """Draw packed moments as one text line per qubit.
+
+    Args:
+        moments: Gates of each moment, as returned by `assign_moments`
+        num_qubits: Number of qubits in the circuit
+
+    Returns:
+        str: The diagram
+    """
+    label_width = len(f"q{max(num_qubits - 1, 0)}")
+    rows: List[List[str]] = [[f"q{i}".ljust(label_width) + ": "] for i in range(num_qubits)]
+
+    for moment in moments:
+        cells = moment_cells(moment, num_qubits)
+        width = max((len(cell) for cell in cells.values()), default=1)
+        idle = WIRE * (width + 2)
+        for wire, row in enumerate(rows):
+            cell = cells.get(wire)
+            row.append(idle if cell is None else WIRE + cell.center(width, WIRE) + WIRE)
+
+    return "\n".join("".join(row) for row in rows)
@@ -0,0 +1,224 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Streaming text and SVG diagrams for deep circuits.
+
+`render_moments` builds a whole diagram in memory, which is fine for the
+circuits shown inline in a chat but not for circuits with hundreds of thousands
+of gates. The writers here yield a diagram in chunks so that it can be written
+to a file or sent to the browser as it is produced, and they draw only a window
+of moments, so a frontend can page through a deep circuit without rendering the
+parts it does not show.
+
+SVG diagrams are yielded one moment per `<g>` element. A text line spans every
+moment of a diagram, so text diagrams are folded into blocks of `fold` moments
+and yielded one block at a time.
+"""
+
+from typing import Any, Iterator, List, Optional, Sequence, TextIO, Tuple
+from xml.sax.saxutils import escape
+
+from ..models import DiagramFormat, Gate
+from .circuit_layout import CONTROL, gate_labels, moment_cells, render_moments
+
+
+# Moments per page when a window is requested by page number
+DEFAULT_PAGE_SIZE = 50
+
+# Moments per block of a text diagram
+DEFAULT_TEXT_FOLD = 20
+
+# SVG geometry (pixels)
+SVG_LABEL_WIDTH = 48
+SVG_HEADER_HEIGHT = 24
+SVG_ROW_HEIGHT = 40
+SVG_MIN_COLUMN_WIDTH = 40
+SVG_CHAR_WIDTH = 8
+SVG_BOX_HEIGHT = 24
+SVG_CONTROL_RADIUS = 5
+
+
+def gates_from_qiskit(circuit: Any) -> List[Gate]:
+    """Convert the instructions of a Qiskit circuit to gates.
+
+    Parameters that are not numbers, such as unbound parameter expressions,
+    are dropped rather than evaluated.
+
+    Args:
+        circuit: A Qiskit QuantumCircuit
+
+    Returns:
+        List[Gate]: Gates in circuit order, with qubit indices into the circuit
+    """
+    gates = []
+    for instruction in circuit.data:
+        params = []
+        for param in instruction.operation.params:
+            try:
+                params.append(float(param))
+            except (TypeError, ValueError):
+                break
+        gates.append(Gate(
+            name=instruction.operation.name,
+            qubits=[circuit.find_bit(qubit).index for qubit in instruction.qubits],
+            params=params or None,
+        ))
+    return gates
+
+
+def page_window(page: int, page_size: int = DEFAULT_PAGE_SIZE) -> Tuple[int, int]:
+    """Get the moments shown on a page.
+
+    Args:
+        page: Zero-based page number
+        page_size: Moments per page
+
+    Returns:
+        Tuple[int, int]: First moment and the moment after the last one
+
+    Raises:
+        ValueError: If the page is negative or the page size is not positive
+    """
+    if page < 0:
+        raise ValueError(f"Page must not be negative, got {page}")
+    if page_size <= 0:
+        raise ValueError(f"Page size must be a positive integer, got {page_size}")
+    return page * page_size, (page + 1) * page_size
+
+
+def iter_diagram(
+    moments: Sequence[Sequence[Gate]],
+    num_qubits: int,
+    diagram_format: DiagramFormat = DiagramFormat.TEXT,
+    start: int = 0,
+    stop: Optional[int] = None,
+    fold: int = DEFAULT_TEXT_FOLD,
+) -> Iterator[str]:
+    """Yield a diagram of a window of moments in chunks.
+
+    Args:
+        moments: Moments of the circuit, as returned by `assign_moments`
+        num_qubits: Number of qubits in the circuit
+        diagram_format: Text or SVG
+        start: First moment to draw
+        stop: Moment after the last one to draw (defaults to the last moment)
+        fold: Moments per block of a text diagram
+
+    Returns:
+        Iterator[str]: Chunks of the diagram, which concatenate to the whole diagram
+    """
+    start = max(start, 0)
+    stop = len(moments) if stop is None else min(stop, len(moments))
+    if diagram_format == DiagramFormat.SVG:
+        return _iter_svg(moments, num_qubits, start, stop)
+    return _iter_text(moments, num_qubits, start, stop, max(fold, 1))
+
+
+def write_diagram(out: TextIO, *args: Any, **kwargs: Any) -> int:
+    """Write a diagram of a window of moments to a stream as it is drawn.
+
+    Takes the same arguments as `iter_diagram` after the stream.
+
+    Returns:
+        int: Number of characters written
+    """
+    written = 0
+    for chunk in iter_diagram(*args, **kwargs):
+        written += out.write(chunk)
+    return written
+
+
+def _iter_text(
+    moments: Sequence[Sequence[Gate]], num_qubits: int, start: int, stop: int, fold: int
+) -> Iterator[str]:
+    """Yield a text diagram one block of moments at a time, blocks separated by a blank line."""
+    for block_start in range(start, stop, fold):
+        block = moments[block_start:min(block_start + fold, stop)]
+        prefix = "" if block_start == start else "\n"
+        yield prefix + render_moments(block, num_qubits) + "\n"
+
+
+def _column_width(moment: Sequence[Gate], num_qubits: int) -> int:
+    """Width of the SVG column of a moment, wide enough for its longest label."""
+    longest = max((len(cell) for cell in moment_cells(moment, num_qubits).values()), default=1)
+    return max(SVG_MIN_COLUMN_WIDTH, longest * SVG_CHAR_WIDTH + 16)
+
+
+def _wire_y(wire: int) -> int:
+    """Vertical position of a wire in an SVG diagram."""
+    return SVG_HEADER_HEIGHT + wire * SVG_ROW_HEIGHT + SVG_ROW_HEIGHT // 2
+
+
+def _svg_gate(gate: Gate, num_qubits: int, x: int) -> List[str]:
+    """Draw one gate centred on `x`."""
+    labels = gate_labels(gate, num_qubits)
+    elements = []
+    if len(labels) > 1:
+        elements.append(
+            f'<line x1="{x}" y1="{_wire_y(min(labels))}" x2="{x}" y2="{_wire_y(max(labels))}" class="connector"/>'
+        )
+    for wire, label in labels.items():
+        y = _wire_y(wire)
+        if label == CONTROL:
+            elements.append(f'<circle cx="{x}" cy="{y}" r="{SVG_CONTROL_RADIUS}" class="control"/>')
+        elif label == '║':
+            half = SVG_ROW_HEIGHT // 2
+            elements.append(f'<line x1="{x}" y1="{y - half}" x2="{x}" y2="{y + half}" class="barrier"/>')
+        else:
+            width = len(label) * SVG_CHAR_WIDTH + 8
+            elements.append(
+                f'<rect x="{x - width // 2}" y="{y - SVG_BOX_HEIGHT // 2}" width="{width}" '
+                f'height="{SVG_BOX_HEIGHT}" class="gate"/>'
+                f'<text x="{x}" y="{y}">{escape(label)}</text>'
+            )
+    return elements
+
+
+def _iter_svg(moments: Sequence[Sequence[Gate]], num_qubits: int, start: int, stop: int) -> Iterator[str]:
+    """Yield an SVG diagram one moment at a time.
+
+    Column widths are measured in a first pass over the window, because the
+    document size is declared in the opening tag.
+    """
+    widths = [_column_width(moments[index], num_qubits) for index in range(start, stop)]
+    width = SVG_LABEL_WIDTH + sum(widths)
+    height = SVG_HEADER_HEIGHT + num_qubits * SVG_ROW_HEIGHT
+
+    header = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" data-start="{start}" data-stop="{stop}">',
+        '<style>'
+        'text{font:13px monospace;text-anchor:middle;dominant-baseline:central}'
+        '.wire,.connector{stroke:#000}'
+        '.barrier{stroke:#888;stroke-dasharray:4}'
+        '.gate{fill:#fff;stroke:#000}'
+        '.control{fill:#000}'
+        '.moment{fill:#888;font-size:10px}'
+        '</style>',
+        '<rect width="100%" height="100%" fill="#fff"/>',
+    ]
+    for wire in range(num_qubits):
+        y = _wire_y(wire)
+        header.append(f'<line x1="{SVG_LABEL_WIDTH}" y1="{y}" x2="{width}" y2="{y}" class="wire"/>')
+        header.append(f'<text x="{SVG_LABEL_WIDTH // 2}" y="{y}">q{wire}</text>')
+    yield "\n".join(header) + "\n"
+
+    left = SVG_LABEL_WIDTH
+    for index, column_width in zip(range(start, stop), widths):
+        x = left + column_width // 2
+        elements = [f'<g data-moment="{index}">', f'<text x="{x}" y="{SVG_HEADER_HEIGHT // 2}" class="moment">{index}</text>']
+        for gate in moments[index]:
+            elements.extend(_svg_gate(gate, num_qubits, x))
+        elements.append('</g>')
+        yield "".join(elements) + "\n"
+        left += column_width
+
+    yield "</svg>\n"
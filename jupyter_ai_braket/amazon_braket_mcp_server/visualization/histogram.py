@@ -0,0 +1,109 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Bounded histograms of measurement counts.
+
+Wide registers can produce thousands of distinct bitstrings, so a histogram
+with one bar per outcome grows with the number of shots. The helpers here keep
+the output bounded, either by keeping the most frequent outcomes and folding
+the rest into an "other" bucket, or by grouping outcomes into bins.
+"""
+
+import heapq
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..models import HistogramBinning
+
+
+# Bars shown before the remaining outcomes are folded into "other"
+DEFAULT_TOP_K = 16
+
+
+def top_k_counts(counts: Dict[str, int], k: int = DEFAULT_TOP_K) -> Tuple[List[Tuple[str, int]], int, int]:
+    """Select the most frequent outcomes without sorting all of them.
+
+    Args:
+        counts: Measurement counts keyed by bitstring
+        k: Number of outcomes to keep
+
+    Returns:
+        Tuple[List[Tuple[str, int]], int, int]: The kept outcomes, most frequent
+        first (ties by bitstring), then the number of outcomes and shots folded
+        into "other"
+    """
+    if k <= 0:
+        raise ValueError(f"top_k must be a positive integer, got {k}")
+    if len(counts) <= k:
+        top = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    else:
+        top = heapq.nsmallest(k, counts.items(), key=lambda item: (-item[1], item[0]))
+    other_shots = sum(counts.values()) - sum(count for _, count in top)
+    return top, len(counts) - len(top), other_shots
+
+
+def bin_counts(
+    counts: Dict[str, int],
+    binning: HistogramBinning,
+    qubits: Optional[Sequence[int]] = None,
+) -> Dict[str, int]:
+    """Group measurement counts into bins.
+
+    Args:
+        counts: Measurement counts keyed by bitstring
+        binning: How to group the outcomes
+        qubits: Positions in the bitstring kept for HistogramBinning.QUBITS,
+                0 being the leftmost bit
+
+    Returns:
+        Dict[str, int]: Counts keyed by bin label, e.g. 'w=2' for Hamming weight
+        2 or the bitstring of the selected qubits
+
+    Raises:
+        ValueError: If qubits are missing or out of range for HistogramBinning.QUBITS
+    """
+    if binning == HistogramBinning.OUTCOME:
+        return dict(counts)
+
+    bins: Counter = Counter()
+    if binning == HistogramBinning.HAMMING_WEIGHT:
+        for state, count in counts.items():
+            bins[state.count('1')] += count
+        return {f"w={weight}": bins[weight] for weight in sorted(bins)}
+
+    if not qubits:
+        raise ValueError("qubits are required to bin outcomes by a subset of qubits")
+    width = min((len(state) for state in counts), default=0)
+    out_of_range = [qubit for qubit in qubits if not 0 <= qubit < width]
+    if out_of_range:
+        raise ValueError(f"Qubits {out_of_range} are out of range for {width}-bit outcomes")
+    for state, count in counts.items():
+        bins[''.join(state[qubit] for qubit in qubits)] += count
+    return dict(bins)
+
+
+def parse_binning(bin_by: str) -> HistogramBinning:
+    """Parse a histogram binning given as a tool argument.
+
+    Args:
+        bin_by: 'outcome', 'hamming_weight' or 'qubits' (case-insensitive)
+
+    Returns:
+        HistogramBinning: The parsed binning
+
+    Raises:
+        ValueError: If the binning is unknown
+    """
+    try:
+        return HistogramBinning(str(bin_by).lower())
+    except ValueError:
+        valid = ', '.join(binning.value for binning in HistogramBinning)
+        raise ValueError(f"Unknown binning '{bin_by}', expected one of: {valid}")
@@ -0,0 +1,210 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Off-thread rendering of result plots.
+
+Importing matplotlib and setting up its first figure costs hundreds of
+milliseconds, and drawing a PNG holds the GIL for the whole render. Result
+plots are therefore drawn in a worker process that loads the Agg backend once
+and keeps it warm for later plots. PNGs are cached by a hash of the counts,
+title and style, and concurrent requests for the same plot share one render.
+
+Plots are drawn on a `Figure` with an Agg canvas rather than through pyplot,
+so no global figure state is shared between renders. Set
+BRAKET_MCP_RENDER_PROCESSES to 0 to render in the calling thread instead.
+"""
+
+import io
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from ..hashing import json_hash
+from ..tracing import get_tracer
+
+
+DEFAULT_PLOT_STYLE: Dict[str, Any] = {
+    'figsize': [10, 6],
+    'dpi': 100,
+    'xtick_rotation': 45,
+}
+
+
+def render_counts_png(counts: Dict[str, int], title: str, style: Dict[str, Any]) -> bytes:
+    """Draw a bar chart of measurement counts.
+
+    Args:
+        counts: Measurement counts keyed by bitstring
+        title: Title of the chart
+        style: Plot style, see DEFAULT_PLOT_STYLE
+
+    Returns:
+        bytes: The PNG image
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=style['figsize'], dpi=style['dpi'])
+    FigureCanvasAgg(figure)
+    ax = figure.subplots()
+
+    # Sort the counts by binary value
+    sorted_counts = sorted(counts.items())
+    ax.bar([state for state, _ in sorted_counts], [count for _, count in sorted_counts])
+
+    ax.set_title(title)
+    ax.set_xlabel("Measurement Outcome")
+    ax.set_ylabel("Count")
+    ax.tick_params(axis='x', labelrotation=style['xtick_rotation'])
+    figure.tight_layout()
+
+    image = io.BytesIO()
+    figure.savefig(image, format='png')
+    return image.getvalue()
+
+
+def _init_worker() -> None:
+    """Load matplotlib and its fonts once per worker process."""
+    render_counts_png({'0': 1}, '', DEFAULT_PLOT_STYLE)
+
+
+def _ping() -> bool:
+    return True
+
+
+class PlotRenderer:
+    """Render result plots in worker processes, with an LRU cache of the PNGs."""
+
+    def __init__(self, processes: int = 1, max_entries: int = 64):
+        """Initialize the renderer.
+
+        Args:
+            processes: Number of worker processes; 0 renders in the calling thread
+            max_entries: Maximum number of rendered plots to keep
+        """
+        self.processes = processes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._pending: Dict[str, Future] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Get the worker pool, creating it on first use."""
+        if self.processes <= 0:
+            return None
+        with self._lock:
+            if self._pool is None:
+                # Spawn rather than fork: the server process runs threads and an event loop
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                )
+            return self._pool
+
+    def warm_up(self) -> None:
+        """Start the worker processes and wait until they have loaded matplotlib."""
+        pool = self._get_pool()
+        if pool is not None:
+            for future in [pool.submit(_ping) for _ in range(self.processes)]:
+                future.result()
+
+    def render_counts(self, counts: Dict[str, int], title: str, style: Optional[Dict[str, Any]] = None) -> bytes:
+        """Render a bar chart of measurement counts, or return the cached render.
+
+        Args:
+            counts: Measurement counts keyed by bitstring
+            title: Title of the chart
+            style: Overrides of DEFAULT_PLOT_STYLE
+
+        Returns:
+            bytes: The PNG image
+
+        Raises:
+            Exception: Any error raised while drawing the plot
+        """
+        style = {**DEFAULT_PLOT_STYLE, **(style or {})}
+        key = json_hash({'counts': counts, 'title': title, 'style': style})
+        with get_tracer().span('plot.render', outcomes=len(counts)) as span:
+            with self._lock:
+                image = self._entries.get(key)
+                if image is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                pending = self._pending.get(key)
+                if image is None and pending is None:
+                    self.misses += 1
+                    self._pending[key] = future = Future()
+            span.set_attribute('cache_hit', image is not None or pending is not None)
+            if image is not None:
+                return image
+            if pending is not None:
+                return pending.result()
+
+            try:
+                image = self._render(counts, title, style)
+            except BaseException as e:
+                with self._lock:
+                    del self._pending[key]
+                future.set_exception(e)
+                raise
+
+            with self._lock:
+                del self._pending[key]
+                self._entries[key] = image
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            future.set_result(image)
+            return image
+
+    def _render(self, counts: Dict[str, int], title: str, style: Dict[str, Any]) -> bytes:
+        """Render in a worker process, falling back to this thread if the pool broke."""
+        pool = self._get_pool()
+        if pool is None:
+            return render_counts_png(counts, title, style)
+        try:
+            return pool.submit(render_counts_png, counts, title, style).result()
+        except BrokenProcessPool as e:
+            logger.warning(f'Plot worker process stopped, rendering in-process: {e}')
+            with self._lock:
+                if self._pool is pool:
+                    self._pool = None
+            return render_counts_png(counts, title, style)
+
+    def clear(self) -> None:
+        """Drop all cached plots."""
+        with self._lock:
+            self._entries.clear()
+
+
+_shared_renderer: Optional[PlotRenderer] = None
+_shared_renderer_lock = threading.Lock()
+
+
+def get_plot_renderer() -> PlotRenderer:
+    """Get the plot renderer shared by the whole process.
+
+    BRAKET_MCP_RENDER_PROCESSES sets the number of worker processes (default 1).
+    """
+    global _shared_renderer
+    with _shared_renderer_lock:
+        if _shared_renderer is None:
+            _shared_renderer = PlotRenderer(processes=int(os.environ.get('BRAKET_MCP_RENDER_PROCESSES', '1')))
+        return _shared_renderer
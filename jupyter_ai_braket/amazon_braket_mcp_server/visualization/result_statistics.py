@@ -0,0 +1,150 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Statistics of measurement counts shared by the results describers.
+
+A results visualization describes the same counts several times: the ASCII
+histogram analysis, the summary, the statistics, the distribution and the
+insights. The counts are turned into arrays and reduced once here, and the
+result is cached by task ID so each describer only reads the values it needs.
+
+Cached statistics are shared between callers and must not be modified.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from ..models import TaskResult
+
+
+class ResultStatistics:
+    """Totals, probabilities and shape of a distribution of measurement counts."""
+
+    def __init__(self, counts: Dict[str, int]):
+        """Compute the statistics.
+
+        Args:
+            counts: Non-empty measurement counts keyed by bitstring
+        """
+        self.counts = counts
+        self.outcomes = list(counts)
+        self.count_array = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+        self.total_shots = int(self.count_array.sum())
+        self.num_outcomes = len(self.outcomes)
+        self.probability_array = self.count_array / self.total_shots if self.total_shots else \
+            np.zeros(self.num_outcomes)
+
+        nonzero = self.probability_array[self.probability_array > 0]
+        self.entropy = float(-(nonzero * np.log2(nonzero)).sum())
+        self.max_deviation_from_uniform = float(np.abs(self.probability_array - 1 / self.num_outcomes).max())
+        self.most_probable, self.most_probable_count = self._extreme(self.count_array.max())
+        self.least_probable, self.least_probable_count = self._extreme(self.count_array.min())
+        self._probabilities: Optional[Dict[str, float]] = None
+
+    def _extreme(self, value: int) -> Tuple[str, int]:
+        """Get the first outcome, in bitstring order, with the given count."""
+        indices = np.flatnonzero(self.count_array == value)
+        return min(self.outcomes[index] for index in indices), int(value)
+
+    @property
+    def max_probability(self) -> float:
+        """Probability of the most frequent outcome."""
+        return self.most_probable_count / self.total_shots if self.total_shots else 0.0
+
+    @property
+    def min_probability(self) -> float:
+        """Probability of the least frequent outcome."""
+        return self.least_probable_count / self.total_shots if self.total_shots else 0.0
+
+    @property
+    def probabilities(self) -> Dict[str, float]:
+        """Probability of each outcome, built on first use."""
+        if self._probabilities is None:
+            self._probabilities = dict(zip(self.outcomes, self.probability_array.tolist()))
+        return self._probabilities
+
+    def probability(self, outcome: str) -> float:
+        """Get the probability of one outcome (0 if it was not measured)."""
+        return self.counts.get(outcome, 0) / self.total_shots if self.total_shots else 0.0
+
+    def outcomes_within(self, allowed: set) -> bool:
+        """Check whether every measured outcome is one of the allowed bitstrings."""
+        return self.num_outcomes <= len(allowed) and all(outcome in allowed for outcome in self.outcomes)
+
+
+class ResultStatisticsCache:
+    """Thread-safe LRU cache of result statistics keyed by task ID.
+
+    The same task ID can arrive with different counts, e.g. the summary view of
+    a result and later the full one, so an entry is only reused when its counts
+    are the same.
+    """
+
+    def __init__(self, max_entries: int = 32):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of results to keep
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, ResultStatistics]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, result: TaskResult) -> Optional[ResultStatistics]:
+        """Get the statistics of a result, computing them on first use.
+
+        Args:
+            result: The quantum task result
+
+        Returns:
+            Optional[ResultStatistics]: The statistics, or None if the result has no counts
+        """
+        if not result.counts:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(result.task_id)
+            if entry is not None and (entry.counts is result.counts or entry.counts == result.counts):
+                self._entries.move_to_end(result.task_id)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        entry = ResultStatistics(result.counts)
+        with self._lock:
+            self._entries[result.task_id] = entry
+            self._entries.move_to_end(result.task_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Drop all cached statistics."""
+        with self._lock:
+            self._entries.clear()
+
+
+_shared_cache: Optional[ResultStatisticsCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_result_statistics(result: TaskResult) -> Optional[ResultStatistics]:
+    """Get the statistics of a result from the cache shared by the whole process."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ResultStatisticsCache()
+    return _shared_cache.get(result)
@@ -0,0 +1,211 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Content-addressed store for saved visualizations.
+
+Every results visualization used to be written as a new timestamped PNG with a
+metadata text file next to it, so the `braket_visualizations` directory of a
+long-lived workspace only ever grew. The store writes each distinct image once,
+named by its content hash, and records names, descriptions and timestamps in a
+single `index.json`. After each save it deletes images that have not been used
+for `max_age_days` and then the least recently used ones until the store fits in
+`max_bytes`.
+
+Only files listed in the index are ever deleted; anything else in the directory
+is left alone.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+from loguru import logger
+
+from ..atomic_io import atomic_write_bytes, atomic_write_text
+from ..hashing import sha256_bytes
+from ..models import StoredVisualization
+from ..workspace import workspace_reference
+
+
+# Directory of the store inside a workspace, and the index file inside the store
+VISUALIZATIONS_DIR = 'braket_visualizations'
+INDEX_FILE = 'index.json'
+
+# Path of the Jupyter server route that serves stored images, relative to the server's base URL
+VISUALIZATION_ROUTE = 'jupyter-ai-braket/visualizations'
+
+# Limits used unless BRAKET_MCP_VIZ_MAX_MB / BRAKET_MCP_VIZ_MAX_AGE_DAYS are set
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+DEFAULT_MAX_AGE_DAYS = 30.0
+
+_UNSAFE_NAME_CHARS = re.compile(r'[^A-Za-z0-9_.-]+')
+
+
+class VisualizationStore:
+    """Deduplicated, size- and age-bounded store of PNG images in one directory."""
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES, max_age_days: float = DEFAULT_MAX_AGE_DAYS):
+        """Initialize the store and load its index.
+
+        Args:
+            directory: Directory holding the images and the index
+            max_bytes: Total size of the images kept (in bytes)
+            max_age_days: Images not used for this long are deleted
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self.index_path = self.directory / INDEX_FILE
+        self._entries: Dict[str, StoredVisualization] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the stored images."""
+        with self._lock:
+            return sum(entry.size_bytes for entry in self._entries.values())
+
+    def save(self, data: bytes, name: str, description: str = "") -> StoredVisualization:
+        """Store an image, reusing the existing file if the same image was stored before.
+
+        Args:
+            data: PNG image bytes
+            name: Human-readable name, used in the file name of new images
+            description: Description recorded in the index
+
+        Returns:
+            StoredVisualization: The index entry of the image
+        """
+        digest = sha256_bytes(data)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None or not (self.directory / entry.file).exists():
+                safe_name = _UNSAFE_NAME_CHARS.sub('_', name).strip('_')[:80] or 'visualization'
+                entry = StoredVisualization(
+                    sha256=digest,
+                    file=f"{safe_name}_{digest[:12]}.png",
+                    size_bytes=len(data),
+                    name=name,
+                    description=description,
+                    created_at=now,
+                    last_used_at=now,
+                )
+                atomic_write_bytes(self.directory / entry.file, data)
+                self._entries[digest] = entry
+            else:
+                entry.last_used_at = now
+                if description:
+                    entry.description = description
+            self._evict(keep=digest, now=now)
+            self._save()
+            return entry.model_copy()
+
+    def get(self, sha256: str) -> Optional[StoredVisualization]:
+        """Get the index entry of a stored image by its content hash."""
+        with self._lock:
+            entry = self._entries.get(sha256)
+            return entry.model_copy() if entry is not None else None
+
+    def path(self, entry: StoredVisualization) -> Path:
+        """Get the path of a stored image."""
+        return self.directory / entry.file
+
+    def entries(self) -> List[StoredVisualization]:
+        """List the stored images, most recently used first."""
+        with self._lock:
+            entries = [entry.model_copy() for entry in self._entries.values()]
+        return sorted(entries, key=lambda entry: entry.last_used_at, reverse=True)
+
+    def _evict(self, keep: str, now: float) -> None:
+        """Delete expired images, then least recently used ones over the size limit (caller holds the lock)."""
+        max_age_seconds = self.max_age_days * 86400
+        by_age = sorted(self._entries.values(), key=lambda entry: entry.last_used_at)
+        total = sum(entry.size_bytes for entry in by_age)
+        for entry in by_age:
+            if entry.sha256 == keep:
+                continue
+            if now - entry.last_used_at <= max_age_seconds and total <= self.max_bytes:
+                break
+            self._delete(entry)
+            total -= entry.size_bytes
+
+    def _delete(self, entry: StoredVisualization) -> None:
+        del self._entries[entry.sha256]
+        try:
+            os.unlink(self.directory / entry.file)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not delete visualization {entry.file}: {str(e)}")
+
+    def _load(self) -> None:
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                data = json.load(f)
+            self._entries = {
+                digest: StoredVisualization(**entry) for digest, entry in data.get('entries', {}).items()
+            }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Rebuilding unreadable visualization index {self.index_path}: {str(e)}")
+            self._entries = {}
+
+    def _save(self) -> None:
+        """Write the index atomically (caller holds the lock)."""
+        data = {'entries': {digest: entry.model_dump() for digest, entry in self._entries.items()}}
+        try:
+            atomic_write_text(self.index_path, json.dumps(data))
+        except OSError as e:
+            logger.warning(f"Could not save visualization index: {str(e)}")
+
+
+def visualization_url(sha256: str, workspace_dir: Optional[str] = None) -> str:
+    """Get the URL path that serves a stored image, relative to the Jupyter server's base URL.
+
+    Args:
+        sha256: Content ID of the image
+        workspace_dir: Workspace holding the store. If None, the route looks in
+            the default workspace.
+    """
+    if workspace_dir is None:
+        return f"/{VISUALIZATION_ROUTE}/{sha256}"
+    return f"/{VISUALIZATION_ROUTE}/{sha256}?workspace={quote(workspace_reference(workspace_dir), safe='')}"
+
+
+_stores: Dict[str, VisualizationStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_visualization_store(directory: str) -> VisualizationStore:
+    """Get the store of a directory, shared by the whole process.
+
+    BRAKET_MCP_VIZ_MAX_MB and BRAKET_MCP_VIZ_MAX_AGE_DAYS override the default
+    size (100 MB) and age (30 days) limits.
+    """
+    key = str(Path(directory).resolve())
+    with _stores_lock:
+        if key not in _stores:
+            max_mb = os.environ.get('BRAKET_MCP_VIZ_MAX_MB')
+            max_age_days = os.environ.get('BRAKET_MCP_VIZ_MAX_AGE_DAYS')
+            _stores[key] = VisualizationStore(
+                key,
+                max_bytes=int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES,
+                max_age_days=float(max_age_days) if max_age_days else DEFAULT_MAX_AGE_DAYS,
+            )
+        return _stores[key]
@@ -20,12 +20,14 @@ This module provides model-friendly visualization including:
 import os
 import base64
 import tempfile
-from datetime import datetime
 from typing import Dict, List, Any, Union, Optional
 from pathlib import Path
 
+from ..circuit_analysis import analyze_circuit
 from ..models import QuantumCircuit, Gate, TaskResult
 from .ascii_visualizer import ASCIICircuitVisualizer, ASCIIResultsVisualizer
+from .result_statistics import ResultStatistics, get_result_statistics
+from .visualization_store import VISUALIZATIONS_DIR, get_visualization_store, visualization_url
 from loguru import logger
 
 
@@ -43,8 +45,9 @@ class VisualizationUtils:
         self.ascii_results_visualizer = ASCIIResultsVisualizer()
         
         # Create visualizations directory if it doesn't exist
-        self.viz_dir = Path(self.workspace_dir) / "braket_visualizations"
+        self.viz_dir = Path(self.workspace_dir) / VISUALIZATIONS_DIR
         self.viz_dir.mkdir(exist_ok=True)
+        self.store = get_visualization_store(str(self.viz_dir))
     
     def describe_circuit(self, circuit: QuantumCircuit) -> Dict[str, Any]:
         """Generate a human-readable description of a quantum circuit.
@@ -96,55 +99,72 @@ class VisualizationUtils:
             return {"error": f"Failed to describe results: {str(e)}"}
     
     def save_visualization_to_file(self, 
-                                 base64_data: str, 
+                                 image_data: Union[bytes, str], 
                                  filename: str, 
                                  description: str = "") -> str:
-        """Save base64 visualization data to a file.
+        """Save a visualization image to the workspace visualization store.
+        
+        Identical images are stored once, and old images are evicted; see
+        `VisualizationStore`.
         
         Args:
-            base64_data: Base64 encoded image data
+            image_data: PNG image bytes, or base64 encoded image data
             filename: Name for the saved file (without extension)
-            description: Optional description to include in metadata
+            description: Optional description recorded in the store index
             
         Returns:
             Path to the saved file
         """
-        try:
-            # Generate timestamp for unique filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_filename = f"{filename}_{timestamp}.png"
-            file_path = self.viz_dir / safe_filename
-            
-            # Decode and save the image
-            image_data = base64.b64decode(base64_data)
-            with open(file_path, 'wb') as f:
-                f.write(image_data)
+        return self.store_visualization(image_data, filename, description)["visualization_file"]
+    
+    def store_visualization(self,
+                            image_data: Union[bytes, str],
+                            filename: str,
+                            description: str = "") -> Dict[str, str]:
+        """Save a visualization image and build the reference returned to clients.
+        
+        Args:
+            image_data: PNG image bytes, or base64 encoded image data
+            filename: Name for the saved file (without extension)
+            description: Optional description recorded in the store index
             
-            # Save metadata file
-            metadata_path = self.viz_dir / f"{filename}_{timestamp}_metadata.txt"
-            with open(metadata_path, 'w') as f:
-                f.write(f"Visualization: {filename}\n")
-                f.write(f"Created: {datetime.now().isoformat()}\n")
-                f.write(f"Description: {description}\n")
-                f.write(f"Image file: {safe_filename}\n")
+        Returns:
+            The saved file, plus the content ID and the Jupyter server URL path
+            that serves it (relative to the server's base URL). If saving fails,
+            only the file, set to the error message.
+        """
+        try:
+            if isinstance(image_data, str):
+                image_data = base64.b64decode(image_data)
+            entry = self.store.save(image_data, filename, description)
+            file_path = self.store.path(entry)
             
             logger.info(f"Visualization saved to: {file_path}")
-            return str(file_path)
+            return {
+                "visualization_file": str(file_path),
+                "visualization_id": entry.sha256,
+                "visualization_url": visualization_url(entry.sha256, self.workspace_dir),
+            }
             
         except Exception as e:
             logger.exception(f"Error saving visualization: {str(e)}")
-            return f"Error saving file: {str(e)}"
+            return {"visualization_file": f"Error saving file: {str(e)}"}
     
     def create_circuit_response(self,
                                 circuit: QuantumCircuit,
-                                base64_viz: str,
-                                circuit_type: str = "custom") -> Dict[str, Any]:
+                                image_data: Union[bytes, str],
+                                circuit_type: str = "custom",
+                                include_data: bool = False) -> Dict[str, Any]:
         """Create a response for circuit visualization.
         
+        The image is returned by reference (file, content ID and URL); the
+        base64 data is only included on request.
+        
         Args:
             circuit: The quantum circuit
-            base64_viz: Base64 encoded visualization
+            image_data: PNG image bytes, or base64 encoded visualization
             circuit_type: Type of circuit (e.g., "bell_pair", "ghz", "qft")
+            include_data: Whether to include the base64 image as `visualization_data`
             
         Returns:
             Response dictionary
@@ -158,22 +178,24 @@ class VisualizationUtils:
             
             # Save visualization to file
             viz_filename = f"{circuit_type}_circuit"
-            saved_path = self.save_visualization_to_file(
-                base64_viz, 
+            reference = self.store_visualization(
+                image_data, 
                 viz_filename, 
                 description.get("summary", "")
             )
             
-            return {
+            response = {
                 "circuit_def": circuit.model_dump(),
                 "description": description,
                 "ascii_visualization": ascii_viz,
-                "visualization_file": saved_path,
-                "visualization_data": base64_viz,  # Keep original for compatibility
-                "usage_note": f"Circuit visualization saved to {saved_path}. Use image viewer to see the detailed diagram.",
+                **reference,
+                "usage_note": f"Circuit visualization saved to {reference['visualization_file']}. Use image viewer to see the detailed diagram.",
                 "num_qubits": circuit.num_qubits,
                 "num_gates": len(circuit.gates)
             }
+            if include_data:
+                response["visualization_data"] = self._to_base64(image_data)
+            return response
             
         except Exception as e:
             logger.exception(f"Error creating circuit response: {str(e)}")
@@ -181,12 +203,19 @@ class VisualizationUtils:
     
     def create_results_response(self,
                                 result: TaskResult,
-                                base64_viz: str) -> Dict[str, Any]:
+                                image_data: Union[bytes, str],
+                                include_data: bool = False,
+                                **histogram_options: Any) -> Dict[str, Any]:
         """Create a response for results visualization.
         
+        The image is returned by reference (file, content ID and URL); the
+        base64 data is only included on request.
+        
         Args:
             result: The task result
-            base64_viz: Base64 encoded visualization
+            image_data: PNG image bytes, or base64 encoded visualization
+            include_data: Whether to include the base64 image as `visualization_data`
+            **histogram_options: top_k, bin_by and qubits for the ASCII histogram
             
         Returns:
             Response dictionary
@@ -196,29 +225,36 @@ class VisualizationUtils:
             description = self.describe_results(result)
             
             # Generate ASCII representation of results
-            ascii_viz = self.ascii_results_visualizer.visualize_results(result)
+            ascii_viz = self.ascii_results_visualizer.visualize_results(result, **histogram_options)
             
             # Save visualization to file
             viz_filename = f"results_{result.task_id}"
-            saved_path = self.save_visualization_to_file(
-                base64_viz, 
+            reference = self.store_visualization(
+                image_data, 
                 viz_filename, 
                 description.get("summary", "")
             )
             
-            return {
+            response = {
                 "result": result.model_dump(),
                 "description": description,
                 "ascii_visualization": ascii_viz,
-                "visualization_file": saved_path,
-                "visualization_data": base64_viz,  # Keep original for compatibility
-                "usage_note": f"Results visualization saved to {saved_path}. Use image viewer to see the detailed chart.",
+                **reference,
+                "usage_note": f"Results visualization saved to {reference['visualization_file']}. Use image viewer to see the detailed chart.",
             }
+            if include_data:
+                response["visualization_data"] = self._to_base64(image_data)
+            return response
             
         except Exception as e:
             logger.exception(f"Error creating results response: {str(e)}")
             return {"error": f"Failed to create response: {str(e)}"}
     
+    @staticmethod
+    def _to_base64(image_data: Union[bytes, str]) -> str:
+        """Encode image bytes as base64, passing already encoded data through."""
+        return image_data if isinstance(image_data, str) else base64.b64encode(image_data).decode('utf-8')
+    
     def _generate_circuit_summary(self, circuit: QuantumCircuit) -> str:
         """Generate a brief summary of the circuit."""
         gate_types = set(gate.name for gate in circuit.gates)
@@ -288,57 +324,59 @@ class VisualizationUtils:
     
     def _assess_circuit_complexity(self, circuit: QuantumCircuit) -> Dict[str, Any]:
         """Assess the complexity of the circuit."""
+        analysis = analyze_circuit(circuit)
+        duration_us = analysis.duration_ns / 1000
+        
+        # Two-qubit layers dominate both error rates and simulation cost; runtime is
+        # compared with the ~100 µs coherence times of current superconducting QPUs
         return {
-            "depth": len(circuit.gates),  # Simplified depth calculation
+            "depth": analysis.depth,
+            "two_qubit_depth": analysis.two_qubit_depth,
             "width": circuit.num_qubits,
-            "complexity_level": "low" if len(circuit.gates) <= 5 else "medium" if len(circuit.gates) <= 20 else "high",
-            "estimated_runtime": "fast" if len(circuit.gates) <= 10 else "moderate" if len(circuit.gates) <= 50 else "slow"
+            "critical_path_gates": len(analysis.critical_path),
+            "estimated_duration_us": round(duration_us, 3),
+            "max_qubit_idle_us": round(max(analysis.qubit_idle_ns, default=0.0) / 1000, 3),
+            "complexity_level": "low" if analysis.two_qubit_depth <= 5 else "medium" if analysis.two_qubit_depth <= 20 else "high",
+            "estimated_runtime": "fast" if duration_us <= 10 else "moderate" if duration_us <= 100 else "slow"
         }
     
     def _generate_results_summary(self, result: TaskResult) -> str:
         """Generate a summary of the results."""
-        if not result.counts:
+        stats = get_result_statistics(result)
+        if stats is None:
             return "No measurement results available"
         
-        total_shots = sum(result.counts.values())
-        num_outcomes = len(result.counts)
-        most_frequent = max(result.counts.items(), key=lambda x: x[1])
-        
-        return f"Measured {num_outcomes} different outcomes over {total_shots} shots. Most frequent: {most_frequent[0]} ({most_frequent[1]} times, {most_frequent[1]/total_shots*100:.1f}%)"
+        return f"Measured {stats.num_outcomes} different outcomes over {stats.total_shots} shots. Most frequent: {stats.most_probable} ({stats.most_probable_count} times, {stats.max_probability*100:.1f}%)"
     
     def _analyze_measurement_statistics(self, result: TaskResult) -> Dict[str, Any]:
         """Analyze measurement statistics."""
-        if not result.counts:
+        stats = get_result_statistics(result)
+        if stats is None:
             return {"error": "No measurement data"}
         
-        total_shots = sum(result.counts.values())
-        probabilities = {outcome: count/total_shots for outcome, count in result.counts.items()}
-        
         return {
-            "total_shots": total_shots,
-            "unique_outcomes": len(result.counts),
-            "probabilities": probabilities,
-            "most_probable": max(probabilities.items(), key=lambda x: x[1]),
-            "least_probable": min(probabilities.items(), key=lambda x: x[1]),
-            "entropy": self._calculate_entropy(probabilities)
+            "total_shots": stats.total_shots,
+            "unique_outcomes": stats.num_outcomes,
+            "probabilities": stats.probabilities,
+            "most_probable": (stats.most_probable, stats.max_probability),
+            "least_probable": (stats.least_probable, stats.min_probability),
+            "entropy": stats.entropy
         }
     
     def _describe_probability_distribution(self, result: TaskResult) -> Dict[str, Any]:
         """Describe the probability distribution of results."""
-        if not result.counts:
+        stats = get_result_statistics(result)
+        if stats is None:
             return {"error": "No measurement data"}
         
-        total_shots = sum(result.counts.values())
-        probabilities = {outcome: count/total_shots for outcome, count in result.counts.items()}
-        
         # Check for common patterns
-        if len(probabilities) == 2 and all(abs(p - 0.5) < 0.1 for p in probabilities.values()):
+        if stats.num_outcomes == 2 and stats.max_deviation_from_uniform < 0.1:
             pattern = "uniform_binary"
             description = "Nearly equal probability between two outcomes (typical of Bell states)"
-        elif len(probabilities) == 1:
+        elif stats.num_outcomes == 1:
             pattern = "deterministic"
             description = "Single outcome observed (deterministic result)"
-        elif max(probabilities.values()) > 0.8:
+        elif stats.max_probability > 0.8:
             pattern = "highly_biased"
             description = "One outcome dominates (>80% probability)"
         else:
@@ -348,53 +386,43 @@ class VisualizationUtils:
         return {
             "pattern": pattern,
             "description": description,
-            "distribution_type": self._classify_distribution(probabilities)
+            "distribution_type": self._classify_distribution(stats)
         }
     
     def _extract_result_insights(self, result: TaskResult) -> List[str]:
         """Extract insights from the results."""
         insights = []
         
-        if not result.counts:
+        stats = get_result_statistics(result)
+        if stats is None:
             return ["No measurement data available for analysis"]
         
-        total_shots = sum(result.counts.values())
-        probabilities = {outcome: count/total_shots for outcome, count in result.counts.items()}
-        
         # Check for entanglement signatures
-        if len(probabilities) == 2:
-            outcomes = list(probabilities.keys())
-            if all(outcome in ['00', '11'] for outcome in outcomes):
+        if stats.num_outcomes == 2:
+            if stats.outcomes_within({'00', '11'}):
                 insights.append("Results suggest quantum entanglement (Bell state pattern)")
-            elif all(outcome in ['01', '10'] for outcome in outcomes):
+            elif stats.outcomes_within({'01', '10'}):
                 insights.append("Results suggest anti-correlated entanglement")
         
         # Check for superposition
-        if len(probabilities) > 2 and max(probabilities.values()) < 0.6:
+        if stats.num_outcomes > 2 and stats.max_probability < 0.6:
             insights.append("Results suggest quantum superposition across multiple states")
         
         # Check for classical behavior
-        if len(probabilities) == 1:
+        if stats.num_outcomes == 1:
             insights.append("Deterministic result suggests classical computation or measurement")
         
         return insights
     
-    def _calculate_entropy(self, probabilities: Dict[str, float]) -> float:
-        """Calculate Shannon entropy of probability distribution."""
-        import math
-        return -sum(p * math.log2(p) for p in probabilities.values() if p > 0)
-    
-    def _classify_distribution(self, probabilities: Dict[str, float]) -> str:
+    def _classify_distribution(self, stats: ResultStatistics) -> str:
         """Classify the type of probability distribution."""
-        values = list(probabilities.values())
-        
-        if len(values) == 1:
+        if stats.num_outcomes == 1:
             return "deterministic"
-        elif len(values) == 2 and abs(values[0] - values[1]) < 0.1:
+        elif stats.num_outcomes == 2 and stats.max_deviation_from_uniform < 0.05:
             return "uniform_binary"
-        elif all(abs(p - 1/len(values)) < 0.1 for p in values):
+        elif stats.max_deviation_from_uniform < 0.1:
             return "uniform"
-        elif max(values) > 0.8:
+        elif stats.max_probability > 0.8:
             return "peaked"
         else:
             return "mixed"
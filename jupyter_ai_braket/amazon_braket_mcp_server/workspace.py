@@ -0,0 +1,73 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""Workspace directories shared by the MCP server and the Jupyter server extension.
+
+The MCP server saves circuits and visualizations under a workspace: the
+directory a client requests through the scoping header, resolved against
+BRAKET_WORKSPACE_ROOT, or by default BRAKET_WORKSPACE_DIR or the working
+directory. The Jupyter routes that serve those files resolve workspaces with
+the same functions, so both sides agree on where files live. This module has
+no heavy dependencies and is safe to import from the extension.
+"""
+
+import os
+from pathlib import Path
+
+
+def default_workspace_dir() -> str:
+    """Get the workspace used when a request does not choose one."""
+    return os.environ.get('BRAKET_WORKSPACE_DIR') or os.getcwd()
+
+
+def resolve_workspace_dir(workspace_dir: str) -> str:
+    """Resolve a client-supplied workspace directory.
+
+    If BRAKET_WORKSPACE_ROOT is set, relative directories are resolved against it
+    and directories outside it are rejected.
+
+    Args:
+        workspace_dir: Requested workspace directory
+
+    Returns:
+        str: Absolute workspace directory
+
+    Raises:
+        ValueError: If the directory is outside BRAKET_WORKSPACE_ROOT
+    """
+    root = os.environ.get('BRAKET_WORKSPACE_ROOT', '').strip()
+    if not root:
+        return str(Path(workspace_dir).expanduser().resolve())
+
+    root_path = Path(root).expanduser().resolve()
+    resolved = (root_path / workspace_dir).resolve()
+    if resolved != root_path and root_path not in resolved.parents:
+        raise ValueError(f'Workspace {workspace_dir} is outside the workspace root {root_path}')
+    return str(resolved)
+
+
+def workspace_reference(workspace_dir: str) -> str:
+    """Refer to a workspace so that `resolve_workspace_dir` finds it again.
+
+    Args:
+        workspace_dir: Workspace directory
+
+    Returns:
+        str: The directory relative to BRAKET_WORKSPACE_ROOT if it is inside it,
+        otherwise the absolute directory
+    """
+    resolved = Path(workspace_dir).expanduser().resolve()
+    root = os.environ.get('BRAKET_WORKSPACE_ROOT', '').strip()
+    if root:
+        root_path = Path(root).expanduser().resolve()
+        if resolved == root_path or root_path in resolved.parents:
+            return resolved.relative_to(root_path).as_posix()
+    return str(resolved)
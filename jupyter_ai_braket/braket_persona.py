@@ -9,6 +9,7 @@ from .system_prompt import BRAKET_SYS_PROMPT_TEMPLATE
 from asyncio import Task
 from langchain_mcp_adapters.client import MultiServerMCPClient, ClientSession
 from langchain_mcp_adapters.tools import load_mcp_tools, BaseTool
+from langchain_mcp_adapters.callbacks import Callbacks, CallbackContext
 from contextlib import AsyncExitStack
 
 AVATAR_PATH = os.path.join(os.path.dirname(__file__), "static", "braket_icon.svg")
@@ -51,20 +52,46 @@ class BraketPersona(BasePersona):
         else:
             self.log.info("AWS_CONTAINER_CREDENTIALS_RELATIVE_URI: not set")
 
-        self.mcp_client = MultiServerMCPClient(
-            {
-                "amazon_braket_mcp_server": {
-                    "transport": "stdio",
-                    "command": "python",
-                    "args": ["-m", "jupyter_ai_braket.amazon_braket_mcp_server.server"],
-                    "env": mcp_env,
-                },
+        # Connect to a shared MCP server if one is configured, otherwise start
+        # a private one as a subprocess
+        server_url = os.environ.get("BRAKET_MCP_SERVER_URL", "").strip()
+        if server_url:
+            self.log.info(f"Connecting to shared Braket MCP server at {server_url}")
+            connection = {
+                "transport": "streamable_http",
+                "url": server_url,
+                "headers": self._mcp_server_headers(),
             }
-        )
+        else:
+            connection = {
+                "transport": "stdio",
+                "command": "python",
+                "args": ["-m", "jupyter_ai_braket.amazon_braket_mcp_server.server"],
+                "env": mcp_env,
+            }
+
+        self.mcp_client = MultiServerMCPClient({"amazon_braket_mcp_server": connection})
         self.exit_stack = AsyncExitStack()
         self._mcp_session_task = self.parent.event_loop.create_task(self._init_mcp_session())
         self._tools = None
 
+    def _mcp_server_headers(self) -> dict[str, str]:
+        """
+        Returns the HTTP headers that scope a shared MCP server to this user's
+        region, workspace and (if set in the environment) AWS credentials.
+        """
+        headers = {"X-Braket-Workspace-Dir": os.getcwd()}
+        if "AWS_REGION" in os.environ:
+            headers["X-Braket-Region"] = os.environ["AWS_REGION"]
+        if "AWS_ACCESS_KEY_ID" in os.environ and "AWS_SECRET_ACCESS_KEY" in os.environ:
+            headers["X-Aws-Access-Key-Id"] = os.environ["AWS_ACCESS_KEY_ID"]
+            headers["X-Aws-Secret-Access-Key"] = os.environ["AWS_SECRET_ACCESS_KEY"]
+            if "AWS_SESSION_TOKEN" in os.environ:
+                headers["X-Aws-Session-Token"] = os.environ["AWS_SESSION_TOKEN"]
+        if "BRAKET_MCP_AUTH_TOKEN" in os.environ:
+            headers["Authorization"] = f"Bearer {os.environ['BRAKET_MCP_AUTH_TOKEN']}"
+        return headers
+
     async def _init_mcp_session(self) -> ClientSession:
         """
         Background task that initializes the MCP session and sets the list of
@@ -76,9 +103,27 @@ class BraketPersona(BasePersona):
         # Do not call __aenter__() on the CM directly; it does not work.
         session = await self.exit_stack.enter_async_context(session_cm)
         self.log.info(f"Successfully created MCP session for Braket persona: '{session}'.")
-        self._tools = await load_mcp_tools(session)
+        self._tools = await load_mcp_tools(
+            session, callbacks=Callbacks(on_progress=self._on_tool_progress)
+        )
         return session
 
+    async def _on_tool_progress(
+        self,
+        progress: float,
+        total: float | None,
+        message: str | None,
+        context: CallbackContext,
+    ) -> None:
+        """
+        Shows progress notifications from long-running MCP tools (e.g.
+        `wait_for_task`) as the persona's status in the chat, so waiting on a
+        task does not cost the model any turns.
+        """
+        if message:
+            self.log.info(f"{context.tool_name}: {message}")
+            self.set_status(f"is waiting: {message}")
+
     async def get_mcp_tools(self) -> list[BaseTool]:
         await self._mcp_session_task
         return self._tools
@@ -1,8 +1,15 @@
+import functools
 import json
+import os
 
-from jupyter_server.base.handlers import APIHandler
+from jupyter_server.base.handlers import APIHandler, JupyterHandler
 from jupyter_server.utils import url_path_join
 import tornado
+from tornado.ioloop import IOLoop
+
+# Kept in sync with amazon_braket_mcp_server.visualization.visualization_store, which
+# is imported lazily so that loading the extension does not load the MCP server
+VISUALIZATIONS_DIR = "braket_visualizations"
 
 class HelloRouteHandler(APIHandler):
     # The following decorator should be present on all verb methods (head, get, post,
@@ -19,11 +26,137 @@ class HelloRouteHandler(APIHandler):
         }))
 
 
+def _workspace_dir(handler):
+    """Resolve the workspace named by the `workspace` query argument.
+
+    Uses the same rules as the MCP server: the default workspace is
+    BRAKET_WORKSPACE_DIR or the working directory, and requested workspaces
+    must be inside BRAKET_WORKSPACE_ROOT when it is set.
+    """
+    from .amazon_braket_mcp_server.workspace import default_workspace_dir, resolve_workspace_dir
+
+    workspace = handler.get_query_argument("workspace", None)
+    if not workspace:
+        return default_workspace_dir()
+    try:
+        return resolve_workspace_dir(workspace)
+    except ValueError as e:
+        raise tornado.web.HTTPError(403, str(e))
+
+
+class VisualizationHandler(JupyterHandler):
+    """Serves a PNG from the visualization store of a workspace by its content ID.
+
+    The MCP server saves images in its workspace and returns the route of each
+    image, with the workspace as a query argument, instead of inlining it.
+    Images are content-addressed, so responses never change and are cached by
+    the browser.
+    """
+
+    @tornado.web.authenticated
+    def get(self, content_id):
+        from .amazon_braket_mcp_server.visualization.visualization_store import VisualizationStore
+
+        store = VisualizationStore(os.path.join(_workspace_dir(self), VISUALIZATIONS_DIR))
+        entry = store.get(content_id)
+        if entry is None:
+            raise tornado.web.HTTPError(404, "Unknown visualization")
+        try:
+            with open(store.path(entry), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            raise tornado.web.HTTPError(404, "Visualization was evicted")
+
+        self.set_header("Content-Type", "image/png")
+        self.set_header("Cache-Control", "private, max-age=31536000, immutable")
+        self.set_header("ETag", f'"{content_id}"')
+        self.finish(data)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_circuit_moments(path, mtime_ns, size):
+    """Parse a QASM file and pack it into moments, cached by path and file version."""
+    from .amazon_braket_mcp_server.qasm_cache import get_parsed_qasm_cache
+    from .amazon_braket_mcp_server.visualization.circuit_layout import assign_moments
+    from .amazon_braket_mcp_server.visualization.circuit_stream import gates_from_qiskit
+
+    with open(path, encoding="utf-8") as f:
+        circuit = get_parsed_qasm_cache().parse(f.read()).circuit
+    return circuit.num_qubits, assign_moments(gates_from_qiskit(circuit), circuit.num_qubits)
+
+
+class CircuitDiagramHandler(JupyterHandler):
+    """Streams a window of the diagram of a workspace OpenQASM file as text or SVG.
+
+    Query arguments: `path` (relative to the workspace), `workspace` (as for
+    visualizations), `format` (`text` or `svg`), and either `page` and
+    `page_size` or `start` and `stop` moments. The total number of moments is
+    returned in the `X-Circuit-Moments` header so that the frontend can page
+    through the circuit.
+    """
+
+    @tornado.web.authenticated
+    async def get(self):
+        # Load qiskit on the event loop thread: its native extension crashes if it
+        # is first imported by an executor thread that later exits.
+        from .amazon_braket_mcp_server import qasm_cache  # noqa: F401
+        from .amazon_braket_mcp_server.models import DiagramFormat
+        from .amazon_braket_mcp_server.visualization.circuit_stream import (
+            DEFAULT_PAGE_SIZE,
+            iter_diagram,
+            page_window,
+        )
+
+        root = os.path.realpath(_workspace_dir(self))
+        path = os.path.realpath(os.path.join(root, self.get_query_argument("path")))
+        if os.path.commonpath([root, path]) != root:
+            raise tornado.web.HTTPError(403, "Path is outside the workspace")
+        try:
+            diagram_format = DiagramFormat(self.get_query_argument("format", DiagramFormat.TEXT.value))
+            if self.get_query_argument("page", None) is not None:
+                start, stop = page_window(
+                    int(self.get_query_argument("page")),
+                    int(self.get_query_argument("page_size", str(DEFAULT_PAGE_SIZE))),
+                )
+            else:
+                start = int(self.get_query_argument("start", "0"))
+                stop = self.get_query_argument("stop", None)
+                stop = int(stop) if stop is not None else start + DEFAULT_PAGE_SIZE
+        except ValueError as e:
+            raise tornado.web.HTTPError(400, str(e))
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            raise tornado.web.HTTPError(404, "Circuit file not found")
+        try:
+            num_qubits, moments = await IOLoop.current().run_in_executor(
+                None, _load_circuit_moments, path, stat.st_mtime_ns, stat.st_size
+            )
+        except Exception as e:
+            raise tornado.web.HTTPError(400, f"Could not parse circuit: {e}")
+
+        content_type = "image/svg+xml" if diagram_format == DiagramFormat.SVG else "text/plain"
+        self.set_header("Content-Type", f"{content_type}; charset=UTF-8")
+        self.set_header("X-Circuit-Moments", str(len(moments)))
+        self.set_header("X-Circuit-Qubits", str(num_qubits))
+        for chunk in iter_diagram(moments, num_qubits, diagram_format, start, stop):
+            self.write(chunk)
+            await self.flush()
+        self.finish()
+
+
 def setup_route_handlers(web_app):
     host_pattern = ".*$"
     base_url = web_app.settings["base_url"]
 
     hello_route_pattern = url_path_join(base_url, "jupyter-ai-braket", "hello")
-    handlers = [(hello_route_pattern, HelloRouteHandler)]
+    visualization_route_pattern = url_path_join(base_url, "jupyter-ai-braket", "visualizations", "([0-9a-f]{64})")
+    circuit_diagram_route_pattern = url_path_join(base_url, "jupyter-ai-braket", "circuit-diagram")
+    handlers = [
+        (hello_route_pattern, HelloRouteHandler),
+        (visualization_route_pattern, VisualizationHandler),
+        (circuit_diagram_route_pattern, CircuitDiagramHandler),
+    ]
 
     web_app.add_handlers(host_pattern, handlers)
@@ -0,0 +1,65 @@
+"""Python unit tests for ASCII circuit diagrams."""
+from jupyter_ai_braket.amazon_braket_mcp_server.models import Gate, QuantumCircuit
+from jupyter_ai_braket.amazon_braket_mcp_server.visualization.ascii_visualizer import ASCIICircuitVisualizer
+from jupyter_ai_braket.amazon_braket_mcp_server.visualization.circuit_layout import assign_moments
+
+
+def _rows(diagram):
+    return {line.split(":", 1)[0].strip(): line.split(":", 1)[1] for line in diagram.splitlines()}
+
+
+def test_disjoint_gates_share_a_moment():
+    # Given
+    gates = [Gate(name="h", qubits=[i]) for i in range(4)] + [Gate(name="x", qubits=[0]), Gate(name="x", qubits=[0])]
+
+    # When
+    moments = assign_moments(gates, 4)
+
+    # Then
+    assert [len(moment) for moment in moments] == [4, 1, 1]
+
+
+def test_multi_qubit_gate_does_not_share_a_moment_with_its_neighbours():
+    # Given
+    gates = [Gate(name="cx", qubits=[0, 1]), Gate(name="h", qubits=[2]), Gate(name="h", qubits=[3])]
+
+    # When
+    moments = assign_moments(gates, 4)
+
+    # Then
+    assert [[gate.qubits for gate in moment] for moment in moments] == [[[0, 1], [3]], [[2]]]
+
+
+def test_controlled_gates_are_drawn_with_controls_and_connectors():
+    # Given
+    circuit = QuantumCircuit(num_qubits=6, gates=[
+        Gate(name="cx", qubits=[0, 2]),
+        Gate(name="ccx", qubits=[3, 5, 4]),
+        Gate(name="cz", qubits=[0, 1]),
+    ])
+
+    # When
+    result = ASCIICircuitVisualizer().circuit_to_ascii(circuit)
+
+    # Then
+    rows = _rows(result["ascii_circuit"])
+    assert result["num_moments"] == 2
+    assert rows["q0"].startswith(" ─●─")
+    assert rows["q1"].startswith(" ─│─")
+    assert rows["q2"].startswith(" ─X─")
+    assert [rows[f"q{i}"].strip(" ─") for i in (3, 4, 5)] == ["●", "X", "●"]
+    assert rows["q0"].strip(" ─") == "●──●"
+    assert rows["q1"].strip(" ─") == "│──Z"
+    assert "Toffoli" in result["gate_sequence"][1]
+
+
+def test_wide_layer_renders_narrower_than_gate_count():
+    # Given
+    gates = [Gate(name="h", qubits=[i]) for i in range(50)] * 4
+
+    # When
+    result = ASCIICircuitVisualizer().circuit_to_ascii(QuantumCircuit(num_qubits=50, gates=gates))
+
+    # Then
+    assert result["num_moments"] == 4
+    assert max(len(line) for line in result["ascii_circuit"].splitlines()) < 30
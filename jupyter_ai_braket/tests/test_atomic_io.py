@@ -0,0 +1,53 @@
+"""Python unit tests for atomic file writes."""
+import os
+import stat
+
+import pytest
+
+from jupyter_ai_braket.amazon_braket_mcp_server.atomic_io import atomic_open, atomic_write_text
+
+
+def _mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_new_files_get_umask_permissions(tmp_path):
+    # Given
+    umask = os.umask(0)
+    os.umask(umask)
+
+    # When
+    atomic_write_text(tmp_path / "bell.qasm", "OPENQASM 3.0;\n")
+
+    # Then
+    assert _mode(tmp_path / "bell.qasm") == 0o666 & ~umask
+
+
+def test_replaced_files_keep_their_permissions(tmp_path):
+    # Given
+    path = tmp_path / "bell.qasm"
+    path.write_text("old")
+    os.chmod(path, 0o640)
+
+    # When
+    atomic_write_text(path, "new")
+
+    # Then
+    assert path.read_text() == "new"
+    assert _mode(path) == 0o640
+
+
+def test_failed_write_leaves_the_old_file(tmp_path):
+    # Given
+    path = tmp_path / "bell.qasm"
+    path.write_text("old")
+
+    # When
+    with pytest.raises(RuntimeError):
+        with atomic_open(path, "w", encoding="utf-8") as f:
+            f.write("partial")
+            raise RuntimeError("generator failed")
+
+    # Then
+    assert path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["bell.qasm"]
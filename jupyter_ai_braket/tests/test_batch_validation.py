@@ -0,0 +1,39 @@
+"""Python unit tests for batch QASM validation."""
+import pytest
+
+from jupyter_ai_braket.amazon_braket_mcp_server import batch_validation
+from jupyter_ai_braket.amazon_braket_mcp_server.batch_validation import validate_qasm_files, validate_qasm_programs
+
+VALID = 'OPENQASM 3.0;\ninclude "stdgates.inc";\nqubit[2] q;\nh q[0];\ncx q[0], q[1];\n'
+INVALID = 'OPENQASM 3.0;\nqubit[2] q;\nnotagate q[0];\n'
+
+
+def test_programs_are_validated_in_order():
+    # When
+    results = validate_qasm_programs([VALID, INVALID])
+
+    # Then
+    assert [r.name for r in results] == ["program[0]", "program[1]"]
+    assert (results[0].valid, results[0].num_qubits, results[0].num_operations) == (True, 2, 2)
+    assert results[1].valid is False and results[1].error
+
+
+def test_files_are_validated_in_worker_processes(tmp_path, monkeypatch):
+    # Given
+    monkeypatch.setattr(batch_validation, "IN_PROCESS_MAX_PROGRAMS", 0)
+    (tmp_path / "sub").mkdir()
+    for index in range(3):
+        (tmp_path / "sub" / f"ok{index}.qasm").write_text(VALID)
+    (tmp_path / "bad.qasm").write_text(INVALID)
+
+    # When
+    results = validate_qasm_files("**/*.qasm", str(tmp_path), max_workers=2)
+
+    # Then
+    assert [r.name for r in results] == ["bad.qasm", "sub/ok0.qasm", "sub/ok1.qasm", "sub/ok2.qasm"]
+    assert [r.valid for r in results] == [False, True, True, True]
+
+
+def test_pattern_cannot_leave_workspace(tmp_path):
+    with pytest.raises(ValueError):
+        validate_qasm_files("../*.qasm", str(tmp_path))
@@ -0,0 +1,82 @@
+"""Python unit tests for circuit dependency analysis."""
+import random
+
+from qiskit import QuantumCircuit as QiskitCircuit
+
+from jupyter_ai_braket.amazon_braket_mcp_server.circuit_analysis import analyze_circuit
+from jupyter_ai_braket.amazon_braket_mcp_server.models import Gate, QuantumCircuit
+from jupyter_ai_braket.amazon_braket_mcp_server.visualization import VisualizationUtils
+
+
+def test_depth_matches_qiskit_on_random_circuits():
+    # Given
+    rng = random.Random(7)
+    for _ in range(20):
+        gates, qiskit_circuit = [], QiskitCircuit(5)
+        for _ in range(40):
+            if rng.random() < 0.5:
+                qubit = rng.randrange(5)
+                gates.append(Gate(name="h", qubits=[qubit]))
+                qiskit_circuit.h(qubit)
+            else:
+                control, target = rng.sample(range(5), 2)
+                gates.append(Gate(name="cx", qubits=[control, target]))
+                qiskit_circuit.cx(control, target)
+
+        # When
+        analysis = analyze_circuit(QuantumCircuit(num_qubits=5, gates=gates))
+
+        # Then
+        assert analysis.depth == qiskit_circuit.depth()
+        assert analysis.two_qubit_depth == qiskit_circuit.depth(lambda instruction: instruction.operation.num_qubits > 1)
+
+
+def test_critical_path_and_idle_time():
+    # Given
+    circuit = QuantumCircuit(num_qubits=3, gates=[
+        Gate(name="h", qubits=[0]),
+        Gate(name="h", qubits=[2]),
+        Gate(name="cx", qubits=[0, 1]),
+        Gate(name="x", qubits=[2]),
+        Gate(name="cx", qubits=[1, 2]),
+    ])
+
+    # When
+    analysis = analyze_circuit(circuit)
+
+    # Then
+    assert (analysis.depth, analysis.two_qubit_depth) == (3, 2)
+    assert analysis.critical_path == [0, 2, 4]
+    assert analysis.duration_ns == 650.0
+    assert analysis.qubit_idle_ns == [300.0, 50.0, 250.0]
+
+
+def test_barrier_synchronizes_without_adding_depth():
+    # Given
+    circuit = QuantumCircuit(num_qubits=2, gates=[
+        Gate(name="cx", qubits=[0, 1]),
+        Gate(name="h", qubits=[0]),
+        Gate(name="barrier", qubits=[]),
+        Gate(name="h", qubits=[1]),
+    ])
+
+    # When
+    analysis = analyze_circuit(circuit)
+
+    # Then
+    assert analysis.depth == 3
+    assert analysis.gate_count == 3
+    assert analysis.critical_path == [0, 1, 3]
+
+
+def test_complexity_uses_real_depth(tmp_path):
+    # Given
+    gates = [Gate(name="h", qubits=[qubit]) for qubit in range(30)]
+
+    # When
+    complexity = VisualizationUtils(str(tmp_path))._assess_circuit_complexity(QuantumCircuit(num_qubits=30, gates=gates))
+
+    # Then
+    assert complexity["depth"] == 1
+    assert complexity["complexity_level"] == "low"
+    assert complexity["estimated_runtime"] == "fast"
@@ -0,0 +1,58 @@
+"""Python unit tests for the workspace circuit catalog."""
+import os
+
+from jupyter_ai_braket.amazon_braket_mcp_server import circuit_catalog
+from jupyter_ai_braket.amazon_braket_mcp_server.circuit_catalog import CircuitCatalog
+from jupyter_ai_braket.amazon_braket_mcp_server.circuit_library import generate_qasm
+
+
+def test_saved_programs_are_indexed_with_tags(tmp_path):
+    # Given
+    catalog = CircuitCatalog(str(tmp_path))
+
+    # When
+    catalog.save_program("ghz12.qasm", generate_qasm("ghz", 12)[0], tags=["campaign"])
+    catalog.save_program("qft3.qasm", generate_qasm("qft", 3)[0])
+
+    # Then
+    [entry] = catalog.query(num_qubits=12)
+    assert entry.path == "ghz12.qasm"
+    assert entry.tags == ["campaign"]
+    assert entry.gate_counts["cx"] == 11
+    assert [e.path for e in catalog.query(gate="cp")] == ["qft3.qasm"]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_unchanged_files_are_not_reparsed(tmp_path, monkeypatch):
+    # Given
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "bell.qasm").write_text(generate_qasm("bell", 2)[0])
+    CircuitCatalog(str(tmp_path)).refresh()
+    parsed = []
+    monkeypatch.setattr(circuit_catalog, "get_parsed_qasm_cache", lambda: parsed.append(1))
+
+    # When (a new catalog loads the index from disk)
+    catalog = CircuitCatalog(str(tmp_path))
+    changes = catalog.refresh()
+
+    # Then
+    assert changes == 0
+    assert parsed == []
+    assert catalog.query(num_qubits=2)[0].path == "sub/bell.qasm"
+
+
+def test_changed_and_removed_files_update_the_index(tmp_path):
+    # Given
+    catalog = CircuitCatalog(str(tmp_path))
+    catalog.save_program("a.qasm", generate_qasm("ghz", 3)[0], tags=["keep"])
+    catalog.save_program("b.qasm", generate_qasm("ghz", 4)[0])
+
+    # When
+    path = tmp_path / "a.qasm"
+    path.write_text(generate_qasm("ghz", 5)[0])
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 10**9))
+    (tmp_path / "b.qasm").unlink()
+
+    # Then
+    [entry] = catalog.query()
+    assert (entry.path, entry.num_qubits, entry.tags) == ("a.qasm", 5, ["keep"])
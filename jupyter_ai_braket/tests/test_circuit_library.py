@@ -0,0 +1,94 @@
+"""Python unit tests for the direct OpenQASM circuit library emitters."""
+import math
+
+import pytest
+from qiskit import QuantumCircuit, qasm3
+from qiskit.quantum_info import Statevector
+
+from jupyter_ai_braket.amazon_braket_mcp_server.circuit_library import generate_qasm, write_qasm
+
+
+def build_ghz_circuit(num_qubits):
+    """Build a measured GHZ state circuit with Qiskit, as a reference for the emitter."""
+    circuit = QuantumCircuit(num_qubits)
+    circuit.h(0)
+    for i in range(num_qubits - 1):
+        circuit.cx(i, i + 1)
+    circuit.measure_all()
+    return circuit
+
+
+def build_qft_circuit(num_qubits):
+    """Build a measured Quantum Fourier Transform circuit with Qiskit, as a reference for the emitter."""
+    circuit = QuantumCircuit(num_qubits)
+    for i in range(num_qubits):
+        circuit.h(i)
+        for j in range(i + 1, num_qubits):
+            circuit.cp(2 * math.pi / (2 ** (j - i + 1)), j, i)
+    for i in range(num_qubits // 2):
+        circuit.swap(i, num_qubits - i - 1)
+    circuit.measure_all()
+    return circuit
+
+
+def _probabilities(program):
+    circuit = qasm3.loads(program).remove_final_measurements(inplace=False)
+    return Statevector(circuit).probabilities_dict()
+
+
+@pytest.mark.parametrize("family, builder", [("ghz", build_ghz_circuit), ("qft", build_qft_circuit)])
+def test_emitters_match_qiskit_serialization(family, builder):
+    # When
+    program, summary = generate_qasm(family, 5)
+
+    # Then
+    assert program == qasm3.dumps(builder(5))
+    assert summary.num_operations == len(qasm3.loads(program).data)
+
+
+def test_single_qubit_ghz_is_a_measured_hadamard():
+    # When
+    program, summary = generate_qasm("ghz", 1)
+
+    # Then
+    assert program == qasm3.dumps(build_ghz_circuit(1))
+    assert summary.num_qubits == 1
+
+
+def test_w_state_has_uniform_single_excitations():
+    # When
+    program, _ = generate_qasm("w_state", 3)
+
+    # Then
+    assert {k: round(v, 6) for k, v in _probabilities(program).items()} == {
+        "001": pytest.approx(1 / 3), "010": pytest.approx(1 / 3), "100": pytest.approx(1 / 3),
+    }
+
+
+def test_grover_amplifies_marked_state():
+    # When
+    program, _ = generate_qasm("grover", 4, marked="0110")
+
+    # Then
+    probabilities = _probabilities(program)
+    assert max(probabilities, key=probabilities.get) == "0110"
+
+
+def test_random_clifford_is_reproducible():
+    assert generate_qasm("random_clifford", 6, seed=3) == generate_qasm("random_clifford", 6, seed=3)
+
+
+def test_write_qasm_streams_same_program(tmp_path):
+    # When
+    summary = write_qasm(str(tmp_path / "qft.qasm"), "qft", 20, chunk_lines=7)
+
+    # Then
+    program, expected = generate_qasm("qft", 20)
+    assert (tmp_path / "qft.qasm").read_text() == program
+    assert summary.num_operations == expected.num_operations
+    assert summary.size_bytes == expected.size_bytes
+
+
+def test_invalid_marked_state_is_rejected():
+    with pytest.raises(ValueError):
+        generate_qasm("grover", 3, marked="11")
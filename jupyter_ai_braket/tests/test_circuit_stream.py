@@ -0,0 +1,54 @@
+"""Python unit tests for streaming circuit diagrams."""
+import io
+import xml.dom.minidom
+
+import pytest
+
+from jupyter_ai_braket.amazon_braket_mcp_server.models import DiagramFormat, Gate
+from jupyter_ai_braket.amazon_braket_mcp_server.visualization.circuit_layout import assign_moments, render_moments
+from jupyter_ai_braket.amazon_braket_mcp_server.visualization.circuit_stream import (
+    iter_diagram,
+    page_window,
+    write_diagram,
+)
+
+
+def _ladder(num_qubits, layers):
+    gates = []
+    for _ in range(layers):
+        gates.append(Gate(name="h", qubits=[0]))
+        gates.extend(Gate(name="cx", qubits=[q, q + 1]) for q in range(num_qubits - 1))
+    return assign_moments(gates, num_qubits)
+
+
+def test_text_diagram_is_written_in_blocks_of_moments():
+    # Given
+    moments = _ladder(3, 4)
+    out = io.StringIO()
+
+    # When
+    write_diagram(out, moments, 3, DiagramFormat.TEXT, start=2, stop=8, fold=3)
+
+    # Then
+    blocks = out.getvalue().rstrip("\n").split("\n\n")
+    assert blocks == [render_moments(moments[2:5], 3), render_moments(moments[5:8], 3)]
+
+
+def test_svg_diagram_draws_only_the_requested_window():
+    # Given
+    moments = _ladder(3, 20)
+    start, stop = page_window(2, page_size=5)
+
+    # When
+    chunks = list(iter_diagram(moments, 3, DiagramFormat.SVG, start, stop))
+
+    # Then
+    document = xml.dom.minidom.parseString("".join(chunks))
+    drawn = [int(g.getAttribute("data-moment")) for g in document.getElementsByTagName("g")]
+    assert drawn == list(range(10, 15))
+    assert len(chunks) == 2 + len(drawn)
+
+
+def test_page_window_rejects_negative_pages():
+    with pytest.raises(ValueError):
+        page_window(-1)
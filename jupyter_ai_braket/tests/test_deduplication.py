@@ -0,0 +1,115 @@
+"""Python unit tests for submission deduplication."""
+import json
+import threading
+import time
+
+from jupyter_ai_braket.amazon_braket_mcp_server.deduplication import SubmissionDeduplicator
+from jupyter_ai_braket.amazon_braket_mcp_server.models import TaskResult, TaskStatus
+
+
+def test_identical_submission_within_window_is_reused(tmp_path):
+    # Given
+    dedup = SubmissionDeduplicator(60, str(tmp_path))
+    key = dedup.submission_key("circuit-hash", "arn:sv1", 100)
+    dedup.record_submission(key, "task-1", "arn:sv1", 100)
+
+    # When
+    task_id = dedup.lookup(key)
+    hit = dedup.record_hit(key)
+
+    # Then
+    assert task_id == "task-1"
+    assert hit.task_id == "task-1"
+    assert list(dedup.hits) == [hit]
+    assert json.loads((tmp_path / "dedup_hits.jsonl").read_text())["task_id"] == "task-1"
+
+
+def test_key_depends_on_device_and_shots():
+    key = SubmissionDeduplicator.submission_key("circuit-hash", "arn:sv1", 100)
+    assert key != SubmissionDeduplicator.submission_key("circuit-hash", "arn:sv1", 200)
+    assert key != SubmissionDeduplicator.submission_key("circuit-hash", "arn:dm1", 100)
+
+
+def test_stale_submission_is_not_reused(tmp_path):
+    # Given
+    dedup = SubmissionDeduplicator(0.000001, str(tmp_path))
+    key = dedup.submission_key("circuit-hash", "arn:sv1", 100)
+    dedup.record_submission(key, "task-1", "arn:sv1", 100)
+
+    # Then
+    assert dedup.lookup(key) is None
+
+
+def test_index_survives_restart_but_results_do_not(tmp_path):
+    # Given
+    dedup = SubmissionDeduplicator(60, str(tmp_path))
+    key = dedup.submission_key("circuit-hash", "arn:sv1", 10)
+    dedup.record_submission(key, "task-1", "arn:sv1", 10)
+    dedup.cache_result(TaskResult(task_id="task-1", status=TaskStatus.COMPLETED, device="arn:sv1", shots=10))
+    dedup.cache_result(TaskResult(task_id="other", status=TaskStatus.COMPLETED, device="arn:sv1", shots=10))
+
+    # When
+    reloaded = SubmissionDeduplicator(60, str(tmp_path))
+
+    # Then
+    assert reloaded.lookup(key) == "task-1"
+    assert dedup.get_cached_result("task-1").task_id == "task-1"
+    assert dedup.get_cached_result("other") is None
+    assert reloaded.get_cached_result("task-1") is None
+
+
+def test_hit_on_a_forgotten_submission_is_not_recorded():
+    # Given
+    dedup = SubmissionDeduplicator(60)
+    key = dedup.submission_key("circuit-hash", "arn:sv1", 10)
+    dedup.record_submission(key, "task-1", "arn:sv1", 10)
+    dedup.forget(key)
+
+    # When
+    hit = dedup.record_hit(key)
+
+    # Then
+    assert hit is None
+    assert not dedup.hits
+
+
+def test_concurrent_identical_submissions_reserve_one_task():
+    # Given
+    dedup = SubmissionDeduplicator(60)
+    key = dedup.submission_key("circuit-hash", "arn:sv1", 100)
+    reserved = threading.Event()
+    results = []
+
+    def submit():
+        task_id = dedup.reserve(key)
+        if task_id is None:
+            reserved.set()
+            time.sleep(0.05)
+            dedup.record_submission(key, "task-1", "arn:sv1", 100)
+            task_id = "task-1 (new)"
+        results.append(task_id)
+
+    # When
+    first = threading.Thread(target=submit)
+    first.start()
+    reserved.wait()
+    second = threading.Thread(target=submit)
+    second.start()
+    first.join()
+    second.join()
+
+    # Then
+    assert sorted(results) == ["task-1", "task-1 (new)"]
+
+
+def test_released_reservation_lets_the_next_submission_go_ahead():
+    # Given
+    dedup = SubmissionDeduplicator(60)
+    key = dedup.submission_key("circuit-hash", "arn:sv1", 100)
+    assert dedup.reserve(key) is None
+
+    # When
+    dedup.release(key)
+
+    # Then
+    assert dedup.reserve(key) is None
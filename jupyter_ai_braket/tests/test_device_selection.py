@@ -0,0 +1,52 @@
+"""Python unit tests for queue-aware device selection."""
+from datetime import datetime, timezone
+
+from jupyter_ai_braket.amazon_braket_mcp_server.device_selection import (
+    queue_depth,
+    rank_device,
+    seconds_until_available,
+    sort_rankings,
+    to_braket_gate_names,
+)
+from jupyter_ai_braket.amazon_braket_mcp_server.models import DeviceInfo, DeviceType
+
+# A Monday morning
+NOW = datetime(2026, 10, 19, 8, 0, tzinfo=timezone.utc)
+
+
+def _device(arn, qubits=10, gates=("h", "cnot")):
+    return DeviceInfo(
+        device_arn=arn, device_name=arn, device_type=DeviceType.QPU, provider_name="p",
+        status="ONLINE", qubits=qubits, paradigm="", max_shots=1000, supported_gates=list(gates),
+    )
+
+
+def _document(queue_size):
+    return {"deviceQueueInfo": [
+        {"queue": "QUANTUM_TASKS_QUEUE", "queueSize": queue_size, "queuePriority": "Normal"},
+        {"queue": "JOBS_QUEUE", "queueSize": "7"},
+    ]}
+
+
+def test_queue_depth_ignores_jobs_and_caps():
+    assert queue_depth(_document("3")) == 3
+    assert queue_depth(_document(">4000")) == 4001
+
+
+def test_seconds_until_available():
+    weekdays = [{"executionDay": "Weekdays", "windowStartHour": "09:00", "windowEndHour": "10:00"}]
+    assert seconds_until_available([], NOW) == 0
+    assert seconds_until_available(weekdays, NOW) == 3600
+    assert seconds_until_available(weekdays, NOW.replace(hour=9, minute=30)) == 0
+
+
+def test_rankings_prefer_fitting_and_least_congested_devices():
+    gates = to_braket_gate_names(["h", "cx", "measure"])
+    congested = rank_device(_device("congested"), _document("50"), 2, gates, None, NOW)
+    idle = rank_device(_device("idle"), _document("0"), 2, gates, None, NOW)
+    small = rank_device(_device("small", qubits=1), _document("0"), 2, gates, None, NOW)
+
+    ranked = sort_rankings([small, congested, idle])
+
+    assert [r.device_arn for r in ranked] == ["idle", "congested", "small"]
+    assert not small.fits
@@ -0,0 +1,61 @@
+"""Python unit tests for circuit diagram rendering."""
+from qiskit import QuantumCircuit
+
+from jupyter_ai_braket.amazon_braket_mcp_server.diagrams import render_diagram
+from jupyter_ai_braket.amazon_braket_mcp_server.models import DiagramMode
+
+
+def _chain(num_qubits, repeats=1):
+    circuit = QuantumCircuit(num_qubits)
+    for _ in range(repeats):
+        circuit.h(0)
+        for i in range(num_qubits - 1):
+            circuit.cx(i, i + 1)
+    circuit.measure_all()
+    return circuit
+
+
+def test_small_circuit_is_drawn_in_full():
+    # When
+    diagram, mode = render_diagram(_chain(2))
+
+    # Then
+    assert mode == DiagramMode.FULL
+    assert diagram == str(_chain(2).draw(output="text", fold=-1))
+
+
+def test_auto_mode_respects_budget():
+    # When
+    diagram, mode = render_diagram(_chain(12, repeats=10), max_chars=3000)
+
+    # Then
+    assert mode in (DiagramMode.WINDOW, DiagramMode.SUMMARY)
+    assert len(diagram) <= 3000
+
+
+def test_window_shows_first_and_last_layers():
+    # When
+    diagram, mode = render_diagram(_chain(3, repeats=5), DiagramMode.WINDOW, layers=2)
+
+    # Then
+    assert mode == DiagramMode.WINDOW
+    assert "First 2 layers" in diagram and "Last 2 layers" in diagram
+    assert "layers omitted" in diagram
+
+
+def test_qubit_subset_drops_other_operations():
+    # When
+    diagram, _ = render_diagram(_chain(4), DiagramMode.FULL, qubits=[0, 1])
+
+    # Then
+    assert diagram.startswith("Qubits 0, 1 (")
+    assert "q2" not in diagram and "q3" not in diagram
+
+
+def test_summary_has_no_diagram():
+    # When
+    diagram, _ = render_diagram(_chain(3), DiagramMode.SUMMARY)
+
+    # Then
+    assert "Gate counts: " in diagram
+    assert "┤" not in diagram
@@ -0,0 +1,62 @@
+"""Python unit tests for bounded results histograms."""
+import pytest
+
+from jupyter_ai_braket.amazon_braket_mcp_server.models import HistogramBinning, TaskResult, TaskStatus
+from jupyter_ai_braket.amazon_braket_mcp_server.visualization.ascii_visualizer import ASCIIResultsVisualizer
+from jupyter_ai_braket.amazon_braket_mcp_server.visualization.histogram import bin_counts, top_k_counts
+
+
+def _wide_result(num_outcomes=3000):
+    counts = {format(i, "020b"): 1 + i % 7 for i in range(num_outcomes)}
+    return TaskResult(
+        task_id="t1", status=TaskStatus.COMPLETED, device="dev", shots=sum(counts.values()), counts=counts,
+    )
+
+
+def test_top_k_counts_folds_the_rest_into_other():
+    # When
+    top, other_outcomes, other_shots = top_k_counts({"00": 5, "01": 1, "10": 5, "11": 2}, k=2)
+
+    # Then
+    assert top == [("00", 5), ("10", 5)]
+    assert (other_outcomes, other_shots) == (2, 3)
+
+
+def test_bin_counts_by_hamming_weight_and_qubit_subset():
+    # Given
+    counts = {"000": 4, "011": 3, "101": 2, "111": 1}
+
+    # When
+    by_weight = bin_counts(counts, HistogramBinning.HAMMING_WEIGHT)
+    by_qubits = bin_counts(counts, HistogramBinning.QUBITS, qubits=[2, 0])
+
+    # Then
+    assert by_weight == {"w=0": 4, "w=2": 5, "w=3": 1}
+    assert by_qubits == {"00": 4, "10": 3, "11": 3}
+    with pytest.raises(ValueError):
+        bin_counts(counts, HistogramBinning.QUBITS, qubits=[3])
+
+
+def test_wide_result_histogram_is_bounded():
+    # Given
+    result = _wide_result()
+
+    # When
+    data = ASCIIResultsVisualizer().results_to_ascii(result, top_k=10)
+
+    # Then
+    lines = data["ascii_histogram"].splitlines()
+    assert len(lines) == 10 + 6
+    assert lines[-4].startswith("other (2990)")
+    assert data["other_outcomes"] == 2990
+    assert data["other_shots"] == result.shots - 10 * 7
+
+
+def test_hamming_weight_histogram_keeps_every_weight():
+    # When
+    data = ASCIIResultsVisualizer().results_to_ascii(_wide_result(), top_k=2, bin_by="hamming_weight")
+
+    # Then
+    assert data["num_bins"] == 12
+    assert data["other_outcomes"] == 0
+    assert "w=11" in data["ascii_histogram"]
@@ -0,0 +1,145 @@
+"""Python unit tests for the circuit optimization pipeline."""
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Operator
+
+from jupyter_ai_braket.amazon_braket_mcp_server.models import OptimizationConfig
+from jupyter_ai_braket.amazon_braket_mcp_server.optimization import (
+    cancel_inverses,
+    fold_single_qubit_runs,
+    merge_rotations,
+    optimize_circuit,
+    remove_unmeasured_operations,
+)
+
+CONFIG = OptimizationConfig()
+
+
+def _names(circuit):
+    return [instruction.operation.name for instruction in circuit.data]
+
+
+def test_unitary_passes_preserve_the_operator():
+    # Given
+    circuit = QuantumCircuit(3)
+    circuit.h(0)
+    circuit.x(1)
+    circuit.x(1)
+    circuit.h(0)
+    circuit.rz(0.3, 2)
+    circuit.rz(-0.3, 2)
+    circuit.cx(0, 1)
+    circuit.s(2)
+    circuit.sdg(2)
+    circuit.cx(0, 1)
+    circuit.h(1)
+    circuit.t(1)
+    circuit.h(1)
+    circuit.cz(1, 2)
+    config = OptimizationConfig(passes=["cancel_inverses", "merge_rotations", "fold_single_qubit_runs"])
+
+    # When
+    optimized, report = optimize_circuit(circuit, config)
+
+    # Then
+    assert Operator(optimized).equiv(Operator(circuit))
+    assert report.before.gate_count == 14
+    assert report.after.gate_count == 4
+    assert report.after.depth < report.before.depth
+
+
+def test_operations_after_final_measurement_are_removed():
+    # Given
+    circuit = QuantumCircuit(2, 2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.measure([0, 1], [0, 1])
+    circuit.x(0)
+    circuit.h(1)
+
+    # When
+    optimized, report = optimize_circuit(circuit)
+
+    # Then
+    assert [i.operation.name for i in optimized.data] == ["h", "cx", "measure", "measure"]
+    assert report.after.gate_count == 2
+
+
+def test_cancel_inverses_cascades_and_respects_qubit_order():
+    # Given
+    circuit = QuantumCircuit(2)
+    circuit.h(0)
+    circuit.x(0)
+    circuit.x(0)
+    circuit.h(0)
+    circuit.t(1)
+    circuit.tdg(1)
+    circuit.cz(0, 1)
+    circuit.cz(1, 0)
+    circuit.cx(0, 1)
+    circuit.cx(1, 0)
+
+    # When
+    optimized = cancel_inverses(circuit, CONFIG)
+
+    # Then
+    assert _names(optimized) == ["cx", "cx"]
+    assert Operator(optimized).equiv(Operator(circuit))
+
+
+def test_merge_rotations_adds_angles_and_drops_full_turns():
+    # Given
+    circuit = QuantumCircuit(2)
+    circuit.rz(0.25, 0)
+    circuit.rz(0.5, 0)
+    circuit.rx(3.0, 1)
+    circuit.rx(2 * 3.141592653589793 - 3.0, 1)
+
+    # When
+    optimized = merge_rotations(circuit, CONFIG)
+
+    # Then
+    assert _names(optimized) == ["rz"]
+    assert float(optimized.data[0].operation.params[0]) == 0.75
+    assert Operator(optimized).equiv(Operator(circuit))
+
+
+def test_remove_unmeasured_operations_keeps_gates_feeding_measurements():
+    # Given
+    circuit = QuantumCircuit(3, 1)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.x(2)
+    circuit.measure(1, 0)
+    circuit.h(1)
+
+    # When
+    optimized = remove_unmeasured_operations(circuit, CONFIG)
+
+    # Then
+    assert _names(optimized) == ["h", "cx", "measure"]
+
+
+def test_remove_unmeasured_operations_leaves_unmeasured_circuits_alone():
+    circuit = QuantumCircuit(1)
+    circuit.h(0)
+
+    assert remove_unmeasured_operations(circuit, CONFIG) is circuit
+
+
+def test_fold_single_qubit_runs_replaces_runs_with_braket_rotations():
+    # Given
+    circuit = QuantumCircuit(2)
+    circuit.h(0)
+    circuit.s(0)
+    circuit.t(0)
+    circuit.cx(0, 1)
+    circuit.sx(1)
+    circuit.rz(0.3, 1)
+    circuit.sx(1)
+
+    # When
+    optimized = fold_single_qubit_runs(circuit, CONFIG)
+
+    # Then
+    assert _names(optimized) == ["ry", "rz", "cx", "ry", "rz"]
+    assert Operator(optimized).equiv(Operator(circuit))
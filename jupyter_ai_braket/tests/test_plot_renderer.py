@@ -0,0 +1,50 @@
+"""Python unit tests for the result plot renderer."""
+from concurrent.futures import ThreadPoolExecutor
+
+from jupyter_ai_braket.amazon_braket_mcp_server.visualization.plot_renderer import PlotRenderer
+
+
+def _is_png(image):
+    return image.startswith(b"\x89PNG")
+
+
+def test_repeated_plot_comes_from_cache():
+    # Given
+    renderer = PlotRenderer(processes=0)
+
+    # When
+    first = renderer.render_counts({"00": 510, "11": 490}, "Bell")
+    second = renderer.render_counts({"11": 490, "00": 510}, "Bell")
+    other = renderer.render_counts({"00": 510, "11": 490}, "Bell", style={"dpi": 50})
+
+    # Then
+    assert _is_png(first)
+    assert second is first
+    assert other != first
+    assert (renderer.hits, renderer.misses) == (1, 2)
+
+
+def test_concurrent_requests_share_one_render():
+    # Given
+    renderer = PlotRenderer(processes=0)
+
+    # When
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        images = list(pool.map(lambda _: renderer.render_counts({"0": 3, "1": 1}, "t"), range(8)))
+
+    # Then
+    assert renderer.misses == 1
+    assert all(image == images[0] for image in images)
+
+
+def test_renders_in_worker_process():
+    # Given
+    renderer = PlotRenderer(processes=1)
+
+    # When
+    renderer.warm_up()
+    image = renderer.render_counts({"0": 3, "1": 1}, "worker")
+
+    # Then
+    assert _is_png(image)
+    assert image == PlotRenderer(processes=0).render_counts({"0": 3, "1": 1}, "worker")
@@ -0,0 +1,65 @@
+"""Python unit tests for the parsed-QASM cache."""
+from jupyter_ai_braket.amazon_braket_mcp_server.models import DiagramMode
+from jupyter_ai_braket.amazon_braket_mcp_server.qasm_cache import (
+    MAX_DIAGRAMS_PER_PROGRAM,
+    ParsedQasmCache,
+    normalize_qasm,
+)
+
+PROGRAM = """OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+h q[0];
+cx q[0], q[1];
+"""
+
+
+def test_normalize_ignores_comments_and_whitespace():
+    # Given
+    reformatted = "// Bell pair\nOPENQASM 3.0;\n\ninclude  \"stdgates.inc\";\r\nqubit[2] q;  /* two */\nh q[0];\ncx q[0],  q[1];\n"
+
+    # Then
+    assert normalize_qasm(reformatted) == normalize_qasm(PROGRAM)
+    assert normalize_qasm(PROGRAM) != normalize_qasm(PROGRAM.replace("h q[0]", "x q[0]"))
+
+
+def test_equivalent_programs_are_parsed_once():
+    # Given
+    cache = ParsedQasmCache()
+
+    # When
+    first = cache.parse(PROGRAM)
+    second = cache.parse("// again\n" + PROGRAM)
+
+    # Then
+    assert second is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert first.num_qubits == 2 and first.num_operations == 2
+    assert "H" in first.diagram
+
+
+def test_least_recently_used_program_is_evicted():
+    # Given
+    cache = ParsedQasmCache(max_entries=1)
+    cache.parse(PROGRAM)
+
+    # When
+    cache.parse(PROGRAM.replace("h q[0]", "x q[0]"))
+    cache.parse(PROGRAM)
+
+    # Then
+    assert cache.misses == 3
+
+
+def test_rendered_diagrams_per_program_are_bounded():
+    # Given
+    parsed = ParsedQasmCache().parse(PROGRAM)
+    first = parsed.render(DiagramMode.FOLDED, fold=40)
+
+    # When
+    for fold in range(41, 41 + MAX_DIAGRAMS_PER_PROGRAM * 2):
+        parsed.render(DiagramMode.FOLDED, fold=fold)
+
+    # Then
+    assert len(parsed._diagrams) == MAX_DIAGRAMS_PER_PROGRAM
+    assert parsed.render(DiagramMode.FOLDED, fold=40) == first
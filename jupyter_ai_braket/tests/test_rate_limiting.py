@@ -0,0 +1,85 @@
+"""Python unit tests for the Braket API rate limiter."""
+import threading
+import time
+
+import pytest
+from botocore.exceptions import ClientError
+
+from jupyter_ai_braket.amazon_braket_mcp_server.exceptions import ThrottlingError
+from jupyter_ai_braket.amazon_braket_mcp_server.rate_limiting import (
+    Priority,
+    RateLimiter,
+    TokenBucket,
+)
+
+
+def _throttled():
+    return ClientError({"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}, "GetDevice")
+
+
+def test_interactive_lane_is_served_before_bulk():
+    # Given an empty bucket with a bulk caller already waiting
+    bucket = TokenBucket(rate=20, capacity=1)
+    bucket.acquire()
+    order = []
+    bulk = threading.Thread(target=lambda: (bucket.acquire(Priority.BULK), order.append("bulk")))
+    bulk.start()
+    time.sleep(0.01)
+
+    # When an interactive caller arrives
+    bucket.acquire(Priority.INTERACTIVE)
+    order.append("interactive")
+    bulk.join()
+
+    # Then it takes the next token first
+    assert order == ["interactive", "bulk"]
+
+
+def test_throttled_calls_are_retried():
+    # Given
+    limiter = RateLimiter(base_delay=0.001)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise _throttled()
+        return "ok"
+
+    # When / Then
+    assert limiter.call(flaky) == "ok"
+    assert len(attempts) == 3
+    assert limiter.throttled_calls == 2
+
+
+def test_throttled_calls_are_counted_across_threads():
+    # Given
+    limiter = RateLimiter(max_retries=0)
+
+    def always_throttled():
+        raise _throttled()
+
+    def worker():
+        for _ in range(200):
+            with pytest.raises(ThrottlingError):
+                limiter.call(always_throttled)
+
+    # When
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Then
+    assert limiter.throttled_calls == 8 * 200
+
+
+def test_persistent_throttling_raises_throttling_error():
+    limiter = RateLimiter(max_retries=2, base_delay=0.001)
+
+    def always_throttled():
+        raise _throttled()
+
+    with pytest.raises(ThrottlingError, match="throttling"):
+        limiter.call(always_throttled)
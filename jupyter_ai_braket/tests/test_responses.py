@@ -0,0 +1,135 @@
+"""Python unit tests for compact tool responses."""
+from datetime import datetime
+
+import pytest
+
+from jupyter_ai_braket.amazon_braket_mcp_server.models import TaskResult, TaskStatus
+from jupyter_ai_braket.amazon_braket_mcp_server.responses import (
+    shape_results_visualization,
+    shape_task_result,
+    shape_task_search_entry,
+    summarize_task_result,
+    task_result_from_response,
+)
+
+
+def _result():
+    counts = {format(i, "05b"): 100 - i for i in range(20)}
+    return TaskResult(
+        task_id="task-1", status=TaskStatus.COMPLETED, device="dev", shots=sum(counts.values()),
+        counts=counts, measurements=[[0, 0, 0, 0, 0]] * 100, metadata={"taskMetadata": {"id": "x"}},
+    )
+
+
+def test_summary_keeps_top_counts_and_totals():
+    # When
+    summary = summarize_task_result(_result(), max_outcomes=3)
+
+    # Then
+    assert summary.counts == {"00000": 100, "00001": 99, "00010": 98}
+    assert summary.num_outcomes == 20
+    assert summary.other_shots == summary.shots - 297
+    assert summary.most_likely == "00000"
+    assert summary.has_measurements is True
+    assert summary.metadata_keys == ["taskMetadata"]
+
+
+def test_default_task_result_leaves_out_raw_data():
+    # When
+    response = shape_task_result(_result()).model_dump()
+
+    # Then
+    assert "measurements" not in response
+    assert "metadata" not in response
+    assert len(response["counts"]) == 16
+
+
+def test_fields_return_raw_data_on_request():
+    # When
+    response = shape_task_result(_result(), fields=["measurements", "num_outcomes"]).model_dump()
+
+    # Then
+    assert set(response) == {"task_id", "measurements", "num_outcomes"}
+    assert len(response["measurements"]) == 100
+
+
+def test_unknown_field_or_detail_is_rejected():
+    with pytest.raises(ValueError, match="Available fields"):
+        shape_task_result(_result(), fields=["nope"])
+    with pytest.raises(ValueError, match="summary, full"):
+        shape_task_result(_result(), detail="verbose")
+
+
+def test_truncated_summary_is_not_analysed():
+    with pytest.raises(ValueError, match="leave out"):
+        task_result_from_response(shape_task_result(_result()).model_dump())
+
+
+def test_complete_counts_are_analysed():
+    # Given
+    response = shape_task_result(_result(), fields=["status", "device", "shots", "counts"]).model_dump()
+
+    # When
+    result = task_result_from_response(response)
+
+    # Then
+    assert result.counts == _result().counts
+    assert result.shots == sum(result.counts.values())
+
+
+def test_full_detail_is_unchanged():
+    assert shape_task_result(_result(), detail="FULL").model_dump() == _result().model_dump()
+
+
+def _visualization_response(**reference):
+    return {
+        "result": _result().model_dump(),
+        "description": {"summary": "20 outcomes"},
+        "ascii_visualization": "chart",
+        "visualization_file": "/tmp/results.png",
+        "usage_note": "See the chart",
+        **reference,
+    }
+
+
+def test_visualization_summary_drops_base64_png():
+    # Given
+    response = _visualization_response(visualization_data="iVBORw0KGgo" * 1000)
+
+    # When
+    shaped = shape_results_visualization(response).model_dump()
+
+    # Then
+    assert shaped["visualization_data"] is None
+    assert "measurements" not in shaped["result"]
+    assert shaped["visualization_file"] == "/tmp/results.png"
+
+
+def test_visualization_image_is_inlined_only_on_request():
+    # Given
+    response = _visualization_response(visualization_id="ab" * 32, visualization_data="iVBORw0KGgo")
+
+    # When
+    full = shape_results_visualization(response, "full").model_dump()
+    inlined = shape_results_visualization(response, "summary", include_image=True).model_dump()
+
+    # Then
+    assert full["visualization_data"] is None
+    assert full["result"] == response["result"]
+    assert inlined["visualization_data"] == "iVBORw0KGgo"
+    assert inlined["visualization_id"] == "ab" * 32
+
+
+def test_task_search_summary_drops_output_locations():
+    # Given
+    task = {
+        "quantumTaskArn": "arn", "status": "COMPLETED", "deviceArn": "dev", "shots": 10,
+        "createdAt": datetime(2026, 1, 1), "outputS3Bucket": "b", "tags": {"a": "b"},
+    }
+
+    # Then
+    assert shape_task_search_entry(task).model_dump() == {
+        "quantumTaskArn": "arn", "status": "COMPLETED", "deviceArn": "dev", "shots": 10,
+        "createdAt": datetime(2026, 1, 1), "endedAt": None,
+    }
+    assert shape_task_search_entry(task, "full").model_dump() == task
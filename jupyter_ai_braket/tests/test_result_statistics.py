@@ -0,0 +1,58 @@
+"""Python unit tests for shared result statistics."""
+import math
+
+from jupyter_ai_braket.amazon_braket_mcp_server.models import TaskResult, TaskStatus
+from jupyter_ai_braket.amazon_braket_mcp_server.visualization import VisualizationUtils
+from jupyter_ai_braket.amazon_braket_mcp_server.visualization.result_statistics import (
+    ResultStatistics,
+    ResultStatisticsCache,
+)
+
+
+def _result(counts, task_id="t1"):
+    return TaskResult(
+        task_id=task_id, status=TaskStatus.COMPLETED, device="dev", shots=sum(counts.values()), counts=counts,
+    )
+
+
+def test_statistics_match_the_counts():
+    # When
+    stats = ResultStatistics({"11": 250, "00": 250, "01": 500})
+
+    # Then
+    assert stats.total_shots == 1000
+    assert stats.num_outcomes == 3
+    assert (stats.most_probable, stats.max_probability) == ("01", 0.5)
+    assert (stats.least_probable, stats.min_probability) == ("00", 0.25)
+    assert math.isclose(stats.entropy, 1.5)
+    assert stats.probabilities == {"11": 0.25, "00": 0.25, "01": 0.5}
+
+
+def test_cache_reuses_statistics_only_for_the_same_counts():
+    # Given
+    cache = ResultStatisticsCache()
+    result = _result({"0": 3, "1": 1})
+
+    # When
+    first = cache.get(result)
+    second = cache.get(_result({"0": 3, "1": 1}))
+    summary = cache.get(_result({"0": 3}))
+
+    # Then
+    assert second is first
+    assert summary is not first
+    assert summary.total_shots == 3
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert cache.get(_result({})) is None
+
+
+def test_describe_results_reads_shared_statistics(tmp_path):
+    # When
+    description = VisualizationUtils(str(tmp_path)).describe_results(_result({"00": 510, "11": 490}, "bell"))
+
+    # Then
+    assert description["summary"].startswith("Measured 2 different outcomes over 1000 shots. Most frequent: 00")
+    assert description["statistics"]["entropy"] > 0.99
+    assert description["distribution"]["pattern"] == "uniform_binary"
+    assert description["distribution"]["distribution_type"] == "uniform_binary"
+    assert description["insights"] == ["Results suggest quantum entanglement (Bell state pattern)"]
@@ -1,5 +1,8 @@
 import json
 
+import pytest
+import tornado.httpclient
+
 
 async def test_hello(jp_fetch):
     # When
@@ -15,3 +18,172 @@ async def test_hello(jp_fetch):
                 " Try visiting me in your browser!"
             ),
         }
+
+
+async def test_visualization_is_served_by_content_id(jp_fetch, tmp_path, monkeypatch):
+    # Given
+    from jupyter_ai_braket.amazon_braket_mcp_server.visualization.visualization_store import VisualizationStore
+
+    monkeypatch.chdir(tmp_path)
+    entry = VisualizationStore(str(tmp_path / "braket_visualizations")).save(b"\x89PNG-data", "results_t1")
+
+    # When
+    response = await jp_fetch("jupyter-ai-braket", "visualizations", entry.sha256)
+
+    # Then
+    assert response.code == 200
+    assert response.body == b"\x89PNG-data"
+    assert response.headers["Content-Type"] == "image/png"
+
+
+async def test_visualization_is_served_from_the_configured_workspace(jp_fetch, tmp_path, monkeypatch):
+    # Given
+    from jupyter_ai_braket.amazon_braket_mcp_server.visualization.visualization_store import VisualizationStore
+
+    workspace = tmp_path / "workspace"
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BRAKET_WORKSPACE_DIR", str(workspace))
+    entry = VisualizationStore(str(workspace / "braket_visualizations")).save(b"\x89PNG-data", "results_t1")
+
+    # When
+    response = await jp_fetch("jupyter-ai-braket", "visualizations", entry.sha256)
+
+    # Then
+    assert response.code == 200
+    assert response.body == b"\x89PNG-data"
+
+
+async def test_visualization_url_finds_a_scoped_workspace(jp_fetch, tmp_path, monkeypatch):
+    # Given
+    from urllib.parse import parse_qs, urlsplit
+
+    from jupyter_ai_braket.amazon_braket_mcp_server.visualization.visualization_store import (
+        VisualizationStore,
+        visualization_url,
+    )
+
+    workspace = tmp_path / "root" / "alice"
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BRAKET_WORKSPACE_ROOT", str(tmp_path / "root"))
+    entry = VisualizationStore(str(workspace / "braket_visualizations")).save(b"\x89PNG-data", "results_t1")
+    url = urlsplit(visualization_url(entry.sha256, str(workspace)))
+
+    # When
+    response = await jp_fetch(
+        *url.path.lstrip("/").split("/"),
+        params={key: values[0] for key, values in parse_qs(url.query).items()},
+    )
+
+    # Then
+    assert parse_qs(url.query) == {"workspace": ["alice"]}
+    assert response.code == 200
+    assert response.body == b"\x89PNG-data"
+
+
+async def test_visualization_rejects_workspaces_outside_the_root(jp_fetch, tmp_path, monkeypatch):
+    # Given
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BRAKET_WORKSPACE_ROOT", str(tmp_path / "root"))
+
+    # When
+    with pytest.raises(tornado.httpclient.HTTPClientError) as error:
+        await jp_fetch("jupyter-ai-braket", "visualizations", "0" * 64, params={"workspace": "../other"})
+
+    # Then
+    assert error.value.code == 403
+
+
+async def test_unknown_visualization_is_not_found(jp_fetch, tmp_path, monkeypatch):
+    # Given
+    monkeypatch.chdir(tmp_path)
+
+    # When
+    with pytest.raises(tornado.httpclient.HTTPClientError) as error:
+        await jp_fetch("jupyter-ai-braket", "visualizations", "0" * 64)
+
+    # Then
+    assert error.value.code == 404
+
+
+async def test_visualization_requires_authentication(jp_fetch, jp_base_url, jp_http_port, tmp_path, monkeypatch):
+    # Given
+    from jupyter_ai_braket.amazon_braket_mcp_server.visualization.visualization_store import VisualizationStore
+
+    monkeypatch.chdir(tmp_path)
+    entry = VisualizationStore(str(tmp_path / "braket_visualizations")).save(b"\x89PNG-data", "results_t1")
+    url = f"http://localhost:{jp_http_port}{jp_base_url}jupyter-ai-braket/visualizations/{entry.sha256}"
+
+    # When
+    response = await tornado.httpclient.AsyncHTTPClient().fetch(url, raise_error=False, follow_redirects=False)
+
+    # Then
+    assert response.code in (302, 403)
+    assert response.body != b"\x89PNG-data"
+
+
+async def test_circuit_diagram_streams_a_page_of_moments(jp_fetch, tmp_path, monkeypatch):
+    # Given
+    monkeypatch.chdir(tmp_path)
+    gates = "".join(f"h q[{i % 2}];\n" for i in range(10))
+    (tmp_path / "deep.qasm").write_text(f"OPENQASM 3.0;\ninclude \"stdgates.inc\";\nqubit[2] q;\n{gates}")
+
+    # When
+    response = await jp_fetch(
+        "jupyter-ai-braket", "circuit-diagram",
+        params={"path": "deep.qasm", "format": "svg", "page": "1", "page_size": "2"},
+    )
+
+    # Then
+    body = response.body.decode()
+    assert response.headers["Content-Type"].startswith("image/svg+xml")
+    assert response.headers["X-Circuit-Moments"] == "5"
+    assert 'data-moment="2"' in body and 'data-moment="3"' in body
+    assert 'data-moment="1"' not in body and 'data-moment="4"' not in body
+    assert body.rstrip().endswith("</svg>")
+
+
+async def test_circuit_diagram_streams_a_window_of_moments_as_text(jp_fetch, tmp_path, monkeypatch):
+    # Given
+    monkeypatch.chdir(tmp_path)
+    gates = "".join(f"x q[{i % 2}];\n" for i in range(8))
+    (tmp_path / "text.qasm").write_text(f"OPENQASM 3.0;\ninclude \"stdgates.inc\";\nqubit[2] q;\n{gates}")
+
+    # When
+    response = await jp_fetch(
+        "jupyter-ai-braket", "circuit-diagram",
+        params={"path": "text.qasm", "start": "1", "stop": "3"},
+    )
+
+    # Then
+    assert response.headers["Content-Type"].startswith("text/plain")
+    assert response.headers["X-Circuit-Moments"] == "4"
+    assert response.headers["X-Circuit-Qubits"] == "2"
+    assert "X" in response.body.decode()
+
+
+async def test_circuit_diagram_rejects_paths_outside_the_workspace(jp_fetch, tmp_path, monkeypatch):
+    # Given
+    monkeypatch.chdir(tmp_path)
+
+    # When
+    with pytest.raises(tornado.httpclient.HTTPClientError) as error:
+        await jp_fetch("jupyter-ai-braket", "circuit-diagram", params={"path": "../outside.qasm"})
+
+    # Then
+    assert error.value.code == 403
+
+
+async def test_circuit_diagram_reads_from_the_configured_workspace(jp_fetch, tmp_path, monkeypatch):
+    # Given
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BRAKET_WORKSPACE_DIR", str(workspace))
+    (workspace / "bell.qasm").write_text("OPENQASM 3.0;\ninclude \"stdgates.inc\";\nqubit[2] q;\nh q[0];\ncx q[0], q[1];\n")
+
+    # When
+    response = await jp_fetch("jupyter-ai-braket", "circuit-diagram", params={"path": "bell.qasm"})
+
+    # Then
+    assert response.code == 200
+    assert response.headers["X-Circuit-Moments"] == "2"
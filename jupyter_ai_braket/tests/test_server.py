@@ -0,0 +1,309 @@
+"""Python unit tests for the Braket MCP server tools."""
+import asyncio
+import contextlib
+import subprocess
+import sys
+import time
+import types
+
+import pytest
+
+from jupyter_ai_braket.amazon_braket_mcp_server import server
+from jupyter_ai_braket.amazon_braket_mcp_server.models import TaskProgress, TaskResult, TaskStatus
+from jupyter_ai_braket.amazon_braket_mcp_server.tracing import Tracer
+
+
+def test_blocking_work_overlaps():
+    # Given
+    async def run_two():
+        return await asyncio.gather(
+            server.run_blocking(time.sleep, 0.2),
+            server.run_blocking(time.sleep, 0.2),
+        )
+
+    # When
+    started = time.monotonic()
+    asyncio.run(run_two())
+
+    # Then
+    assert time.monotonic() - started < 0.35
+
+
+def test_server_import_defers_heavy_dependencies():
+    # Given
+    code = (
+        "import sys; import jupyter_ai_braket.amazon_braket_mcp_server.server; "
+        "print(sorted(m for m in ('qiskit', 'boto3', 'braket.aws', 'qiskit_braket_provider') if m in sys.modules))"
+    )
+
+    # When
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    # Then
+    assert output.strip() == "[]"
+
+
+def test_create_ghz_circuit_tool():
+    # When
+    response = asyncio.run(server.create_ghz_circuit(num_qubits=4))
+
+    # Then
+    assert response["success"] is True
+    assert response["num_qubits"] == 4
+
+
+def test_tools_are_registered_as_async():
+    # When
+    tools = asyncio.run(server.mcp.list_tools())
+
+    # Then
+    assert {"create_quantum_circuit", "get_task_result", "list_devices"} <= {tool.name for tool in tools}
+    assert all(asyncio.iscoroutinefunction(tool.fn) for tool in server.mcp._tool_manager.list_tools())
+
+
+def test_large_circuit_diagram_stays_within_budget():
+    # When
+    response = asyncio.run(server.create_qft_circuit(num_qubits=30))
+
+    # Then
+    assert response["success"] is True
+    assert response["diagram_mode"] in ("window", "summary")
+    assert len(response["circuit_diagram"]) <= 4000
+
+
+def test_workspace_outside_root_is_rejected(tmp_path, monkeypatch):
+    # Given
+    monkeypatch.setenv("BRAKET_WORKSPACE_ROOT", str(tmp_path))
+
+    # Then
+    assert server.resolve_workspace_dir("alice") == str(tmp_path / "alice")
+    with pytest.raises(ValueError):
+        server.resolve_workspace_dir("../bob")
+
+
+def test_library_circuit_is_saved_in_the_workspace_and_catalogued(tmp_path, monkeypatch):
+    # Given
+    monkeypatch.chdir(tmp_path)
+
+    # When
+    response = asyncio.run(server.generate_library_circuit("ghz", 3, filename="circuits/ghz.qasm"))
+
+    # Then
+    assert response["success"] is True
+    assert (tmp_path / "circuits" / "ghz.qasm").exists()
+    entries = server.get_workspace_catalog(str(tmp_path)).query()
+    assert [(entry.path, entry.sha256) for entry in entries] == [("circuits/ghz.qasm", response["sha256"])]
+
+
+def test_library_circuit_outside_the_workspace_is_rejected(tmp_path, monkeypatch):
+    # Given
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    monkeypatch.chdir(workspace)
+
+    # When
+    response = asyncio.run(server.generate_library_circuit("ghz", 3, filename="../escaped.qasm"))
+
+    # Then
+    assert response["success"] is False
+    assert not (tmp_path / "escaped.qasm").exists()
+
+
+def test_circuit_outside_the_workspace_is_not_saved(tmp_path, monkeypatch):
+    # Given
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    monkeypatch.chdir(workspace)
+    program = 'OPENQASM 3.0;\ninclude "stdgates.inc";\nqubit[1] q;\nh q[0];\n'
+
+    # When
+    response = asyncio.run(server.create_quantum_circuit(program, filename="../../escaped.qasm"))
+
+    # Then
+    assert response["success"] is False
+    assert "outside the workspace" in response["error"]
+    assert not (tmp_path / "escaped.qasm").exists()
+    assert not (tmp_path.parent / "escaped.qasm").exists()
+
+
+def test_no_request_scope_outside_http_requests():
+    assert server.get_request_scope() is None
+
+
+def _fake_request(monkeypatch, headers):
+    request = types.SimpleNamespace(headers=headers)
+    context = types.SimpleNamespace(request_context=types.SimpleNamespace(request=request))
+    monkeypatch.setattr(server.mcp, "get_context", lambda: context)
+
+
+def test_http_request_without_credentials_is_rejected(tmp_path, monkeypatch):
+    # Given
+    monkeypatch.delenv(server.ALLOW_DEFAULT_CREDENTIALS_ENV, raising=False)
+    _fake_request(monkeypatch, {server.WORKSPACE_HEADER: str(tmp_path)})
+
+    # When
+    with pytest.raises(ValueError) as error:
+        server.get_request_scope()
+
+    # Then
+    assert server.ACCESS_KEY_ID_HEADER in str(error.value)
+
+
+def test_http_request_may_use_default_credentials_when_allowed(tmp_path, monkeypatch):
+    # Given
+    monkeypatch.setenv(server.ALLOW_DEFAULT_CREDENTIALS_ENV, "1")
+    monkeypatch.delenv("BRAKET_WORKSPACE_ROOT", raising=False)
+    _fake_request(monkeypatch, {server.WORKSPACE_HEADER: str(tmp_path)})
+
+    # When
+    scope = server.get_request_scope()
+
+    # Then
+    assert scope.workspace_dir == str(tmp_path.resolve())
+    assert scope.access_key_id is None
+
+
+@pytest.mark.parametrize("missing", ["BRAKET_MCP_AUTH_TOKEN", "BRAKET_WORKSPACE_ROOT"])
+def test_server_refuses_to_serve_other_hosts_unprotected(missing, tmp_path, monkeypatch):
+    # Given
+    monkeypatch.setenv("BRAKET_MCP_AUTH_TOKEN", "secret")
+    monkeypatch.setenv("BRAKET_WORKSPACE_ROOT", str(tmp_path))
+    monkeypatch.delenv(missing)
+    monkeypatch.setattr(server, "start_warm_up", lambda: None)
+    monkeypatch.setattr(sys, "argv", ["server", "--transport", "streamable-http", "--host", "0.0.0.0"])
+
+    # When
+    with pytest.raises(SystemExit) as error:
+        server.main()
+
+    # Then
+    assert error.value.code == 2
+
+
+def test_bearer_token_middleware_rejects_missing_token():
+    # Given
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope)
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = server.BearerTokenMiddleware(app, "secret")
+
+    # When
+    asyncio.run(middleware({"type": "http", "headers": []}, None, send))
+    asyncio.run(middleware({"type": "http", "headers": [(b"authorization", b"Bearer secret")]}, None, send))
+
+    # Then
+    assert sent[0]["status"] == 401
+    assert len(calls) == 1
+
+
+class _FakeService:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.rate_limiter = _NoLimiter()
+
+    def get_task_progress(self, task_id):
+        status, position = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        return TaskProgress(task_id=task_id, status=status, queue_position=position)
+
+    def get_task_result(self, task_id):
+        return TaskResult(task_id=task_id, status=TaskStatus.COMPLETED, device="dev", shots=10, counts={"0": 10})
+
+
+class _NoLimiter:
+    @contextlib.contextmanager
+    def lane(self, priority):
+        yield
+
+
+class _FakeContext:
+    def __init__(self):
+        self.messages = []
+
+    async def report_progress(self, progress, total=None, message=None):
+        self.messages.append(message)
+
+
+def test_wait_for_task_reports_changes_and_returns_result(monkeypatch):
+    # Given
+    service = _FakeService([
+        (TaskStatus.QUEUED, "3"), (TaskStatus.QUEUED, "3"), (TaskStatus.QUEUED, "1"), (TaskStatus.COMPLETED, None),
+    ])
+    monkeypatch.setattr(server, "get_braket_service", lambda: service)
+    monkeypatch.setattr(server.asyncio, "sleep", _no_sleep)
+    ctx = _FakeContext()
+
+    # When
+    result = asyncio.run(server.wait_for_task("task-1", ctx, timeout_seconds=60))
+
+    # Then
+    assert result.status == TaskStatus.COMPLETED
+    assert result.timed_out is False
+    assert ctx.messages == [
+        "Task task-1 is QUEUED (queue position 3)",
+        "Task task-1 is QUEUED (queue position 1)",
+        "Task task-1 is COMPLETED",
+    ]
+
+
+def test_wait_for_task_times_out(monkeypatch):
+    # Given
+    monkeypatch.setattr(server, "get_braket_service", lambda: _FakeService([(TaskStatus.RUNNING, None)]))
+
+    # When
+    result = asyncio.run(server.wait_for_task("task-1", _FakeContext(), timeout_seconds=0))
+
+    # Then
+    assert result.timed_out is True
+    assert result.status == TaskStatus.RUNNING
+
+
+def test_task_result_tools_declare_typed_output_schemas():
+    # When
+    tools = {tool.name: tool for tool in asyncio.run(server.mcp.list_tools())}
+
+    # Then
+    for name in ("get_task_result", "wait_for_task", "list_devices", "search_quantum_tasks", "visualize_results"):
+        assert "ErrorResponse" in tools[name].outputSchema["$defs"]
+    assert "TaskResultSummary" in tools["get_task_result"].outputSchema["$defs"]
+    assert "DeviceSummary" in tools["list_devices"].outputSchema["$defs"]
+
+
+def test_requested_result_fields_are_returned_as_is(monkeypatch):
+    # Given
+    monkeypatch.setattr(server, "get_braket_service", lambda: _FakeService([(TaskStatus.COMPLETED, None)]))
+
+    # When
+    _, structured = asyncio.run(server.mcp.call_tool(
+        "get_task_result", {"task_id": "task-1", "fields": ["status", "device", "shots", "counts"]},
+    ))
+
+    # Then
+    assert structured["result"] == {
+        "task_id": "task-1", "status": "COMPLETED", "device": "dev", "shots": 10, "counts": {"0": 10},
+    }
+
+
+async def _no_sleep(seconds):
+    return None
+
+
+def test_tool_calls_are_recorded_for_server_stats(monkeypatch):
+    # Given
+    tracer = Tracer()
+    monkeypatch.setattr(server, "get_tracer", lambda: tracer)
+
+    # When
+    asyncio.run(server.create_bell_pair_circuit(diagram_mode="summary"))
+    stats = asyncio.run(server.get_server_stats(tool="create_bell_pair_circuit"))
+
+    # Then
+    assert [t["name"] for t in stats["tools"]] == ["create_bell_pair_circuit"]
+    assert stats["tools"][0]["calls"] == 1
+    assert stats["tools"][0]["max_payload_bytes"] > 0
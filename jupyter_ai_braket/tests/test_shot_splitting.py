@@ -0,0 +1,120 @@
+"""Python unit tests for shot splitting and result merging."""
+from types import SimpleNamespace
+
+from jupyter_ai_braket.amazon_braket_mcp_server.models import TaskResult, TaskStatus
+from jupyter_ai_braket.amazon_braket_mcp_server.shot_splitting import (
+    TaskResultMerger,
+    plan_shot_chunks,
+)
+
+
+def test_plan_shot_chunks_respects_device_limits():
+    # When
+    chunks = plan_shot_chunks(2500, {"dev-a": 1000, "dev-b": 400})
+
+    # Then
+    assert [(c.device_arn, c.shots) for c in chunks] == [
+        ("dev-a", 1000),
+        ("dev-b", 400),
+        ("dev-a", 1000),
+        ("dev-b", 100),
+    ]
+    assert sum(c.shots for c in chunks) == 2500
+
+
+def test_merger_combines_counts_and_measurements_in_chunk_order():
+    # Given
+    chunks = plan_shot_chunks(3, {"dev": 2})
+    merger = TaskResultMerger("split-1", chunks)
+
+    # When (second chunk finishes first)
+    merger.add(chunks[1], TaskResult(
+        task_id="t2", status=TaskStatus.COMPLETED, device="dev", shots=1,
+        counts={"11": 1}, measurements=[[1, 1]],
+    ))
+    merger.add(chunks[0], TaskResult(
+        task_id="t1", status=TaskStatus.COMPLETED, device="dev", shots=2,
+        counts={"00": 1, "11": 1}, measurements=[[0, 0], [1, 1]],
+    ))
+    result = merger.result()
+
+    # Then
+    assert result.status == TaskStatus.COMPLETED
+    assert result.counts == {"00": 1, "11": 2}
+    assert result.measurements == [[0, 0], [1, 1], [1, 1]]
+    assert result.shots == 3
+    assert [c["task_id"] for c in result.metadata["chunks"]] == ["t1", "t2"]
+
+
+def test_merger_reports_failed_chunks():
+    # Given
+    chunks = plan_shot_chunks(4, {"dev": 2})
+    merger = TaskResultMerger("split-2", chunks)
+
+    # When
+    merger.add(chunks[0], TaskResult(
+        task_id="t1", status=TaskStatus.COMPLETED, device="dev", shots=2, counts={"0": 2},
+    ))
+    merger.add_failure(chunks[1], "throttled")
+    result = merger.result()
+
+    # Then
+    assert result.status == TaskStatus.FAILED
+    assert result.counts == {"0": 2}
+    assert result.shots == 2
+    assert result.metadata["chunks"][1]["error"] == "throttled"
+
+
+def _split_shot_service(monkeypatch, submitted):
+    import braket.aws
+
+    from jupyter_ai_braket.amazon_braket_mcp_server.braket_service import BraketService
+    from jupyter_ai_braket.amazon_braket_mcp_server.deduplication import SubmissionDeduplicator
+    from jupyter_ai_braket.amazon_braket_mcp_server.models import DeviceInfo, DeviceType, TaskProgress
+    from jupyter_ai_braket.amazon_braket_mcp_server.rate_limiting import RateLimiter
+
+    class FakeDevice:
+        def __init__(self, arn, aws_session=None):
+            self.arn = arn
+
+        def run(self, circuit, shots, s3_destination_folder=None):
+            submitted.append((self.arn, circuit, shots))
+            return SimpleNamespace(id=f"task-{len(submitted)}")
+
+    class FakeTask:
+        def __init__(self, task_id, aws_session=None):
+            self.task_id = task_id
+
+        def result(self):
+            return SimpleNamespace(measurement_counts={"00": 1})
+
+    monkeypatch.setattr(braket.aws, "AwsDevice", FakeDevice)
+    monkeypatch.setattr(braket.aws, "AwsQuantumTask", FakeTask)
+
+    service = BraketService.__new__(BraketService)
+    service.rate_limiter = RateLimiter()
+    service.deduplicator = SubmissionDeduplicator(60)
+    service._aws_session = object()
+    service.get_device_info = lambda arn: DeviceInfo(
+        device_arn=arn, device_name="qpu", provider_name="p", device_type=DeviceType.QPU,
+        status="ONLINE", qubits=2, paradigm="gate-based", max_shots=2,
+    )
+    service.get_task_progress = lambda task_id: TaskProgress(task_id=task_id, status=TaskStatus.COMPLETED)
+    service._circuit_fingerprint = lambda circuit: "circuit-hash"
+    service._prepare_circuit = lambda circuit, arn, transpile=None: f"{circuit} routed for {arn}"
+    return service
+
+
+def test_split_shot_task_submits_prepared_circuits_and_reuses_identical_splits(monkeypatch):
+    # Given
+    submitted = []
+    service = _split_shot_service(monkeypatch, submitted)
+
+    # When
+    first = service.run_split_shot_task("bell", "arn:qpu", shots=4)
+    second = service.run_split_shot_task("bell", "arn:qpu", shots=4)
+
+    # Then
+    assert submitted == [("arn:qpu", "bell routed for arn:qpu", 2)] * 2
+    assert first.counts == second.counts == {"00": 2}
+    assert [c["task_id"] for c in second.metadata["chunks"]] == [c["task_id"] for c in first.metadata["chunks"]]
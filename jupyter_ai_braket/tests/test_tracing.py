@@ -0,0 +1,80 @@
+"""Python unit tests for span tracing and tool statistics."""
+import json
+
+import boto3
+import pytest
+from botocore.config import Config
+from botocore.exceptions import EndpointConnectionError
+
+from jupyter_ai_braket.amazon_braket_mcp_server.tracing import Tracer, percentile
+
+
+def test_percentile_uses_nearest_rank():
+    values = list(range(1, 101))
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) == 0.0
+
+
+def test_spans_nest_and_record_errors(tmp_path):
+    # Given
+    export_path = tmp_path / "trace.jsonl"
+    tracer = Tracer(export_path=str(export_path))
+
+    # When
+    with pytest.raises(ValueError):
+        with tracer.span("tool.outer"):
+            with tracer.span("qasm.parse", cache_hit=False):
+                pass
+            raise ValueError("boom")
+
+    # Then
+    inner, outer = tracer.recent_spans()[::-1]
+    assert inner["parent_id"] == outer["span_id"]
+    assert inner["trace_id"] == outer["trace_id"]
+    assert inner["attributes"] == {"cache_hit": False}
+    assert outer["error"] == "ValueError: boom"
+    exported = [json.loads(line) for line in export_path.read_text().splitlines()]
+    assert [span["name"] for span in exported] == ["qasm.parse", "tool.outer"]
+
+
+def test_tool_stats_report_percentiles_and_payloads():
+    # Given
+    tracer = Tracer()
+
+    # When
+    for i in range(1, 101):
+        tracer.record_tool_call("get_task_result", i / 1000, payload_bytes=i * 10, error=i == 100)
+    tracer.record_tool_call("list_devices", 0.5, payload_bytes=2000)
+
+    # Then
+    stats = tracer.tool_stats()
+    assert [s.name for s in stats] == ["get_task_result", "list_devices"]
+    assert stats[0].calls == 100
+    assert stats[0].errors == 1
+    assert (stats[0].p50_ms, stats[0].p95_ms, stats[0].p99_ms) == (50, 95, 99)
+    assert stats[0].p95_payload_bytes == 950
+    assert stats[0].max_payload_bytes == 1000
+
+
+def test_instrumented_client_records_api_calls_as_child_spans():
+    # Given (nothing listens on port 1, so the call fails fast)
+    tracer = Tracer()
+    client = boto3.client(
+        "braket", region_name="us-east-1", aws_access_key_id="a", aws_secret_access_key="b",
+        endpoint_url="http://127.0.0.1:1", config=Config(retries={"max_attempts": 1}),
+    )
+    tracer.instrument_client(client)
+
+    # When
+    with tracer.span("tool.list_devices"):
+        with pytest.raises(EndpointConnectionError):
+            client.search_devices(filters=[])
+
+    # Then
+    outer, api_call = tracer.recent_spans()
+    assert api_call["name"] == "aws.braket.SearchDevices"
+    assert api_call["parent_id"] == outer["span_id"]
+    assert api_call["error"].startswith("EndpointConnectionError")
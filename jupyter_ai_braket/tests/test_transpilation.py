@@ -0,0 +1,89 @@
+"""Python unit tests for device transpilation and the transpilation cache."""
+from qiskit import QuantumCircuit
+
+from jupyter_ai_braket.amazon_braket_mcp_server.transpilation import (
+    TranspilationCache,
+    coupling_map_for_device,
+    device_qubit_labels,
+    transpile_for_device,
+)
+
+# A line of four qubits labelled from 1, with qubit 3 retired
+GRAPH = {"1": ["2"], "2": ["1", "4"], "4": ["2", "5"], "5": ["4"]}
+EDGES = {(1, 2), (2, 1), (2, 4), (4, 2), (4, 5), (5, 4)}
+
+
+def _device_document(graph=GRAPH):
+    return {
+        "deviceArn": "arn:aws:braket:eu-north-1::device/qpu/iqm/Line",
+        "deviceCapabilities": {
+            "paradigm": {"connectivity": {"fullyConnected": False, "connectivityGraph": graph}},
+            "action": {"braket.ir.openqasm.program": {"supportedOperations": ["cz", "rz", "sx", "x"]}},
+        },
+    }
+
+
+def _circuit():
+    circuit = QuantumCircuit(3, 3)
+    circuit.h(0)
+    circuit.cx(0, 2)
+    circuit.cx(1, 2)
+    circuit.cx(0, 1)
+    circuit.measure(range(3), range(3))
+    return circuit
+
+
+def _device_qubits(circuit, instruction):
+    return tuple(circuit.find_bit(qubit).index for qubit in instruction.qubits)
+
+
+def test_coupling_map_compacts_non_zero_based_labels():
+    # When
+    labels = device_qubit_labels(_device_document())
+    coupling_map = coupling_map_for_device(_device_document())
+
+    # Then
+    assert labels == [1, 2, 4, 5]
+    assert {(labels[a], labels[b]) for a, b in coupling_map.get_edges()} == EDGES
+
+
+def test_fully_connected_device_has_no_coupling_map():
+    document = _device_document()
+    document["deviceCapabilities"]["paradigm"]["connectivity"]["fullyConnected"] = True
+
+    assert device_qubit_labels(document) is None
+    assert coupling_map_for_device(document) is None
+
+
+def test_routed_circuit_uses_device_labels_and_connected_pairs():
+    # When
+    transpiled, cache_hit = transpile_for_device(_circuit(), _device_document(), TranspilationCache())
+
+    # Then
+    assert not cache_hit
+    used = set()
+    for instruction in transpiled.data:
+        qubits = _device_qubits(transpiled, instruction)
+        used.update(qubits)
+        if len(qubits) == 2:
+            assert qubits in EDGES
+    assert used <= {1, 2, 4, 5}
+    assert set(transpiled.layout.initial_index_layout(filter_ancillas=True)) <= {1, 2, 4, 5}
+    assert set(transpiled.layout.final_index_layout()) <= {1, 2, 4, 5}
+
+
+def test_disk_cache_hit_keeps_circuit_and_layout(tmp_path):
+    # Given
+    transpiled, _ = transpile_for_device(_circuit(), _device_document(), TranspilationCache(str(tmp_path)))
+
+    # When (a new process reads the entry from disk)
+    cached, cache_hit = transpile_for_device(_circuit(), _device_document(), TranspilationCache(str(tmp_path)))
+
+    # Then
+    assert cache_hit
+    assert cached.num_qubits == transpiled.num_qubits
+    assert [(i.operation.name, _device_qubits(cached, i)) for i in cached.data] == [
+        (i.operation.name, _device_qubits(transpiled, i)) for i in transpiled.data
+    ]
+    assert cached.layout.initial_index_layout() == transpiled.layout.initial_index_layout()
+    assert cached.layout.final_index_layout() == transpiled.layout.final_index_layout()
@@ -0,0 +1,52 @@
+"""Python unit tests for the visualization store."""
+import json
+
+from jupyter_ai_braket.amazon_braket_mcp_server.visualization.visualization_store import VisualizationStore
+
+
+def test_identical_images_are_stored_once(tmp_path):
+    # Given
+    store = VisualizationStore(str(tmp_path))
+
+    # When
+    first = store.save(b"png-1", "results_arn:aws:braket:us-east-1:123:quantum-task/abc", "Bell pair")
+    second = store.save(b"png-1", "results_other")
+
+    # Then
+    assert second.file == first.file
+    assert first.file.startswith("results_arn_aws_braket_us-east-1_123_quantum-task_abc_")
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted([first.file, "index.json"])
+    assert (tmp_path / first.file).read_bytes() == b"png-1"
+    assert json.loads((tmp_path / "index.json").read_text())["entries"][first.sha256]["description"] == "Bell pair"
+
+
+def test_least_recently_used_images_are_evicted_over_size_limit(tmp_path):
+    # Given
+    store = VisualizationStore(str(tmp_path), max_bytes=10)
+    old = store.save(b"aaaa", "a")
+    kept = store.save(b"bbbb", "b")
+    store.save(b"aaaa", "a")
+
+    # When
+    new = store.save(b"cccc", "c")
+
+    # Then
+    assert [entry.sha256 for entry in store.entries()] == [new.sha256, old.sha256]
+    assert not (tmp_path / kept.file).exists()
+    assert store.total_bytes == 8
+
+
+def test_expired_images_are_evicted_and_other_files_kept(tmp_path):
+    # Given
+    (tmp_path / "notes.txt").write_text("mine")
+    store = VisualizationStore(str(tmp_path), max_age_days=0)
+    expired = store.save(b"old", "old")
+
+    # When
+    fresh = store.save(b"new", "new")
+
+    # Then
+    assert not (tmp_path / expired.file).exists()
+    assert (tmp_path / fresh.file).exists()
+    assert (tmp_path / "notes.txt").read_text() == "mine"
+    assert [entry.file for entry in VisualizationStore(str(tmp_path)).entries()] == [fresh.file]